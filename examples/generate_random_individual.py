@@ -1,51 +1,82 @@
-import random, math
-
-def euclidean(p, q):
-    """グリッドセル間のユークリッド距離"""
-    return math.hypot(p[0]-q[0], p[1]-q[1])
-
-def farthest_point_sampling_on_subset(cells, K, seed=0):
-    """指定されたセル集合から Farthest Point Sampling を行う"""
-    if seed!=0:
-        random.seed(seed)
-    start = random.choice(cells)
-    chosen = [start]
-    nearest = {c: euclidean(c, start) for c in cells}
-    nearest[start] = -1.0
-
-    while len(chosen) < K:
-        candidate = max((c for c in cells if nearest[c] >= 0.0), key=lambda c: nearest[c])
-        chosen.append(candidate)
-        nearest[candidate] = -1.0
-        for c in cells:
-            if nearest[c] >= 0.0:
-                d = euclidean(c, candidate)
-                if d < nearest[c]:
-                    nearest[c] = d
-    return chosen
-
-def assign_to_groups(points, k_list, seed=0):
+import math
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# セル数・選択数がともにこれ以上なら KD-tree で近傍のみ距離を更新する
+KDTREE_MIN_CELLS = 2000
+KDTREE_MIN_PICKS = 100
+
+def _sqdist_to(coords, q):
+    """coords の各点から点 q までのユークリッド距離の二乗（大小比較には sqrt 不要）"""
+    dx = coords[:, 0] - q[0]
+    dy = coords[:, 1] - q[1]
+    return dx*dx + dy*dy
+
+def farthest_point_sampling_on_subset(cells, K, rng=None):
+    """指定されたセル集合から Farthest Point Sampling を行う（rng: np.random.Generator）"""
+    if rng is None:
+        rng = np.random.default_rng()
+    coords = np.asarray(cells, dtype=np.float64)
+    # 各セルから選択済み点集合までの最短距離の二乗（選択済みは -1）
+    idx = int(rng.integers(len(cells)))
+    nearest = _sqdist_to(coords, coords[idx])
+    nearest[idx] = -1.0
+    chosen_idx = [idx]
+
+    # 大きなセル集合では、更新が起こりうる半径（現在の最大最短距離）内のセルだけを更新する
+    use_tree = cKDTree is not None and len(cells) >= KDTREE_MIN_CELLS and K >= KDTREE_MIN_PICKS
+    tree = cKDTree(coords) if use_tree else None
+
+    while len(chosen_idx) < K:
+        idx = int(nearest.argmax())
+        radius = math.sqrt(nearest[idx])
+        chosen_idx.append(idx)
+        if tree is not None:
+            near = np.asarray(tree.query_ball_point(coords[idx], radius * (1 + 1e-9)), dtype=np.intp)
+            nearest[near] = np.minimum(nearest[near], _sqdist_to(coords[near], coords[idx]))
+        else:
+            np.minimum(nearest, _sqdist_to(coords, coords[idx]), out=nearest)
+        nearest[idx] = -1.0
+    return [cells[i] for i in chosen_idx]
+
+def assign_to_groups(points, k_list, rng=None):
     """
     与えられた点集合を、指定サイズごとのグループに分割する。
     各グループ内でも距離が最大化されるように貪欲に割り当てる。
+    rng には np.random.Generator を渡す（省略時は新規生成）。
     """
-    random.seed(seed)
+    if rng is None:
+        rng = np.random.default_rng()
     G = len(k_list)
     groups = [[] for _ in range(G)]
     remaining = k_list[:]
 
-    order = points[:]
-    random.shuffle(order)
+    order = rng.permutation(len(points))
 
-    for p in order:
-        available = [i for i in range(G) if remaining[i] > 0]
+    # dist_to_group[i, g]: 点 i からグループ g の既存点までの最短距離の二乗（空グループは inf）
+    coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    dist_to_group = np.full((len(points), G), np.inf)
+
+    # 空きのあるグループ（昇順を保ち、同距離なら番号の小さいグループを選ぶ）
+    available = [g for g in range(G) if remaining[g] > 0]
+
+    for i in order:
         if not available:
             break
-        def nearest_dist_to_group(idx):
-            return float('inf') if not groups[idx] else min(euclidean(p, q) for q in groups[idx])
-        best_group = max(available, key=nearest_dist_to_group)
-        groups[best_group].append(p)
+        best_group = available[int(dist_to_group[i, available].argmax())]
+        groups[best_group].append(points[i])
         remaining[best_group] -= 1
+        if remaining[best_group] == 0:
+            # 満杯になったグループは以降の候補から外す（距離の更新も不要）
+            available.remove(best_group)
+            continue
+        # 追加した点との距離でそのグループの列だけを更新する
+        np.minimum(dist_to_group[:, best_group], _sqdist_to(coords, coords[i]),
+                   out=dist_to_group[:, best_group])
 
     return groups
 
@@ -62,13 +93,16 @@ def sample_with_color_constraint(n, m, k1, k2, k3, k4, supply_cells, exhaust_cel
     if k_blue > len(exhaust_cells):
         raise ValueError("青マスが不足しています")
 
+    # 乱数生成器は一度だけ初期化し、各段階で共有する
+    rng = np.random.default_rng(seed)
+
     # 赤・青でそれぞれ分布を取る
-    red_points = farthest_point_sampling_on_subset(supply_cells, k_red, seed)
-    blue_points = farthest_point_sampling_on_subset(exhaust_cells, k_blue, seed+1)
+    red_points = farthest_point_sampling_on_subset(supply_cells, k_red, rng)
+    blue_points = farthest_point_sampling_on_subset(exhaust_cells, k_blue, rng)
 
     # 割り当て（赤 → vinlet_locs,acinlet_locs、青 → voutlet_locs,acoutlet_locs）
-    supply_groups = assign_to_groups(red_points, [k1, k3], seed)
-    exhaust_groups = assign_to_groups(blue_points, [k2, k4], seed+1)
+    supply_groups = assign_to_groups(red_points, [k1, k3], rng)
+    exhaust_groups = assign_to_groups(blue_points, [k2, k4], rng)
 
     vinlet_locs, acinlet_locs = supply_groups
     voutlet_locs, acoutlet_locs = exhaust_groups
@@ -0,0 +1,88 @@
+"""
+Distance kernels for repair and refinement.
+
+Uses numba-compiled loops when numba is installed, otherwise falls back
+to equivalent NumPy broadcasting. Coordinates are expected in normalized
+[0,1] space (see GridRegion.normalize_cell) and the Y difference is
+weighted by anisotropy_y, matching EngineInterface._anisotropic_distance.
+"""
+
+from typing import Tuple
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _min_pair_numpy(xs: np.ndarray, ys: np.ndarray, anisotropy_y: float) -> Tuple[int, int, float]:
+    """Closest pair via a full pairwise distance matrix."""
+    n = len(xs)
+    if n < 2:
+        return -1, -1, math.inf
+
+    dx = xs[:, None] - xs[None, :]
+    dy = (ys[:, None] - ys[None, :]) * anisotropy_y
+    dist = np.sqrt(dx * dx + dy * dy)
+
+    # Only consider each pair once (i < j)
+    dist[np.tril_indices(n)] = np.inf
+
+    i, j = divmod(int(dist.argmin()), n)
+    return i, j, float(dist[i, j])
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _min_pair_numba(xs, ys, anisotropy_y):
+        n = xs.shape[0]
+        best_i = -1
+        best_j = -1
+        best = math.inf
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = xs[i] - xs[j]
+                dy = (ys[i] - ys[j]) * anisotropy_y
+                dist = math.sqrt(dx * dx + dy * dy)
+                if dist < best:
+                    best = dist
+                    best_i = i
+                    best_j = j
+        return best_i, best_j, best
+
+
+def min_pair(xs: np.ndarray, ys: np.ndarray, anisotropy_y: float) -> Tuple[int, int, float]:
+    """
+    Find the closest pair of points under the anisotropic metric.
+
+    Args:
+        xs: Normalized x coordinates (float64, contiguous)
+        ys: Normalized y coordinates (float64, contiguous)
+        anisotropy_y: Y-axis weighting factor
+
+    Returns:
+        Tuple of (i, j, distance) with i < j; (-1, -1, inf) if fewer than
+        two points are given. Ties resolve to the first pair in (i, j) order.
+    """
+    if NUMBA_AVAILABLE:
+        i, j, dist = _min_pair_numba(xs, ys, float(anisotropy_y))
+        return int(i), int(j), float(dist)
+    return _min_pair_numpy(xs, ys, anisotropy_y)
+
+
+def all_min_distance(xs: np.ndarray, ys: np.ndarray, anisotropy_y: float) -> float:
+    """
+    Minimum pairwise anisotropic distance among the given points.
+
+    Args:
+        xs: Normalized x coordinates (float64, contiguous)
+        ys: Normalized y coordinates (float64, contiguous)
+        anisotropy_y: Y-axis weighting factor
+
+    Returns:
+        Minimum distance, or inf if fewer than two points are given
+    """
+    return min_pair(xs, ys, anisotropy_y)[2]
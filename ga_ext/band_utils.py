@@ -5,9 +5,10 @@ Non-invasive functions that extract band information from existing placement sys
 and partition individuals by band for GA operations.
 """
 
-from typing import Dict, Set, Tuple, List
+from typing import Dict, Set, Tuple, List, Optional
 from pathlib import Path
 import sys
+import numpy as np
 
 # Import from existing system (non-invasive)
 from src.stratified_placement import GridRegion, GridCell, Entity, Stratification, EntityType
@@ -16,7 +17,8 @@ from src.stratified_placement import GridRegion, GridCell, Entity, Stratificatio
 def partition_by_band(
     individual_placements: Dict[str, List[Tuple[int, int]]],
     grid_config: Dict,
-    band_config: Dict
+    band_config: Dict,
+    band_of_cell: Optional[np.ndarray] = None
 ) -> Dict[Tuple[str, int], List[Tuple[int, int]]]:
     """
     Partition an individual's placements by (entity_type, band_id).
@@ -27,6 +29,7 @@ def partition_by_band(
         individual_placements: Dict mapping entity_type to list of (x, y) positions
         grid_config: Grid configuration (width, height)
         band_config: Band configuration (num_bands)
+        band_of_cell: Optional precomputed band array (see build_band_array)
 
     Returns:
         Dict mapping (entity_type, band_id) to list of positions in that band
@@ -36,6 +39,28 @@ def partition_by_band(
         >>> partition = partition_by_band(placements, {'width': 20, 'height': 10}, {'num_bands': 2})
         >>> # Returns: {('vinlet', 0): [(5, 2)], ('vinlet', 1): [(10, 8)], ('acinlet', 1): [(3, 5)]}
     """
+    result = {}
+
+    if band_of_cell is not None:
+        # Fast path: look up all bands at once, then group indices by band
+        # (stable sort keeps placement order within each band)
+        for entity_type, positions in individual_placements.items():
+            bands = lookup_bands(band_of_cell, positions)
+            valid = np.flatnonzero(bands >= 0)
+            if len(valid) == 0:
+                continue
+
+            order = valid[np.argsort(bands[valid], kind='stable')]
+            groups = np.split(order, np.flatnonzero(np.diff(bands[order])) + 1)
+
+            # Insert keys in order of first appearance, as the loop below does
+            groups.sort(key=lambda group: group[0])
+            for group in groups:
+                result[(entity_type, int(bands[group[0]]))] = [
+                    tuple(positions[i]) for i in group
+                ]
+        return result
+
     # Create grid region and stratification
     grid_region = GridRegion(width=grid_config['width'], height=grid_config['height'])
     stratification = Stratification.create_horizontal_bands(
@@ -44,8 +69,6 @@ def partition_by_band(
     )
 
     # Partition placements by band
-    result = {}
-
     for entity_type, positions in individual_placements.items():
         for x, y in positions:
             cell = GridCell(x, y)
@@ -94,6 +117,81 @@ def get_band_for_position(
     raise ValueError(f"Position {position} not in any band")
 
 
+def build_band_array(
+    grid_config: Dict,
+    band_config: Dict
+) -> np.ndarray:
+    """
+    Precompute the band index of every grid cell.
+
+    Replaces repeated calls to get_band_for_position() with a single array
+    lookup: band_of_cell[y, x] gives the band index of cell (x, y).
+
+    Args:
+        grid_config: Grid configuration (width, height)
+        band_config: Band configuration (num_bands)
+
+    Returns:
+        int16 array of shape (height + 1, width + 1), indexed with 1-based grid
+        coordinates. Row 0 and rows not covered by any band hold -1.
+    """
+    grid_region = GridRegion(width=grid_config['width'], height=grid_config['height'])
+    stratification = Stratification.create_horizontal_bands(
+        grid_region,
+        num_bands=band_config.get('num_bands', 3)
+    )
+
+    band_of_cell = np.full(
+        (grid_region.height + 1, grid_region.width + 1), -1, dtype=np.int16
+    )
+
+    # Fill in reverse so the first matching band wins, as in get_band_for_position
+    for band in reversed(stratification.bands):
+        band_of_cell[band.y_min:band.y_max + 1, :] = band.index
+
+    return band_of_cell
+
+
+def lookup_band(band_of_cell: np.ndarray, position: Tuple[int, int]) -> int:
+    """
+    Look up the band of a position in a precomputed band array.
+
+    Args:
+        band_of_cell: Array from build_band_array()
+        position: (x, y) position
+
+    Returns:
+        Band index, or -1 if the position is not in any band
+    """
+    # Bands are horizontal: membership depends on the row only, as in
+    # get_band_for_position, so x is never range-checked
+    y = position[1]
+    if 0 <= y < band_of_cell.shape[0]:
+        return int(band_of_cell[y, 1])
+    return -1
+
+
+def lookup_bands(band_of_cell: np.ndarray, positions: List[Tuple[int, int]]) -> np.ndarray:
+    """
+    Vectorized lookup_band() for a list of positions.
+
+    Args:
+        band_of_cell: Array from build_band_array()
+        positions: List of (x, y) positions
+
+    Returns:
+        int array of band indices (-1 where a position is not in any band)
+    """
+    ys = np.asarray(positions, dtype=np.intp).reshape(-1, 2)[:, 1]
+
+    # Row-only lookup, as in lookup_band
+    inside = (ys >= 0) & (ys < band_of_cell.shape[0])
+
+    bands = np.full(len(ys), -1, dtype=np.intp)
+    bands[inside] = band_of_cell[ys[inside], 1]
+    return bands
+
+
 def get_band_quotas(
     entity_configs: List[Dict],
     grid_config: Dict,
@@ -257,7 +355,8 @@ def validate_band_preservation(
 def count_entities_per_band(
     individual_placements: Dict[str, List[Tuple[int, int]]],
     grid_config: Dict,
-    band_config: Dict
+    band_config: Dict,
+    band_of_cell: Optional[np.ndarray] = None
 ) -> Dict[Tuple[str, int], int]:
     """
     Count how many entities of each type are in each band.
@@ -266,10 +365,27 @@ def count_entities_per_band(
         individual_placements: Placements to count
         grid_config: Grid configuration
         band_config: Band configuration
+        band_of_cell: Optional precomputed band array (see build_band_array)
 
     Returns:
         Dict mapping (entity_type, band_id) to count
     """
+    if band_of_cell is not None:
+        counts = {}
+        for entity_type, positions in individual_placements.items():
+            bands = lookup_bands(band_of_cell, positions)
+            bands = bands[bands >= 0]
+            if len(bands) == 0:
+                continue
+
+            # Keys in order of first appearance, matching partition_by_band
+            band_ids, first_idx, band_counts = np.unique(
+                bands, return_index=True, return_counts=True
+            )
+            for k in np.argsort(first_idx):
+                counts[(entity_type, int(band_ids[k]))] = int(band_counts[k])
+        return counts
+
     partition = partition_by_band(individual_placements, grid_config, band_config)
 
     return {key: len(positions) for key, positions in partition.items()}
@@ -305,7 +421,8 @@ def get_free_cells_in_band(
     occupied_positions: Set[Tuple[int, int]],
     allowed_region: Set[GridCell],
     grid_config: Dict,
-    band_config: Dict
+    band_config: Dict,
+    band_of_cell: Optional[np.ndarray] = None
 ) -> Set[Tuple[int, int]]:
     """
     Get all free (unoccupied) cells in a specific band within allowed region.
@@ -316,10 +433,21 @@ def get_free_cells_in_band(
         allowed_region: Set of allowed GridCell objects
         grid_config: Grid configuration
         band_config: Band configuration
+        band_of_cell: Optional precomputed array from build_band_array()
 
     Returns:
         Set of free (x, y) positions in the band
     """
+    if band_of_cell is not None:
+        if band_index < 0:
+            return set()
+        return {
+            (cell.x, cell.y)
+            for cell in allowed_region
+            if lookup_band(band_of_cell, (cell.x, cell.y)) == band_index
+            and (cell.x, cell.y) not in occupied_positions
+        }
+
     grid_region = GridRegion(width=grid_config['width'], height=grid_config['height'])
     stratification = Stratification.create_horizontal_bands(
         grid_region,
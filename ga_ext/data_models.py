@@ -50,6 +50,30 @@ class Individual:
             external_score=self.external_score
         )
 
+    def with_placements(
+        self,
+        placements: dict[str, list[tuple[int, int]]]
+    ) -> "Individual":
+        """
+        Create a copy of this individual with new placements.
+
+        Unlike copy(), the existing placement lists are not duplicated; the
+        given placements are used as-is (callers pass freshly built lists).
+
+        Args:
+            placements: Placements for the new individual
+
+        Returns:
+            New Individual with the given placements and copied metadata
+        """
+        return Individual(
+            id=self.id,
+            path=self.path,
+            placements=placements,
+            metadata=self.metadata.copy(),
+            external_score=self.external_score
+        )
+
     def get_all_positions(self) -> set[tuple[int, int]]:
         """
         Get all occupied positions across all entity types.
@@ -8,6 +8,7 @@ Provides utility methods for repair and refinement without modifying existing co
 from typing import Dict, List, Set, Tuple, Optional, Any
 from pathlib import Path
 import math
+import numpy as np
 
 # Non-invasive imports from existing system
 from src.stratified_placement import (
@@ -15,6 +16,9 @@ from src.stratified_placement import (
 )
 from src.config_loader import load_config, create_entities_from_config, parse_allowed_region
 
+from .band_utils import build_band_array
+from ._fast import all_min_distance
+
 
 class EngineInterface:
     """
@@ -63,6 +67,33 @@ class EngineInterface:
         # Get anisotropy parameter
         self.anisotropy_y = stratification_config.get('anisotropy_y', 1.0)
 
+        # Snapshot derived configs once; accessors are called on every repair
+        self._grid_config = {
+            'width': self.grid_region.width,
+            'height': self.grid_region.height
+        }
+        self._band_config = {
+            'num_bands': len(self.stratification.bands)
+        }
+        self._entity_configs = [
+            {
+                'type': entity.entity_type.value,
+                'count': entity.count,
+                'allowed_region': 'full',  # Simplified - actual regions are in entity.allowed_region
+                'intra_radius': entity.intra_radius
+            }
+            for entity in self.entities
+        ]
+
+        # Precompute band index per cell for fast lookups in mutation operators
+        self.band_of_cell = build_band_array(self.get_grid_config(), self.get_band_config())
+
+        # Bands are horizontal, so any column of band_of_cell maps row (y) -> band
+        self._row_to_band = self.band_of_cell[:, 1]
+
+        # Lazily built (entity_type, band_id) -> candidate cells for relocation
+        self._band_cells_cache: Dict[Tuple[str, int], Tuple[List[Tuple[int, int]], np.ndarray]] = {}
+
     def check_conflicts(self, placements: Dict[str, List[Tuple[int, int]]]) -> List[Tuple[int, int]]:
         """
         Detect position conflicts (multiple entities at same cell).
@@ -136,15 +167,9 @@ class EngineInterface:
                 min_distances[entity_type] = float('inf')
                 continue
 
-            min_dist = float('inf')
-
             # Check all pairs
-            for i, pos1 in enumerate(positions):
-                for pos2 in positions[i+1:]:
-                    dist = self._anisotropic_distance(pos1, pos2, anisotropy_y)
-                    min_dist = min(min_dist, dist)
-
-            min_distances[entity_type] = min_dist
+            xs, ys = self.normalized_coordinates(positions)
+            min_distances[entity_type] = all_min_distance(xs, ys, anisotropy_y)
 
         return min_distances
 
@@ -205,55 +230,97 @@ class EngineInterface:
         if entity_type not in self.entity_map:
             return None
 
-        entity = self.entity_map[entity_type]
-
         # Get band
         if band_id >= len(self.stratification.bands):
             return None
 
-        band = self.stratification.bands[band_id]
-
         # Get cells in band within allowed region
-        band_cells = band.get_cells_in_region(entity.allowed_region)
+        band_cells, band_xy = self._get_band_cells(entity_type, band_id)
+        if not band_cells:
+            return None
 
         # Filter out occupied cells
-        all_occupied = occupied_positions.copy()
+        blocked = self._occupancy_grid(occupied_positions)
         if avoid_positions:
-            all_occupied.update(avoid_positions)
+            self._mark_occupied(blocked, avoid_positions)
 
-        free_cells = [
-            (cell.x, cell.y)
-            for cell in band_cells
-            if (cell.x, cell.y) not in all_occupied
-        ]
+        free_idx = np.flatnonzero(~blocked[band_xy[:, 1], band_xy[:, 0]])
 
-        if not free_cells:
+        if len(free_idx) == 0:
             return None
 
         # If only one free cell, return it
-        if len(free_cells) == 1:
-            return free_cells[0]
+        if len(free_idx) == 1:
+            return band_cells[free_idx[0]]
 
         # Find cell farthest from all occupied positions
-        best_cell = None
-        best_min_dist = -1
-
-        for candidate in free_cells:
-            # Calculate minimum distance to any occupied cell
-            min_dist = float('inf')
-            for occ_pos in occupied_positions:
-                if occ_pos == current_pos:
-                    # Don't consider the position we're replacing
-                    continue
-                dist = self._anisotropic_distance(candidate, occ_pos, self.anisotropy_y)
-                min_dist = min(min_dist, dist)
-
-            # Track best candidate (maximize minimum distance)
-            if min_dist > best_min_dist:
-                best_min_dist = min_dist
-                best_cell = candidate
-
-        return best_cell
+        # (don't consider the position we're replacing)
+        cand_x, cand_y = self.normalized_coordinates(band_xy[free_idx])
+        min_dist = np.full(len(free_idx), np.inf)
+
+        for occ_pos in occupied_positions:
+            if occ_pos == current_pos:
+                continue
+            occ_x = (occ_pos[0] - 0.5) / self.grid_region.width
+            occ_y = (occ_pos[1] - 0.5) / self.grid_region.height
+            dx = cand_x - occ_x
+            dy = (cand_y - occ_y) * self.anisotropy_y
+            np.minimum(min_dist, np.sqrt(dx * dx + dy * dy), out=min_dist)
+
+        # Maximize minimum distance (first candidate wins ties)
+        return band_cells[free_idx[int(min_dist.argmax())]]
+
+    def _get_band_cells(
+        self,
+        entity_type: str,
+        band_id: int
+    ) -> Tuple[List[Tuple[int, int]], np.ndarray]:
+        """
+        Get cached cells of a band that lie in an entity's allowed region.
+
+        Args:
+            entity_type: Type of entity
+            band_id: Band index
+
+        Returns:
+            Tuple of (list of (x, y) cells, (N, 2) int array of the same cells)
+        """
+        key = (entity_type, band_id)
+        cached = self._band_cells_cache.get(key)
+        if cached is None:
+            band = self.stratification.bands[band_id]
+            entity = self.entity_map[entity_type]
+            cells = [
+                (cell.x, cell.y)
+                for cell in band.get_cells_in_region(entity.allowed_region)
+            ]
+            cell_xy = np.array(cells, dtype=np.intp).reshape(-1, 2)
+            cached = (cells, cell_xy)
+            self._band_cells_cache[key] = cached
+        return cached
+
+    def _occupancy_grid(self, positions: Set[Tuple[int, int]]) -> np.ndarray:
+        """
+        Build a boolean occupancy grid indexed as grid[y, x].
+
+        Args:
+            positions: Occupied (x, y) positions
+
+        Returns:
+            Boolean array of shape (height + 1, width + 1)
+        """
+        grid = np.zeros(
+            (self.grid_region.height + 1, self.grid_region.width + 1), dtype=bool
+        )
+        self._mark_occupied(grid, positions)
+        return grid
+
+    def _mark_occupied(self, grid: np.ndarray, positions: Set[Tuple[int, int]]) -> None:
+        """Mark in-grid positions as occupied in an occupancy grid."""
+        height, width = grid.shape
+        for x, y in positions:
+            if 0 <= x < width and 0 <= y < height:
+                grid[y, x] = True
 
     def get_free_cells_in_band(
         self,
@@ -293,6 +360,26 @@ class EngineInterface:
 
         return free_cells
 
+    def normalized_coordinates(
+        self,
+        positions: List[Tuple[int, int]]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert positions to normalized coordinate arrays.
+
+        Uses the same normalization as GridRegion.normalize_cell.
+
+        Args:
+            positions: List of (x, y) positions
+
+        Returns:
+            Tuple of (xs, ys) float64 arrays in [0,1] space
+        """
+        coords = np.asarray(positions, dtype=np.float64).reshape(-1, 2)
+        xs = (coords[:, 0] - 0.5) / self.grid_region.width
+        ys = (coords[:, 1] - 0.5) / self.grid_region.height
+        return xs, ys
+
     def _anisotropic_distance(
         self,
         pos1: Tuple[int, int],
@@ -335,43 +422,45 @@ class EngineInterface:
 
         Returns:
             Band index
+
+        Raises:
+            ValueError: If the position is not in any band
+        """
+        band_id = self.get_band_id_for_position_fast(pos)
+        if band_id < 0:
+            raise ValueError(f"Position {pos} not in any band")
+        return band_id
+
+    def get_band_id_for_position_fast(self, pos: Tuple[int, int]) -> int:
         """
-        cell = GridCell(pos[0], pos[1])
+        Look up the band of a position via the precomputed row table.
 
-        for band in self.stratification.bands:
-            if band.contains_cell(cell):
-                return band.index
+        Args:
+            pos: Position (x, y)
 
-        raise ValueError(f"Position {pos} not in any band")
+        Returns:
+            Band index, or -1 if the position is not in any band
+        """
+        y = pos[1]
+        if 0 <= y < len(self._row_to_band):
+            return int(self._row_to_band[y])
+        return -1
 
     def get_grid_config(self) -> Dict[str, int]:
-        """Get grid configuration."""
-        return {
-            'width': self.grid_region.width,
-            'height': self.grid_region.height
-        }
+        """Get grid configuration (computed once at load; treat as read-only)."""
+        return self._grid_config
 
     def get_band_config(self) -> Dict[str, int]:
-        """Get band configuration."""
-        return {
-            'num_bands': len(self.stratification.bands)
-        }
+        """Get band configuration (computed once at load; treat as read-only)."""
+        return self._band_config
 
     def get_entity_configs(self) -> List[Dict[str, Any]]:
         """
         Get entity configurations for quota calculation.
 
+        Computed once at load; callers should treat the result as read-only.
+
         Returns:
             List of entity config dictionaries
         """
-        configs = []
-
-        for entity in self.entities:
-            configs.append({
-                'type': entity.entity_type.value,
-                'count': entity.count,
-                'allowed_region': 'full',  # Simplified - actual regions are in entity.allowed_region
-                'intra_radius': entity.intra_radius
-            })
-
-        return configs
+        return self._entity_configs
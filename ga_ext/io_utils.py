@@ -235,6 +235,74 @@ def load_parents_from_directory(
     )
 
 
+LINEAGE_LOG_FIELDNAMES = ['child_path', 'parent_ids', 'mode', 'crossover_mask',
+                          'mutation_ops', 'repair_notes', 'seed', 'timestamp']
+
+
+class LineageLogWriter:
+    """
+    Streaming writer for lineage log CSV files.
+
+    Opens the log once and appends each LineageRecord as it is generated,
+    so runs do not buffer every record in memory and a failure mid-run
+    still leaves the records written so far on disk.
+
+    Example:
+        >>> with LineageLogWriter(output_root / 'lineage_log.csv') as log_writer:
+        ...     log_writer.write(record)
+    """
+
+    def __init__(self, output_path: Union[str, Path], overwrite: bool = False):
+        """
+        Args:
+            output_path: Path for output CSV
+            overwrite: If True, overwrite existing file
+        """
+        self.output_path = Path(output_path)
+        self.overwrite = overwrite
+        self.records_written = 0
+        self._file = None
+        self._writer = None
+
+    def open(self) -> "LineageLogWriter":
+        """
+        Create the log file and write the header.
+
+        Raises:
+            FileExistsError: If file exists and overwrite=False
+        """
+        if self.output_path.exists() and not self.overwrite:
+            raise FileExistsError(f"Lineage log already exists: {self.output_path}")
+
+        # Create parent directory if needed
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file = open(self.output_path, 'w', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=LINEAGE_LOG_FIELDNAMES)
+        self._writer.writeheader()
+
+        return self
+
+    def write(self, record: LineageRecord) -> None:
+        """Append a single lineage record to the log and flush it to disk."""
+        self._writer.writerow(record.to_dict())
+        self._file.flush()
+        self.records_written += 1
+
+    def close(self) -> None:
+        """Flush and close the log file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+    def __enter__(self) -> "LineageLogWriter":
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
 def save_lineage_log(
     lineage_records: list[LineageRecord],
     output_path: Union[str, Path],
@@ -254,25 +322,11 @@ def save_lineage_log(
     Raises:
         FileExistsError: If file exists and overwrite=False
     """
-    output_path = Path(output_path)
-
-    if output_path.exists() and not overwrite:
-        raise FileExistsError(f"Lineage log already exists: {output_path}")
-
-    # Create parent directory if needed
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    # Write CSV
-    with open(output_path, 'w', newline='') as f:
-        fieldnames = ['child_path', 'parent_ids', 'mode', 'crossover_mask',
-                      'mutation_ops', 'repair_notes', 'seed', 'timestamp']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-
+    with LineageLogWriter(output_path, overwrite=overwrite) as log_writer:
         for record in lineage_records:
-            writer.writerow(record.to_dict())
+            log_writer.write(record)
 
-    return output_path
+    return log_writer.output_path
 
 
 def create_generation_folder(
@@ -12,7 +12,8 @@ import math
 from .data_models import Individual
 from .band_utils import (
     partition_by_band,
-    get_band_for_position,
+    build_band_array,
+    lookup_band,
     get_free_cells_in_band
 )
 from src.stratified_placement import GridCell, NormalizedPoint, GridRegion
@@ -24,7 +25,8 @@ def within_band_swap(
     grid_config: Dict,
     band_config: Dict,
     config: Dict,
-    rng: np.random.Generator
+    rng: np.random.Generator,
+    partition: Optional[Dict[Tuple[str, int], List[Tuple[int, int]]]] = None
 ) -> Tuple[Individual, List[str]]:
     """
     Swap positions of two entities of same type within same band.
@@ -38,6 +40,8 @@ def within_band_swap(
         band_config: Band configuration
         config: GA configuration
         rng: Random number generator
+        partition: Optional precomputed partition_by_band() result for
+            individual's current placements
 
     Returns:
         Tuple of (mutated_individual, operation_log)
@@ -46,7 +50,8 @@ def within_band_swap(
         return individual, [f"within_band_swap: {entity_type} not found"]
 
     # Partition by band
-    partition = partition_by_band(individual.placements, grid_config, band_config)
+    if partition is None:
+        partition = partition_by_band(individual.placements, grid_config, band_config)
 
     # Find bands with this entity
     entity_bands = [key for key in partition.keys() if key[0] == entity_type]
@@ -99,7 +104,8 @@ def band_local_jitter(
     band_config: Dict,
     config: Dict,
     rng: np.random.Generator,
-    max_attempts: int = 10
+    max_attempts: int = 10,
+    band_of_cell: Optional[np.ndarray] = None
 ) -> Tuple[Individual, List[str]]:
     """
     Move one entity to a nearby free cell in same band.
@@ -114,6 +120,7 @@ def band_local_jitter(
         config: GA configuration
         rng: Random number generator
         max_attempts: Max attempts to find better position
+        band_of_cell: Optional precomputed band array (see build_band_array)
 
     Returns:
         Tuple of (mutated_individual, operation_log)
@@ -129,10 +136,12 @@ def band_local_jitter(
     idx = rng.integers(0, len(positions))
     current_pos = positions[idx]
 
+    if band_of_cell is None:
+        band_of_cell = build_band_array(grid_config, band_config)
+
     # Get band for this position
-    try:
-        band_id = get_band_for_position(current_pos, grid_config, band_config)
-    except ValueError:
+    band_id = lookup_band(band_of_cell, current_pos)
+    if band_id < 0:
         return individual, [f"band_local_jitter: position {current_pos} not in any band"]
 
     # Get occupied positions (excluding current)
@@ -149,7 +158,8 @@ def band_local_jitter(
         occupied,
         all_cells,
         grid_config,
-        band_config
+        band_config,
+        band_of_cell=band_of_cell
     )
 
     if not free_cells:
@@ -197,7 +207,8 @@ def micro_reseed(
     grid_config: Dict,
     band_config: Dict,
     config: Dict,
-    rng: np.random.Generator
+    rng: np.random.Generator,
+    band_of_cell: Optional[np.ndarray] = None
 ) -> Tuple[Individual, List[str]]:
     """
     Re-place a small fraction of entities within their bands.
@@ -213,6 +224,7 @@ def micro_reseed(
         band_config: Band configuration
         config: GA configuration
         rng: Random number generator
+        band_of_cell: Optional precomputed band array (see build_band_array)
 
     Returns:
         Tuple of (mutated_individual, operation_log)
@@ -230,9 +242,6 @@ def micro_reseed(
     # Select random positions to reseed
     indices_to_reseed = rng.choice(len(positions), size=num_to_reseed, replace=False)
 
-    # Group by band
-    partition = partition_by_band(individual.placements, grid_config, band_config)
-
     # Get occupied positions (excluding ones we're reseeding)
     occupied = individual.get_all_positions()
     for idx in indices_to_reseed:
@@ -246,13 +255,15 @@ def micro_reseed(
     grid_region = GridRegion(width=grid_config['width'], height=grid_config['height'])
     all_cells = grid_region.all_cells()
 
+    if band_of_cell is None:
+        band_of_cell = build_band_array(grid_config, band_config)
+
     for idx in indices_to_reseed:
         old_pos = positions[idx]
 
         # Get band for this position
-        try:
-            band_id = get_band_for_position(old_pos, grid_config, band_config)
-        except ValueError:
+        band_id = lookup_band(band_of_cell, old_pos)
+        if band_id < 0:
             continue
 
         # Get free cells in same band
@@ -261,7 +272,8 @@ def micro_reseed(
             occupied,
             all_cells,
             grid_config,
-            band_config
+            band_config,
+            band_of_cell=band_of_cell
         )
 
         if not free_cells:
@@ -271,11 +283,8 @@ def micro_reseed(
         # Select random free cell
         new_pos = list(free_cells)[rng.integers(0, len(free_cells))]
 
-        # Update placements
-        for i, pos in enumerate(mutated_placements[entity_type]):
-            if pos == old_pos:
-                mutated_placements[entity_type][i] = new_pos
-                break
+        # Update placements (idx indexes the same list that was copied above)
+        mutated_placements[entity_type][idx] = new_pos
 
         # Mark new position as occupied
         occupied.add(new_pos)
@@ -288,12 +297,67 @@ def micro_reseed(
     return mutated, op_log
 
 
+def prepare_mutation_settings(config: Dict) -> Dict:
+    """
+    Precompute mutation settings that do not change between calls.
+
+    Normalizes operator probabilities into a cumulative distribution so that
+    mutate() can pick an operator with a single searchsorted.
+
+    Args:
+        config: GA configuration with mutation settings
+
+    Returns:
+        Dict with '_op_names', '_op_probs_cdf', '_max_ops' and
+        '_micro_reseed_fraction' entries
+    """
+    mutation_config = config.get('mutation', {})
+    operator_probs = mutation_config.get('operators', {
+        'within_band_swap': 0.4,
+        'band_local_jitter': 0.4,
+        'micro_reseed': 0.2
+    })
+
+    probs = np.array(list(operator_probs.values()), dtype=float)
+    total_prob = probs.sum()
+    if total_prob > 0:
+        probs = probs / total_prob
+
+    return {
+        '_op_names': list(operator_probs.keys()),
+        '_op_probs_cdf': np.cumsum(probs),
+        '_max_ops': mutation_config.get('max_ops_per_individual', 3),
+        '_micro_reseed_fraction': mutation_config.get('micro_reseed_fraction', 0.1),
+    }
+
+
+def _refresh_partition(
+    partition: Dict[Tuple[str, int], List[Tuple[int, int]]],
+    placements: Dict[str, List[Tuple[int, int]]],
+    entity_type: str,
+    grid_config: Dict,
+    band_config: Dict,
+    band_of_cell: np.ndarray
+) -> None:
+    """Re-partition a single entity type in place after it was mutated."""
+    for key in [key for key in partition if key[0] == entity_type]:
+        del partition[key]
+
+    partition.update(partition_by_band(
+        {entity_type: placements.get(entity_type, [])},
+        grid_config,
+        band_config,
+        band_of_cell=band_of_cell
+    ))
+
+
 def mutate(
     individual: Individual,
     config: Dict,
     grid_config: Dict,
     band_config: Dict,
-    rng: np.random.Generator
+    rng: np.random.Generator,
+    band_of_cell: Optional[np.ndarray] = None
 ) -> Tuple[Individual, List[str]]:
     """
     Apply mutation operators according to configuration.
@@ -310,6 +374,7 @@ def mutate(
         grid_config: Grid configuration
         band_config: Band configuration
         rng: Random number generator
+        band_of_cell: Optional precomputed band array (built once if omitted)
 
     Returns:
         Tuple of (mutated_individual, operation_log)
@@ -320,61 +385,64 @@ def mutate(
     if rng.random() > mutation_rate:
         return individual, ["no_mutation: skipped (probability)"]
 
-    # Get mutation configuration
+    # Get mutation configuration (precomputed at config load when available)
     mutation_config = config.get('mutation', {})
-    operator_probs = mutation_config.get('operators', {
-        'within_band_swap': 0.4,
-        'band_local_jitter': 0.4,
-        'micro_reseed': 0.2
-    })
-    max_ops = mutation_config.get('max_ops_per_individual', 3)
-    micro_reseed_fraction = mutation_config.get('micro_reseed_fraction', 0.1)
+    if '_op_probs_cdf' not in mutation_config:
+        mutation_config = prepare_mutation_settings(config)
 
-    # Normalize operator probabilities
-    total_prob = sum(operator_probs.values())
-    if total_prob > 0:
-        operator_probs = {k: v/total_prob for k, v in operator_probs.items()}
+    op_names = mutation_config['_op_names']
+    op_probs_cdf = mutation_config['_op_probs_cdf']
+    max_ops = mutation_config['_max_ops']
+    micro_reseed_fraction = mutation_config['_micro_reseed_fraction']
 
     # Get available entity types
     entity_types = list(individual.placements.keys())
     if not entity_types:
         return individual, ["no_mutation: no entities"]
 
+    # Precompute band lookup once for all operators
+    if band_of_cell is None:
+        band_of_cell = build_band_array(grid_config, band_config)
+
     # Apply mutations
     mutated = individual.copy()
     all_logs = []
 
+    # Partition once; refreshed per entity type only when an operator moves it
+    partition = partition_by_band(mutated.placements, grid_config, band_config,
+                                  band_of_cell=band_of_cell)
+
     num_ops = rng.integers(1, max_ops + 1)
 
     for _ in range(num_ops):
         # Select operator
-        op_choice = rng.random()
-        cumulative = 0
-        selected_op = None
-
-        for op_name, prob in operator_probs.items():
-            cumulative += prob
-            if op_choice <= cumulative:
-                selected_op = op_name
-                break
-
-        if selected_op is None:
-            selected_op = list(operator_probs.keys())[0]
+        op_idx = int(np.searchsorted(op_probs_cdf, rng.random()))
+        if op_idx >= len(op_names):
+            op_idx = 0
+        selected_op = op_names[op_idx]
 
         # Select random entity type
         entity_type = entity_types[rng.integers(0, len(entity_types))]
 
         # Apply operator
+        previous = mutated
         if selected_op == 'within_band_swap':
-            mutated, log = within_band_swap(mutated, entity_type, grid_config, band_config, config, rng)
+            mutated, log = within_band_swap(mutated, entity_type, grid_config, band_config, config, rng,
+                                            partition=partition)
         elif selected_op == 'band_local_jitter':
-            mutated, log = band_local_jitter(mutated, entity_type, grid_config, band_config, config, rng)
+            mutated, log = band_local_jitter(mutated, entity_type, grid_config, band_config, config, rng,
+                                             band_of_cell=band_of_cell)
         elif selected_op == 'micro_reseed':
             mutated, log = micro_reseed(mutated, entity_type, micro_reseed_fraction,
-                                       grid_config, band_config, config, rng)
+                                       grid_config, band_config, config, rng,
+                                       band_of_cell=band_of_cell)
         else:
             log = [f"unknown_operator: {selected_op}"]
 
+        if mutated is not previous:
+            _refresh_partition(partition, mutated.placements, entity_type, grid_config,
+                               band_config, band_of_cell)
+
         all_logs.extend(log)
 
     return mutated, all_logs
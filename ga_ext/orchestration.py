@@ -15,13 +15,31 @@ from .io_utils import (
     save_individual_to_csv,
     load_parent_manifest,
     load_parents_from_directory,
-    save_lineage_log
+    LineageLogWriter
 )
 from .engine_interface import EngineInterface
-from .mutation import mutate
+from .mutation import mutate, prepare_mutation_settings
 from .crossover import apply_crossover
 from .repair import repair_and_refine
-from .visualization_utils import visualize_individual
+from .visualization_utils import visualize_individual, flush_viz
+
+
+def _prepare_ga_config(ga_config: Dict) -> Dict:
+    """
+    Precompute derived GA settings once after loading the YAML.
+
+    Stores normalized mutation settings in ga_config['mutation'] (keys
+    prefixed with '_') so mutate() does not recompute them per individual.
+
+    Args:
+        ga_config: GA configuration dict (modified in place)
+
+    Returns:
+        The same ga_config dict
+    """
+    mutation_config = ga_config.setdefault('mutation', {})
+    mutation_config.update(prepare_mutation_settings(ga_config))
+    return ga_config
 
 
 def run_variant_mode(run_config: Dict) -> None:
@@ -45,9 +63,8 @@ def run_variant_mode(run_config: Dict) -> None:
            b. Apply mutation (no crossover)
            c. Repair & refine
            d. Save to output_root/variant_{i:03d}.csv
-           e. Create LineageRecord
-        6. Save lineage log to output_root/lineage_log.csv
-        7. Print summary report
+           e. Append LineageRecord to output_root/lineage_log.csv
+        6. Print summary report
 
     Returns:
         None (writes to disk)
@@ -60,7 +77,7 @@ def run_variant_mode(run_config: Dict) -> None:
     ga_config_path = run_config.get('ga_config', 'ga_ext/ga_ext_config.yaml')
     print(f"Loading GA config from: {ga_config_path}")
     with open(ga_config_path, 'r') as f:
-        ga_config = yaml.safe_load(f)
+        ga_config = _prepare_ga_config(yaml.safe_load(f))
 
     # Load placement configuration path
     placement_config_path = run_config.get('placement_config', 'config.yaml')
@@ -76,7 +93,6 @@ def run_variant_mode(run_config: Dict) -> None:
     if seed is None:
         seed = int(np.random.randint(0, 2**31))
     print(f"Random seed: {seed}")
-    rng = np.random.default_rng(seed)
 
     # Load parent
     parent_path = run_config['input']['parent']
@@ -104,52 +120,60 @@ def run_variant_mode(run_config: Dict) -> None:
     print()
 
     children = []
-    lineage_records = []
-
-    for i in range(num_variants):
-        # Copy parent
-        child = parent.copy()
-        child.id = f"variant_{i:03d}"
-
-        # Apply mutation
-        child, mutation_ops = mutate(child, ga_config, grid_config, band_config, rng)
-
-        # Repair & refine
-        child = repair_and_refine(child, placement_config_path, ga_config, rng)
-
-        # Save CSV
-        child_path = output_root / f"variant_{i:03d}.csv"
-        save_individual_to_csv(child, child_path, overwrite=overwrite)
+    lineage_log_path = output_root / 'lineage_log.csv'
 
-        # Generate visualization if enabled
-        viz_config = run_config.get('visualization', {})
-        if viz_config.get('enabled', False):
-            plot_path = child_path.with_suffix('.png')
-            figsize = tuple(viz_config.get('figure_size', [16, 12]))
-            visualize_individual(child, engine, plot_path, figsize)
-
-        # Record lineage
-        lineage_records.append(
-            LineageRecord(
-                child_path=child_path,
-                parent_ids=[parent.id],
-                mode='variant',
-                crossover_mask=None,
-                mutation_ops=mutation_ops,
-                repair_notes=child.metadata.get('repair_notes', ''),
-                seed=seed + i
+    # Stream lineage records to disk as children are generated
+    with LineageLogWriter(lineage_log_path, overwrite=overwrite) as log_writer:
+        child_seeds = spawn_child_seeds(seed, num_variants)
+
+        for i in range(num_variants):
+            # Independent, reproducible stream per child
+            rng = np.random.default_rng(child_seeds[i])
+
+            # Copy parent
+            child = parent.copy()
+            child.id = f"variant_{i:03d}"
+
+            # Apply mutation
+            child, mutation_ops = mutate(child, ga_config, grid_config, band_config, rng,
+                                         band_of_cell=engine.band_of_cell)
+
+            # Repair & refine
+            child = repair_and_refine(child, placement_config_path, ga_config, rng,
+                                      engine=engine)
+
+            # Save CSV
+            child_path = output_root / f"variant_{i:03d}.csv"
+            save_individual_to_csv(child, child_path, overwrite=overwrite)
+
+            # Generate visualization if enabled
+            viz_config = run_config.get('visualization', {})
+            if viz_config.get('enabled', False):
+                plot_path = child_path.with_suffix('.png')
+                figsize = tuple(viz_config.get('figure_size', [16, 12]))
+                visualize_individual(child, engine, plot_path, figsize)
+
+            # Record lineage
+            log_writer.write(
+                LineageRecord(
+                    child_path=child_path,
+                    parent_ids=[parent.id],
+                    mode='variant',
+                    crossover_mask=None,
+                    mutation_ops=mutation_ops,
+                    repair_notes=child.metadata.get('repair_notes', ''),
+                    seed=child_seeds[i]
+                )
             )
-        )
 
-        children.append(child)
+            children.append(child)
 
-        # Progress reporting
-        if (i + 1) % 10 == 0 or i == num_variants - 1:
-            print(f"  Progress: {i+1}/{num_variants} variants generated")
+            # Progress reporting
+            if (i + 1) % 10 == 0 or i == num_variants - 1:
+                print(f"  Progress: {i+1}/{num_variants} variants generated")
 
-    # Save lineage
-    lineage_log_path = output_root / 'lineage_log.csv'
-    save_lineage_log(lineage_records, lineage_log_path, overwrite=overwrite)
+    # Wait for background plot writes before reporting
+    flush_viz()
 
     # Print summary
     print()
@@ -184,12 +208,13 @@ def run_offspring_mode(run_config: Dict) -> None:
            c. Apply mutation (with probability)
            d. Repair & refine
            e. Save to output_root/child_{i:03d}.csv
-           f. Create LineageRecord (parent IDs, crossover mask, mutation ops)
+           f. Append LineageRecord (parent IDs, crossover mask, mutation ops)
+              to output_root/lineage_log.csv
         6. Generate immigrants (if requested):
            a. Use PlacementEngine to generate fresh random layouts
            b. Save as output_root/immigrant_{j:03d}.csv
-        7. Save lineage log
-        8. Print summary report
+           c. Append immigrant LineageRecords to the lineage log
+        7. Print summary report
 
     Returns:
         None (writes to disk)
@@ -202,7 +227,7 @@ def run_offspring_mode(run_config: Dict) -> None:
     ga_config_path = run_config.get('ga_config', 'ga_ext/ga_ext_config.yaml')
     print(f"Loading GA config from: {ga_config_path}")
     with open(ga_config_path, 'r') as f:
-        ga_config = yaml.safe_load(f)
+        ga_config = _prepare_ga_config(yaml.safe_load(f))
 
     # Load placement configuration path
     placement_config_path = run_config.get('placement_config', 'config.yaml')
@@ -218,7 +243,6 @@ def run_offspring_mode(run_config: Dict) -> None:
     if seed is None:
         seed = int(np.random.randint(0, 2**31))
     print(f"Random seed: {seed}")
-    rng = np.random.default_rng(seed)
 
     # Load parents
     input_config = run_config['input']
@@ -263,79 +287,89 @@ def run_offspring_mode(run_config: Dict) -> None:
     print()
 
     children = []
-    lineage_records = []
-
-    for i in range(num_children):
-        # Select parents
-        parent_a, parent_b = select_two_parents(parents, weights, rng)
-
-        # Crossover (uses strategy from ga_config)
-        child, crossover_mask = apply_crossover(
-            parent_a, parent_b, ga_config, grid_config, band_config, rng,
-            engine_interface=engine  # Pass engine for region_aware strategy
-        )
-        child.id = f"child_{i:03d}"
+    lineage_log_path = output_root / 'lineage_log.csv'
 
-        # Mutation (with probability)
-        mutation_ops = []
-        if rng.random() < ga_config.get('mutation_rate', 0.3):
-            child, mutation_ops = mutate(child, ga_config, grid_config, band_config, rng)
+    # Stream lineage records to disk as children are generated
+    with LineageLogWriter(lineage_log_path, overwrite=overwrite) as log_writer:
+        # One extra stream is reserved for immigrant generation
+        child_seeds = spawn_child_seeds(seed, num_children + 1)
 
-        # Repair & refine
-        child = repair_and_refine(child, placement_config_path, ga_config, rng)
+        for i in range(num_children):
+            # Independent, reproducible stream per child
+            rng = np.random.default_rng(child_seeds[i])
 
-        # Save CSV
-        child_path = output_root / f"child_{i:03d}.csv"
-        save_individual_to_csv(child, child_path, overwrite=overwrite)
+            # Select parents
+            parent_a, parent_b = select_two_parents(parents, weights, rng)
 
-        # Generate visualization if enabled
-        viz_config = run_config.get('visualization', {})
-        if viz_config.get('enabled', False):
-            plot_path = child_path.with_suffix('.png')
-            figsize = tuple(viz_config.get('figure_size', [16, 12]))
-            visualize_individual(child, engine, plot_path, figsize)
-
-        # Record lineage
-        lineage_records.append(
-            LineageRecord(
-                child_path=child_path,
-                parent_ids=[parent_a.id, parent_b.id],
-                mode='offspring',
-                crossover_mask=crossover_mask,
-                mutation_ops=mutation_ops,
-                repair_notes=child.metadata.get('repair_notes', ''),
-                seed=seed + i
+            # Crossover (uses strategy from ga_config)
+            child, crossover_mask = apply_crossover(
+                parent_a, parent_b, ga_config, grid_config, band_config, rng,
+                engine_interface=engine  # Pass engine for region_aware strategy
+            )
+            child.id = f"child_{i:03d}"
+
+            # Mutation (with probability)
+            mutation_ops = []
+            if rng.random() < ga_config.get('mutation_rate', 0.3):
+                child, mutation_ops = mutate(child, ga_config, grid_config, band_config, rng,
+                                             band_of_cell=engine.band_of_cell)
+
+            # Repair & refine
+            child = repair_and_refine(child, placement_config_path, ga_config, rng,
+                                      engine=engine)
+
+            # Save CSV
+            child_path = output_root / f"child_{i:03d}.csv"
+            save_individual_to_csv(child, child_path, overwrite=overwrite)
+
+            # Generate visualization if enabled
+            viz_config = run_config.get('visualization', {})
+            if viz_config.get('enabled', False):
+                plot_path = child_path.with_suffix('.png')
+                figsize = tuple(viz_config.get('figure_size', [16, 12]))
+                visualize_individual(child, engine, plot_path, figsize)
+
+            # Record lineage
+            log_writer.write(
+                LineageRecord(
+                    child_path=child_path,
+                    parent_ids=[parent_a.id, parent_b.id],
+                    mode='offspring',
+                    crossover_mask=crossover_mask,
+                    mutation_ops=mutation_ops,
+                    repair_notes=child.metadata.get('repair_notes', ''),
+                    seed=child_seeds[i]
+                )
             )
-        )
-
-        children.append(child)
-
-        # Progress reporting
-        if (i + 1) % 10 == 0 or i == num_children - 1:
-            print(f"  Progress: {i+1}/{num_children} children generated")
-
-    # Generate immigrants (if requested)
-    num_immigrants = run_config['generation'].get('immigrants', 0)
-    if num_immigrants > 0:
-        print()
-        print(f"Generating {num_immigrants} fresh random immigrants...")
-        viz_config = run_config.get('visualization', {})
-        immigrants = generate_immigrants(
-            num_immigrants, placement_config_path, output_root, rng,
-            viz_config=viz_config, engine_interface=engine
-        )
 
-        # Add immigrant lineage records
-        for j, imm in enumerate(immigrants):
-            lineage_records.append(
-                create_immigrant_record(imm.path, seed + num_children + j)
+            children.append(child)
+
+            # Progress reporting
+            if (i + 1) % 10 == 0 or i == num_children - 1:
+                print(f"  Progress: {i+1}/{num_children} children generated")
+
+        # Generate immigrants (if requested)
+        num_immigrants = run_config['generation'].get('immigrants', 0)
+        if num_immigrants > 0:
+            print()
+            print(f"Generating {num_immigrants} fresh random immigrants...")
+            viz_config = run_config.get('visualization', {})
+            immigrants = generate_immigrants(
+                num_immigrants, placement_config_path, output_root,
+                np.random.default_rng(child_seeds[num_children]),
+                viz_config=viz_config, engine_interface=engine
             )
 
-        print(f"  Generated {len(immigrants)} immigrants")
+            # Add immigrant lineage records
+            for j, imm in enumerate(immigrants):
+                log_writer.write(
+                    create_immigrant_record(imm.path, imm.metadata['seed'])
+                )
 
-    # Save lineage
-    lineage_log_path = output_root / 'lineage_log.csv'
-    save_lineage_log(lineage_records, lineage_log_path, overwrite=overwrite)
+            print(f"  Generated {len(immigrants)} immigrants")
+
+    # Wait for background plot writes before reporting
+    flush_viz()
 
     # Print summary
     print()
@@ -349,6 +383,27 @@ def run_offspring_mode(run_config: Dict) -> None:
     print(f"Files created: {len(list(output_root.glob('*.csv')))}")
 
 
+def spawn_child_seeds(seed: int, count: int) -> List[int]:
+    """
+    Derive independent per-child seeds from the run seed.
+
+    Uses numpy's SeedSequence spawning so that child streams are
+    statistically independent (unlike seed + i), while each recorded
+    seed still reproduces its child via np.random.default_rng(seed).
+
+    Args:
+        seed: Run-level random seed
+        count: Number of child seeds to derive
+
+    Returns:
+        List of integer seeds, one per child
+    """
+    return [
+        int(child.generate_state(1)[0])
+        for child in np.random.SeedSequence(seed).spawn(count)
+    ]
+
+
 def select_two_parents(
     parents: List[Individual],
     weights: Optional[List[float]],
@@ -417,6 +472,10 @@ def generate_immigrants(
         config_path: Path to placement configuration file (config.yaml)
         output_root: Directory to save immigrant CSVs
         rng: Random number generator
+        viz_config: Optional visualization settings
+        engine_interface: Optional EngineInterface already built from config_path;
+            when given, its loaded config, grid region and entities are reused
+            instead of re-reading the configuration file
 
     Returns:
         List of Individual objects representing immigrants
@@ -433,17 +492,23 @@ def generate_immigrants(
     from src.config_loader import load_config, create_entities_from_config
     from src.stratified_placement import PlacementEngine, GridRegion
 
-    # Load configuration once
-    config = load_config(config_path)
+    if engine_interface is not None:
+        # Reuse the configuration already loaded by the caller
+        config = engine_interface.config
+        grid_region = engine_interface.grid_region
+        entities = engine_interface.entities
+    else:
+        # Load configuration once
+        config = load_config(config_path)
 
-    # Extract parameters
-    grid_config = config.get("grid", {})
-    width = grid_config.get("width", 10)
-    height = grid_config.get("height", 8)
-    grid_region = GridRegion(width, height)
+        # Extract parameters
+        grid_config = config.get("grid", {})
+        width = grid_config.get("width", 10)
+        height = grid_config.get("height", 8)
+        grid_region = GridRegion(width, height)
 
-    # Create entities
-    entities = create_entities_from_config(config, grid_region)
+        # Create entities
+        entities = create_entities_from_config(config, grid_region)
 
     # Get placement parameters
     separation_config = config.get("separation", {})
@@ -6,18 +6,60 @@ distances in GA-generated children.
 """
 
 from typing import Dict, List, Tuple, Set, Optional
+from concurrent.futures import ProcessPoolExecutor
+import os
 import numpy as np
 
 from .data_models import Individual
 from .engine_interface import EngineInterface
+from ._fast import min_pair, all_min_distance
 from .band_utils import (
     partition_by_band,
     get_band_quotas,
-    count_entities_per_band,
     calculate_quota_deviation
 )
 
 
+def to_soa(
+    placements: Dict[str, List[Tuple[int, int]]]
+) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+    """
+    Convert placements to struct-of-arrays form.
+
+    Args:
+        placements: Dictionary mapping entity_type to list of (x, y) positions
+
+    Returns:
+        Dictionary mapping entity_type to contiguous int32 (xs, ys) arrays
+    """
+    soa = {}
+    for entity_type, positions in placements.items():
+        coords = np.asarray(positions, dtype=np.int32).reshape(-1, 2)
+        soa[entity_type] = (
+            np.ascontiguousarray(coords[:, 0]),
+            np.ascontiguousarray(coords[:, 1])
+        )
+    return soa
+
+
+def from_soa(
+    soa: Dict[str, Tuple[np.ndarray, np.ndarray]]
+) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Convert struct-of-arrays placements back to lists of position tuples.
+
+    Args:
+        soa: Dictionary mapping entity_type to (xs, ys) arrays
+
+    Returns:
+        Dictionary mapping entity_type to list of (x, y) positions
+    """
+    return {
+        entity_type: list(zip(xs.tolist(), ys.tolist()))
+        for entity_type, (xs, ys) in soa.items()
+    }
+
+
 def repair_conflicts(
     individual: Individual,
     engine: EngineInterface,
@@ -44,8 +86,14 @@ def repair_conflicts(
     """
     notes = []
 
-    # Check for conflicts
-    conflicts = engine.check_conflicts(individual.placements)
+    # Single pass: which entity types sit on each cell (one entry per entity)
+    cell_map = {}
+    for entity_type, positions in individual.placements.items():
+        for pos in positions:
+            cell_map.setdefault(pos, []).append(entity_type)
+
+    # Check for conflicts (same cells and order as engine.check_conflicts)
+    conflicts = [pos for pos, entity_types in cell_map.items() if len(entity_types) > 1]
 
     if not conflicts:
         notes.append("repair_conflicts: No conflicts detected")
@@ -59,16 +107,29 @@ def repair_conflicts(
         for entity_type, positions in individual.placements.items()
     }
 
+    # Map position -> list index per entity type (first occurrence wins,
+    # matching list.index)
+    pos_to_idx = {}
+    for entity_type, positions in repaired_placements.items():
+        index_map = {}
+        for i, pos in enumerate(positions):
+            index_map.setdefault(pos, i)
+        pos_to_idx[entity_type] = index_map
+
+    # Entity types with removed entities (slots set to None until the end)
+    removed_types = set()
+
     # Track all occupied positions
-    occupied = individual.get_all_positions()
+    occupied = set(cell_map)
+
+    num_bands = engine.get_band_config()['num_bands']
 
     # Resolve each conflict
     for conflict_pos in conflicts:
-        # Find which entities are at this position
-        entities_at_pos = []
-        for entity_type, positions in repaired_placements.items():
-            if conflict_pos in positions:
-                entities_at_pos.append(entity_type)
+        # Find which entities are at this position (each type once).
+        # Relocations only target free cells, so this is unaffected by
+        # earlier iterations.
+        entities_at_pos = list(dict.fromkeys(cell_map[conflict_pos]))
 
         if len(entities_at_pos) <= 1:
             # Already resolved in previous iteration
@@ -86,9 +147,8 @@ def repair_conflicts(
         # Relocate each conflicting entity
         for entity_type in relocate_entities:
             # Find which band this position is in
-            try:
-                band_id = engine.get_band_id_for_position(conflict_pos)
-            except ValueError:
+            band_id = engine.get_band_id_for_position_fast(conflict_pos)
+            if band_id < 0:
                 notes.append(f"    ERROR: {conflict_pos} not in any band")
                 continue
 
@@ -108,7 +168,7 @@ def repair_conflicts(
 
                 # Try adjacent bands
                 for adj_band in [band_id - 1, band_id + 1]:
-                    if 0 <= adj_band < engine.get_band_config()['num_bands']:
+                    if 0 <= adj_band < num_bands:
                         new_pos = engine.suggest_relocation(
                             entity_type,
                             conflict_pos,
@@ -126,20 +186,28 @@ def repair_conflicts(
                 notes.append(
                     f"    ERROR: Could not relocate {entity_type} from {conflict_pos} - removing"
                 )
-                repaired_placements[entity_type].remove(conflict_pos)
+                idx = pos_to_idx[entity_type].pop(conflict_pos)
+                repaired_placements[entity_type][idx] = None
+                removed_types.add(entity_type)
             else:
                 # Replace old position with new
-                idx = repaired_placements[entity_type].index(conflict_pos)
+                idx = pos_to_idx[entity_type].pop(conflict_pos)
                 repaired_placements[entity_type][idx] = new_pos
+                pos_to_idx[entity_type][new_pos] = idx
                 occupied.remove(conflict_pos)
                 occupied.add(new_pos)
                 notes.append(
                     f"    Relocated {entity_type}: {conflict_pos} -> {new_pos}"
                 )
 
+    # Drop removed entities, preserving the order of the rest
+    for entity_type in removed_types:
+        repaired_placements[entity_type] = [
+            pos for pos in repaired_placements[entity_type] if pos is not None
+        ]
+
     # Create repaired individual
-    repaired = individual.copy()
-    repaired.placements = repaired_placements
+    repaired = individual.with_placements(repaired_placements)
 
     return repaired, notes
 
@@ -176,11 +244,16 @@ def repair_quotas(
     # Calculate expected quotas
     expected_quotas = get_band_quotas(entity_configs, grid_config, band_config)
 
-    # Calculate actual counts
-    actual_counts = count_entities_per_band(
-        individual.placements, grid_config, band_config
+    # Partition by band once; counts are derived from it and the lists are
+    # fresh, so they can be edited below without copying the placements
+    partition = partition_by_band(
+        individual.placements, grid_config, band_config,
+        band_of_cell=engine.band_of_cell
     )
 
+    # Calculate actual counts
+    actual_counts = {key: len(positions) for key, positions in partition.items()}
+
     # Calculate deviations
     deviations = calculate_quota_deviation(actual_counts, expected_quotas)
 
@@ -193,15 +266,6 @@ def repair_quotas(
 
     notes.append(f"repair_quotas: Found {len(imbalances)} quota imbalances")
 
-    # Create mutable copy
-    repaired_placements = {
-        entity_type: positions.copy()
-        for entity_type, positions in individual.placements.items()
-    }
-
-    # Partition by band for easier manipulation
-    partition = partition_by_band(repaired_placements, grid_config, band_config)
-
     # Track occupied positions
     occupied = individual.get_all_positions()
 
@@ -298,8 +362,7 @@ def repair_quotas(
         repaired_placements[entity_type].extend(positions)
 
     # Create repaired individual
-    repaired = individual.copy()
-    repaired.placements = repaired_placements
+    repaired = individual.with_placements(repaired_placements)
 
     return repaired, notes
 
@@ -343,10 +406,25 @@ def refine_separation(
     # Track improvements
     improvements = 0
 
-    for iteration in range(max_iterations):
-        # Calculate current minimum distances
-        min_distances = engine.calculate_min_distances(refined_placements)
+    # Distance work runs on int32 coordinate arrays kept in sync with the
+    # tuple lists. Entity types with fewer than two positions have no pair
+    # to separate and are never candidates.
+    soa = to_soa({
+        entity_type: positions
+        for entity_type, positions in refined_placements.items()
+        if len(positions) >= 2
+    })
+
+    # Calculate current minimum distances once; after a move only the moved
+    # entity type's value changes, so only that entry is recomputed below
+    min_distances = {
+        entity_type: all_min_distance(
+            *_normalize_soa(xs, ys, engine), engine.anisotropy_y
+        )
+        for entity_type, (xs, ys) in soa.items()
+    }
 
+    for iteration in range(max_iterations):
         # Find entity type with worst minimum distance
         if not min_distances:
             break
@@ -358,26 +436,29 @@ def refine_separation(
             # All entities are well-separated
             break
 
-        # Try to improve this entity type's separation
+        # Try to improve this entity type's separation (updates in place)
         improved = _try_improve_entity_separation(
             worst_entity_type,
             refined_placements,
             engine,
             grid_config,
             band_config,
-            config
+            config,
+            soa=soa
         )
 
-        if not improved:
+        if improved is None:
             # No improvement possible
             break
 
-        refined_placements = improved
         improvements += 1
 
         # Calculate new min distance
-        new_min_distances = engine.calculate_min_distances(refined_placements)
-        new_min_dist = new_min_distances.get(worst_entity_type, float('inf'))
+        xs, ys = soa[worst_entity_type]
+        new_min_dist = all_min_distance(
+            *_normalize_soa(xs, ys, engine), engine.anisotropy_y
+        )
+        min_distances[worst_entity_type] = new_min_dist
 
         notes.append(
             f"  Iteration {iteration+1}: Improved {worst_entity_type} "
@@ -387,35 +468,88 @@ def refine_separation(
     notes.append(f"refine_separation: Made {improvements} improvements")
 
     # Create refined individual
-    refined = individual.copy()
-    refined.placements = refined_placements
+    refined = individual.with_placements(refined_placements)
 
     return refined, notes
 
 
+def _normalize_soa(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    engine: EngineInterface
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Normalize int32 coordinate arrays (same as engine.normalized_coordinates).
+
+    Args:
+        xs: Grid x coordinates
+        ys: Grid y coordinates
+        engine: Engine interface (provides grid size)
+
+    Returns:
+        Tuple of (xs, ys) float64 arrays in [0,1] space
+    """
+    return (
+        (xs - 0.5) / engine.grid_region.width,
+        (ys - 0.5) / engine.grid_region.height
+    )
+
+
+def _find_closest_pair(
+    positions: List[Tuple[int, int]],
+    engine: EngineInterface
+) -> Tuple[float, Optional[Tuple[int, int]]]:
+    """
+    Find the pair of positions with minimum anisotropic distance.
+
+    Uses the compiled/vectorized kernel from _fast with the same
+    normalization as engine._anisotropic_distance.
+
+    Args:
+        positions: List of (x, y) positions
+        engine: Engine interface (provides grid size and anisotropy)
+
+    Returns:
+        Tuple of (min_distance, (i, j)) with i < j, or (inf, None) if
+        fewer than two positions are given
+    """
+    if len(positions) < 2:
+        return float('inf'), None
+
+    xs, ys = engine.normalized_coordinates(positions)
+    i, j, min_dist = min_pair(xs, ys, engine.anisotropy_y)
+    return min_dist, (i, j)
+
+
 def _try_improve_entity_separation(
     entity_type: str,
     placements: Dict[str, List[Tuple[int, int]]],
     engine: EngineInterface,
     grid_config: Dict,
     band_config: Dict,
-    config: Dict
-) -> Optional[Dict[str, List[Tuple[int, int]]]]:
+    config: Dict,
+    soa: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None
+) -> Optional[float]:
     """
     Try to improve separation for a specific entity type.
 
-    Attempts local swaps within bands.
+    Attempts local swaps within bands. On success the moved position is
+    written into placements in place.
 
     Args:
         entity_type: Entity type to improve
-        placements: Current placements
+        placements: Current placements (modified in place on success)
         engine: Engine interface
         grid_config: Grid configuration
         band_config: Band configuration
         config: GA configuration
+        soa: Optional struct-of-arrays view of placements (see to_soa);
+            used for the closest-pair search and updated alongside
+            placements when a move is accepted
 
     Returns:
-        Improved placements or None if no improvement found
+        New distance of the previously closest pair, or None if no
+        improvement was found (placements left unchanged)
     """
     if entity_type not in placements or len(placements[entity_type]) < 2:
         return None
@@ -423,22 +557,18 @@ def _try_improve_entity_separation(
     positions = placements[entity_type]
 
     # Find the pair with minimum separation
-    min_dist = float('inf')
-    min_pair_indices = None
-
-    for i in range(len(positions)):
-        for j in range(i + 1, len(positions)):
-            dist = engine._anisotropic_distance(
-                positions[i], positions[j], engine.anisotropy_y
-            )
-            if dist < min_dist:
-                min_dist = dist
-                min_pair_indices = (i, j)
-
-    if min_pair_indices is None:
-        return None
+    if soa is not None and entity_type in soa:
+        xs, ys = soa[entity_type]
+        idx1, idx2, min_dist = min_pair(
+            *_normalize_soa(xs, ys, engine), engine.anisotropy_y
+        )
+    else:
+        xs = ys = None
+        min_dist, min_pair_indices = _find_closest_pair(positions, engine)
+        if min_pair_indices is None:
+            return None
+        idx1, idx2 = min_pair_indices
 
-    idx1, idx2 = min_pair_indices
     pos1, pos2 = positions[idx1], positions[idx2]
 
     # Try to move one of them to a better location in the same band
@@ -463,9 +593,10 @@ def _try_improve_entity_separation(
 
         if new_dist > min_dist:
             # Accept improvement
-            new_placements = {k: v.copy() for k, v in placements.items()}
-            new_placements[entity_type][idx1] = new_pos1
-            return new_placements
+            positions[idx1] = new_pos1
+            if xs is not None:
+                xs[idx1], ys[idx1] = new_pos1
+            return new_dist
 
     # Try moving pos2 to a better location in its band
     new_pos2 = engine.suggest_relocation(
@@ -480,9 +611,10 @@ def _try_improve_entity_separation(
 
         if new_dist > min_dist:
             # Accept improvement
-            new_placements = {k: v.copy() for k, v in placements.items()}
-            new_placements[entity_type][idx2] = new_pos2
-            return new_placements
+            positions[idx2] = new_pos2
+            if xs is not None:
+                xs[idx2], ys[idx2] = new_pos2
+            return new_dist
 
     return None
 
@@ -491,7 +623,8 @@ def repair_and_refine(
     individual: Individual,
     config_path: str = "config.yaml",
     ga_config: Optional[Dict] = None,
-    rng: Optional[np.random.Generator] = None
+    rng: Optional[np.random.Generator] = None,
+    engine: Optional[EngineInterface] = None
 ) -> Individual:
     """
     Complete repair and refinement pipeline.
@@ -508,6 +641,8 @@ def repair_and_refine(
         config_path: Path to main configuration file
         ga_config: GA configuration dictionary (optional)
         rng: Random number generator (optional)
+        engine: Engine interface already loaded from config_path (optional);
+            built from config_path if omitted
 
     Returns:
         Valid, optimized Individual
@@ -521,16 +656,11 @@ def repair_and_refine(
 
     # Load GA config if not provided
     if ga_config is None:
-        import yaml
-        ga_config_path = "ga_ext/ga_ext_config.yaml"
-        try:
-            with open(ga_config_path, 'r') as f:
-                ga_config = yaml.safe_load(f)
-        except:
-            ga_config = {}
+        ga_config = _load_default_ga_config()
 
     # Create engine interface
-    engine = EngineInterface(config_path)
+    if engine is None:
+        engine = EngineInterface(config_path)
 
     all_notes = []
 
@@ -567,3 +697,92 @@ def repair_and_refine(
     repaired.metadata['repair_status'] = 'completed'
 
     return repaired
+
+
+def _load_default_ga_config() -> Dict:
+    """Load the default GA config, or an empty dict if it cannot be read."""
+    import yaml
+    ga_config_path = "ga_ext/ga_ext_config.yaml"
+    try:
+        with open(ga_config_path, 'r') as f:
+            return yaml.safe_load(f)
+    except:
+        return {}
+
+
+# Per-process engine used by repair_and_refine_batch workers
+_worker_engine: Optional[EngineInterface] = None
+_worker_config_path: Optional[str] = None
+
+
+def _init_repair_worker(config_path: str) -> None:
+    """Load the engine interface once per worker process."""
+    global _worker_engine, _worker_config_path
+    _worker_engine = EngineInterface(config_path)
+    _worker_config_path = config_path
+
+
+def _repair_one(task: Tuple[Individual, Dict, int]) -> Individual:
+    """Repair a single individual inside a worker process."""
+    individual, ga_config, seed = task
+    return repair_and_refine(
+        individual,
+        _worker_config_path,
+        ga_config,
+        np.random.default_rng(seed),
+        engine=_worker_engine
+    )
+
+
+def repair_and_refine_batch(
+    individuals: List[Individual],
+    config_path: str = "config.yaml",
+    ga_config: Optional[Dict] = None,
+    seeds: Optional[List[int]] = None,
+    max_workers: Optional[int] = None
+) -> List[Individual]:
+    """
+    Run repair_and_refine over many individuals in parallel processes.
+
+    Each individual is repaired independently with its own RNG seeded from
+    seeds, so results do not depend on worker count or scheduling. Each
+    worker loads the placement configuration once.
+
+    Args:
+        individuals: Individuals to repair
+        config_path: Path to main configuration file
+        ga_config: GA configuration dictionary (optional)
+        seeds: One RNG seed per individual (optional; derived from fresh
+            entropy via SeedSequence.spawn if omitted)
+        max_workers: Number of worker processes (default: os.cpu_count())
+
+    Returns:
+        Repaired individuals, in the same order as the input
+
+    Raises:
+        ValueError: If seeds is given with a different length than individuals
+    """
+    if not individuals:
+        return []
+
+    if seeds is None:
+        seeds = [
+            int(child.generate_state(1)[0])
+            for child in np.random.SeedSequence().spawn(len(individuals))
+        ]
+    elif len(seeds) != len(individuals):
+        raise ValueError(
+            f"Expected {len(individuals)} seeds, got {len(seeds)}"
+        )
+
+    if ga_config is None:
+        ga_config = _load_default_ga_config()
+
+    tasks = [(individual, ga_config, seed) for individual, seed in zip(individuals, seeds)]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers or os.cpu_count(),
+        initializer=_init_repair_worker,
+        initargs=(config_path,)
+    ) as executor:
+        return list(executor.map(_repair_one, tasks, chunksize=4))
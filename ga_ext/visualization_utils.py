@@ -9,8 +9,9 @@ import matplotlib
 # Use non-interactive backend to prevent plot windows from popping up
 matplotlib.use('Agg')
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, Tuple
 import matplotlib.pyplot as plt
 
 from src.stratified_placement import (
@@ -23,6 +24,38 @@ from .data_models import Individual
 from .engine_interface import EngineInterface
 
 
+# Background PNG writer: figures are built on the caller's thread and only
+# the (GIL-releasing) Agg render + encode runs here. A single worker keeps
+# savefig calls serialized, since matplotlib's font cache and text layout
+# are not thread-safe.
+_VIZ_MAX_PENDING = 2
+_viz_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='viz')
+_pending_writes: List[Tuple[Future, Path]] = []
+
+
+def _save_figure(fig, output_path: Path) -> None:
+    """Render and write a detached figure to disk."""
+    fig.savefig(str(output_path), dpi=300)
+
+
+def _finish_oldest_write() -> None:
+    """Wait for the oldest pending write and report it on the caller's thread."""
+    future, output_path = _pending_writes.pop(0)
+    future.result()
+    print(f"  Saved visualization: {output_path}")
+
+
+def flush_viz() -> None:
+    """
+    Wait for all pending background visualization writes.
+
+    Raises:
+        Exception: Re-raises the first error from a failed write
+    """
+    while _pending_writes:
+        _finish_oldest_write()
+
+
 def individual_to_placement_result(
     individual: Individual,
     engine_interface: EngineInterface
@@ -92,6 +125,9 @@ def visualize_individual(
     - Separation violations
     - Y-coordinate distribution
 
+    The PNG is written by a background thread; call flush_viz() to wait
+    for pending writes.
+
     Args:
         individual: Individual to visualize
         engine_interface: Engine interface providing grid, entities, stratification
@@ -127,15 +163,19 @@ def visualize_individual(
         entities=engine_interface.entities
     )
 
-    # Generate and save plot
+    # Generate plot (saved below in the background)
     visualizer.plot_comprehensive_analysis(
         result=result,
         metrics=metrics,
-        figsize=figsize,
-        save_path=str(output_path)
+        figsize=figsize
     )
+    fig = plt.gcf()
 
-    # Close all figures to free memory and prevent display
+    # Detach from pyplot so the writer thread owns the figure exclusively
     plt.close('all')
 
-    print(f"  Saved visualization: {output_path}")
+    # Bound the number of figures held in memory awaiting write
+    if len(_pending_writes) >= _VIZ_MAX_PENDING:
+        _finish_oldest_write()
+
+    _pending_writes.append((_viz_pool.submit(_save_figure, fig, output_path), output_path))
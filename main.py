@@ -7,44 +7,85 @@ This is the primary interface users should use to run placements.
 Supports various modes for different use cases.
 """
 
+import os
 import sys
 import argparse
+import contextlib
+import copy
+import io
+import json
+import random
+import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Render plots off-screen; must be set before anything imports matplotlib
+os.environ.setdefault("MPLBACKEND", "Agg")
+
 # Add current directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
 from src.config_loader import (
     create_placement_engine_from_config,
+    create_placement_engine_from_dict,
+    load_config,
     print_config_summary,
     get_visualization_config
 )
 from src.placement_metrics import PlacementMetrics, print_placement_report
-from src.visualization import PlacementVisualizer
-from src.placement_exporter import PlacementExporter, create_placement_file
+from src.result_cache import load_or_compute
+
+
+def place_and_analyze(engine, config_bytes=None):
+    """
+    Run placement and quality analysis
+
+    Results are cached by config contents and seed when config_bytes is
+    given; pass None to always recompute.
+    """
+    def compute():
+        result = engine.place_all_entities()
+        metrics_analyzer = PlacementMetrics(
+            engine.grid_region,
+            engine.stratification,
+            engine.entities,
+            engine.cross_entity_radius
+        )
+        return result, metrics_analyzer.analyze_placement(result)
+
+    if config_bytes is None:
+        return compute()
+
+    return load_or_compute(config_bytes, engine.random_seed, compute)
 
 
-def run_basic_placement(config_path="config.yaml", show_summary=True, output_name=None, save_plots=True):
-    """Run basic placement and show results"""
+def run_basic_placement(config_path="config.yaml", show_summary=True, output_name=None, save_plots=True,
+                        use_cache=True, return_metrics=False, config=None):
+    """Run basic placement and show results (config, if given, is used instead of reading config_path)"""
     if show_summary:
         print("=" * 60)
         print("STRATIFIED PLACEMENT SYSTEM")
         print("=" * 60)
-        print_config_summary(config_path)
+        print_config_summary(config if config is not None else config_path)
 
     print("\nRunning placement algorithm...")
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Create and run placement engine
-    engine = create_placement_engine_from_config(config_path)
-    result = engine.place_all_entities()
-
-    elapsed_time = time.time() - start_time
+    if config is not None:
+        engine = create_placement_engine_from_dict(config)
+        config_bytes = json.dumps(config, sort_keys=True, default=str).encode()
+    else:
+        engine = create_placement_engine_from_config(config_path)
+        config_bytes = Path(config_path).read_bytes()
+    result, metrics = place_and_analyze(engine, config_bytes if use_cache else None)
+
+    elapsed_time = time.perf_counter() - start_time
     print(f"Placement completed in {elapsed_time:.3f} seconds")
 
     # Basic results
-    total_placed = sum(len(p) for p in result.placements.values())
+    total_placed = result.total_entity_count()
     total_expected = sum(e.count for e in engine.entities)
 
     print(f"\nResults Summary:")
@@ -56,10 +97,11 @@ def run_basic_placement(config_path="config.yaml", show_summary=True, output_nam
 
     # Always generate CSV output
     if output_name is None:
-        timestamp = int(time.time())
+        timestamp = time.time_ns() // 1_000_000_000
         output_name = f"placement_{timestamp}"
 
     print(f"\nExporting placement file as '{output_name}.csv'...")
+    from src.placement_exporter import create_placement_file
     try:
         file_path = create_placement_file(result, engine.grid_region, output_name)
         print(f"  ✓ CSV: {file_path}")
@@ -70,21 +112,10 @@ def run_basic_placement(config_path="config.yaml", show_summary=True, output_nam
     if save_plots:
         print(f"\nGenerating visualization plot...")
         try:
-            # Set matplotlib to non-interactive backend to avoid display issues
-            import matplotlib
-            matplotlib.use('Agg')
-
-            # Calculate metrics for visualization
-            metrics_analyzer = PlacementMetrics(
-                engine.grid_region,
-                engine.stratification,
-                engine.entities,
-                engine.cross_entity_radius
-            )
-            metrics = metrics_analyzer.analyze_placement(result)
+            from src.visualization import PlacementVisualizer
 
             # Create visualization
-            vis_config = get_visualization_config(config_path)
+            vis_config = get_visualization_config(config if config is not None else config_path)
             visualizer = PlacementVisualizer(
                 engine.grid_region,
                 engine.stratification,
@@ -105,23 +136,18 @@ def run_basic_placement(config_path="config.yaml", show_summary=True, output_nam
             import traceback
             traceback.print_exc()
 
+    if return_metrics:
+        return engine, result, metrics
     return engine, result
 
 
 
-def run_detailed_analysis(config_path="config.yaml", output_name=None, save_plots=True):
+def run_detailed_analysis(config_path="config.yaml", output_name=None, save_plots=True, use_cache=True):
     """Run placement with detailed quality analysis"""
-    engine, result = run_basic_placement(config_path, output_name=output_name, save_plots=save_plots)
+    engine, result, metrics = run_basic_placement(config_path, output_name=output_name, save_plots=save_plots,
+                                                  use_cache=use_cache, return_metrics=True)
 
     print("\nAnalyzing placement quality...")
-    metrics_analyzer = PlacementMetrics(
-        engine.grid_region,
-        engine.stratification,
-        engine.entities,
-        engine.cross_entity_radius
-    )
-
-    metrics = metrics_analyzer.analyze_placement(result)
 
     # Print comprehensive report
     report = print_placement_report(metrics)
@@ -130,11 +156,20 @@ def run_detailed_analysis(config_path="config.yaml", output_name=None, save_plot
     return engine, result, metrics
 
 
-def run_with_visualization(config_path="config.yaml", save_plots=False, output_name=None):
+def run_with_visualization(config_path="config.yaml", save_plots=False, output_name=None, use_cache=True):
     """Run placement with full visualization"""
-    engine, result, metrics = run_detailed_analysis(config_path, output_name=output_name)
+    # The comprehensive figure is rendered once here instead of also in
+    # run_basic_placement; the extra analysis copy is a file copy
+    # One timestamp names both the run outputs and the saved analysis copy
+    timestamp = time.time_ns() // 1_000_000_000
+    if output_name is None:
+        output_name = f"placement_{timestamp}"
+
+    engine, result, metrics = run_detailed_analysis(config_path, output_name=output_name, save_plots=False,
+                                                    use_cache=use_cache)
 
     print("\nGenerating visualizations...")
+    from src.visualization import PlacementVisualizer
     vis_config = get_visualization_config(config_path)
 
     visualizer = PlacementVisualizer(
@@ -144,19 +179,21 @@ def run_with_visualization(config_path="config.yaml", save_plots=False, output_n
     )
 
     # Create comprehensive visualization
-    save_path = None
-    if save_plots:
-        timestamp = int(time.time())
-        save_path = f"placement_analysis_{timestamp}.png"
-        print(f"Saving plot to: {save_path}")
+    plot_path = f"output/{output_name}_plot.png"
 
     try:
         visualizer.plot_comprehensive_analysis(
             result,
             metrics,
             figsize=vis_config.get('figure_size', [16, 12]),
-            save_path=save_path
+            save_path=plot_path
         )
+        print(f"  ✓ Plot: {plot_path}")
+
+        if save_plots:
+            save_path = f"placement_analysis_{timestamp}.png"
+            print(f"Saving plot to: {save_path}")
+            shutil.copyfile(plot_path, save_path)
     except Exception as e:
         print(f"Visualization failed (likely due to display issues): {e}")
         print("Continuing without visualization...")
@@ -164,56 +201,89 @@ def run_with_visualization(config_path="config.yaml", save_plots=False, output_n
     return engine, result, metrics
 
 
-def run_multiple_random_trials(num_trials=5, config_path="config.yaml"):
-    """Run multiple trials with different random seeds for comparison"""
-    print("=" * 60)
-    print(f"RUNNING {num_trials} RANDOM TRIALS")
-    print("=" * 60)
+def _run_one_trial(base_config, random_seed, trial, num_trials, config_path="config.yaml", use_cache=True):
+    """
+    Run a single trial and return its summary row plus the captured console output
 
-    results = []
+    stdout and stderr are captured together so tracebacks stay in order with
+    the trial's own messages. If the trial raises, the output captured so far
+    is attached to the exception as ``trial_log``.
+    """
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log), contextlib.redirect_stderr(log):
+            print(f"\n--- Trial {trial + 1}/{num_trials} ---")
+            print(f"Using random seed: {random_seed}")
+
+            # Override the seed on an in-memory copy of the config
+            config = copy.deepcopy(base_config)
+            config.setdefault('optimization', {})['random_seed'] = random_seed
+
+            # Generate CSV and plot for each trial
+            trial_output_name = f"placement_trial_{trial + 1}_seed_{random_seed}"
+            engine, result, metrics = run_basic_placement(
+                config_path, show_summary=False, output_name=trial_output_name, save_plots=True,
+                use_cache=use_cache, return_metrics=True, config=config
+            )
+    except Exception as e:
+        e.trial_log = log.getvalue()
+        raise
 
-    for trial in range(num_trials):
-        print(f"\n--- Trial {trial + 1}/{num_trials} ---")
+    trial_result = {
+        'trial': trial + 1,
+        'seed': random_seed,
+        'total_placed': result.total_entity_count(),
+        'quality_score': metrics['overall_quality_score'],
+        'feasibility_notes': len(result.feasibility_notes)
+    }
+    return trial_result, log.getvalue()
 
-        # Generate random seed for this trial
-        import random
-        random_seed = random.randint(1, 1000000)
-        print(f"Using random seed: {random_seed}")
 
-        # Temporarily override config for this trial
-        from src.config_loader import load_config
-        config = load_config(config_path)
-        config['optimization']['random_seed'] = random_seed
+def _print_trial_outcome(get_outcome):
+    """Print a trial's captured output, even if it failed, and return its summary row"""
+    try:
+        trial_result, log = get_outcome()
+    except Exception as e:
+        print(getattr(e, 'trial_log', ''), end="")
+        raise
+    print(log, end="")
+    return trial_result
 
-        # Save temporary config
-        import yaml
-        temp_config_path = f"temp_config_trial_{trial}.yaml"
-        with open(temp_config_path, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
 
-        try:
-            # Generate CSV and plot for each trial
-            trial_output_name = f"placement_trial_{trial + 1}_seed_{random_seed}"
-            engine, result = run_basic_placement(temp_config_path, show_summary=False, output_name=trial_output_name, save_plots=True)
+def run_multiple_random_trials(num_trials=5, config_path="config.yaml", use_cache=True, max_workers=None):
+    """
+    Run multiple trials with different random seeds for comparison
 
-            # Calculate basic quality score
-            metrics_analyzer = PlacementMetrics(
-                engine.grid_region, engine.stratification, engine.entities, engine.cross_entity_radius
-            )
-            metrics = metrics_analyzer.analyze_placement(result)
+    Trials are independent and run in separate processes (max_workers
+    defaults to the CPU count; 1 runs them in this process). Each trial's
+    output is printed in trial order once it finishes.
+    """
+    print("=" * 60)
+    print(f"RUNNING {num_trials} RANDOM TRIALS")
+    print("=" * 60)
 
-            trial_result = {
-                'trial': trial + 1,
-                'seed': random_seed,
-                'total_placed': sum(len(p) for p in result.placements.values()),
-                'quality_score': metrics['overall_quality_score'],
-                'feasibility_notes': len(result.feasibility_notes)
-            }
-            results.append(trial_result)
+    base_config = load_config(config_path)
 
-        finally:
-            # Clean up temporary config
-            Path(temp_config_path).unlink(missing_ok=True)
+    # Generate random seed for each trial
+    seeds = [random.randint(1, 1000000) for _ in range(num_trials)]
+    tasks = [
+        (base_config, seed, trial, num_trials, config_path, use_cache)
+        for trial, seed in enumerate(seeds)
+    ]
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, num_trials))
+
+    results = []
+    if max_workers == 1:
+        for task in tasks:
+            results.append(_print_trial_outcome(lambda: _run_one_trial(*task)))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_run_one_trial, *task) for task in tasks]
+            for future in futures:
+                results.append(_print_trial_outcome(future.result))
 
     # Summary of trials
     print("\n" + "=" * 60)
@@ -250,7 +320,9 @@ Examples:
   python3 main.py --visualize                   # Full interactive analysis + CSV + plot
   python3 main.py --output-name "room_v1"       # Custom filenames (room_v1.csv + room_v1_plot.png)
   python3 main.py --trials 10                   # Multiple random trials (each with CSV + plot)
+  python3 main.py --trials 10 --workers 4       # Run trials on 4 processes (default: all cores)
   python3 main.py --config custom.yaml          # Custom config file
+  python3 main.py --no-cache                    # Recompute even if this config/seed was run before
         """
     )
 
@@ -279,6 +351,13 @@ Examples:
         help='Run N random trials for comparison'
     )
 
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        metavar='N',
+        help='Worker processes for --trials (default: CPU count; 1 runs sequentially)'
+    )
+
     parser.add_argument(
         '--output-name', '-n',
         type=str,
@@ -286,17 +365,26 @@ Examples:
         help='Base name for CSV file (default: placement_TIMESTAMP)'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Disable the placement result cache in output/.cache'
+    )
+
     args = parser.parse_args()
+    use_cache = not args.no_cache
 
     try:
         if args.trials:
-            run_multiple_random_trials(args.trials, args.config)
+            run_multiple_random_trials(args.trials, args.config, use_cache=use_cache,
+                                       max_workers=args.workers)
         elif args.visualize:
-            run_with_visualization(args.config, True, args.output_name)
+            run_with_visualization(args.config, True, args.output_name, use_cache=use_cache)
         elif args.detailed:
-            run_detailed_analysis(args.config, args.output_name, save_plots=True)
+            run_detailed_analysis(args.config, args.output_name, save_plots=True, use_cache=use_cache)
         else:
-            run_basic_placement(args.config, output_name=args.output_name, save_plots=True)
+            run_basic_placement(args.config, output_name=args.output_name, save_plots=True,
+                                use_cache=use_cache)
 
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
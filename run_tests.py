@@ -17,11 +17,14 @@ def run_all_tests():
     
     # Import test modules
     try:
-        from tests import test_stratification, test_placement_engine
+        from tests import test_stratification, test_placement_engine, test_placement_metrics, test_result_cache, test_placement_exporter
         
         # Add test modules to suite
         suite.addTests(loader.loadTestsFromModule(test_stratification))
         suite.addTests(loader.loadTestsFromModule(test_placement_engine))
+        suite.addTests(loader.loadTestsFromModule(test_placement_metrics))
+        suite.addTests(loader.loadTestsFromModule(test_result_cache))
+        suite.addTests(loader.loadTestsFromModule(test_placement_exporter))
         
         # Run tests
         runner = unittest.TextTestRunner(verbosity=2)
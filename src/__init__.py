@@ -19,9 +19,11 @@ from .stratified_placement import (
 )
 
 from .placement_metrics import PlacementMetrics
-from .visualization import PlacementVisualizer
-from .placement_exporter import PlacementExporter, create_placement_file
-from .config_loader import create_placement_engine_from_config, load_config
+from .config_loader import (
+    create_placement_engine_from_config,
+    create_placement_engine_from_dict,
+    load_config
+)
 
 __all__ = [
     'PlacementEngine',
@@ -36,5 +38,21 @@ __all__ = [
     'PlacementExporter',
     'create_placement_file',
     'create_placement_engine_from_config',
+    'create_placement_engine_from_dict',
     'load_config'
-]
\ No newline at end of file
+]
+
+# Plotting and export pull in matplotlib/XML machinery; load them on first use
+_LAZY_EXPORTS = {
+    'PlacementVisualizer': '.visualization',
+    'PlacementExporter': '.placement_exporter',
+    'create_placement_file': '.placement_exporter',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
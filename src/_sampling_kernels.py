@@ -0,0 +1,60 @@
+"""
+Compiled Sampling Kernels
+
+Farthest point selection for PlacementEngine's Phase B as a single
+compiled loop over a taken mask, with the same squared anisotropic
+distances and lowest-index tie-breaking as the NumPy version in
+stratified_placement. Only defined when numba is installed; check
+NUMBA_AVAILABLE before calling.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def farthest_point_indices(coords, start, count, anisotropy_y):
+        """
+        Greedily pick count points, each farthest from those already picked
+        
+        Args:
+            coords: (N, 2) float64 normalized coordinates
+            start: Index of the first pick
+            count: Number of points to pick (1 <= count <= N)
+            anisotropy_y: Y-axis weighting factor
+        
+        Returns:
+            int64 indices into coords in pick order
+        """
+        n = coords.shape[0]
+        taken = np.zeros(n, dtype=np.bool_)
+        nearest = np.empty(n)
+        chosen = np.empty(count, dtype=np.int64)
+        chosen[0] = start
+        taken[start] = True
+        for i in range(n):
+            dx = coords[i, 0] - coords[start, 0]
+            dy = (coords[i, 1] - coords[start, 1]) * anisotropy_y
+            nearest[i] = dx * dx + dy * dy
+        
+        for k in range(1, count):
+            best = -1
+            best_d2 = -1.0
+            for i in range(n):
+                if not taken[i] and nearest[i] > best_d2:
+                    best = i
+                    best_d2 = nearest[i]
+            chosen[k] = best
+            taken[best] = True
+            # Branch-free update; taken entries are skipped by the pick above
+            for i in range(n):
+                dx = coords[i, 0] - coords[best, 0]
+                dy = (coords[i, 1] - coords[best, 1]) * anisotropy_y
+                nearest[i] = min(nearest[i], dx * dx + dy * dy)
+        return chosen
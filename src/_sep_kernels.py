@@ -0,0 +1,75 @@
+"""
+Compiled Separation Kernels
+
+Single-pass pairwise distance reductions for PlacementMetrics. Each kernel
+walks every pair once and accumulates min, sum, count and violations
+without materializing a distance matrix. Only defined when numba is
+installed; check NUMBA_AVAILABLE before calling.
+"""
+
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Reassociation/contraction let the reductions vectorize; the no-inf/no-nan
+# flags are left out because min starts from inf
+_FASTMATH = {'reassoc', 'contract', 'arcp', 'nsz'}
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=_FASTMATH)
+    def pairwise_intra(points, r2):
+        """
+        Reduce distances over unordered pairs (i < j) of one point set
+
+        Args:
+            points: (N, 2) float64 coordinates
+            r2: Squared violation radius
+
+        Returns:
+            Tuple of (min_distance, distance_sum, pair_count, violations)
+        """
+        n = points.shape[0]
+        min_d2 = math.inf
+        total = 0.0
+        violations = 0
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = points[i, 0] - points[j, 0]
+                dy = points[i, 1] - points[j, 1]
+                d2 = dx * dx + dy * dy
+                min_d2 = min(min_d2, d2)
+                total += math.sqrt(d2)
+                violations += d2 < r2
+        return math.sqrt(min_d2), total, n * (n - 1) // 2, violations
+
+    @njit(cache=True, fastmath=_FASTMATH)
+    def pairwise_cross(points_a, points_b, r2):
+        """
+        Reduce distances over all pairs between two point sets
+
+        Args:
+            points_a: (N, 2) float64 coordinates
+            points_b: (M, 2) float64 coordinates
+            r2: Squared violation radius
+
+        Returns:
+            Tuple of (min_distance, distance_sum, pair_count, violations)
+        """
+        min_d2 = math.inf
+        total = 0.0
+        violations = 0
+        for i in range(points_a.shape[0]):
+            for j in range(points_b.shape[0]):
+                dx = points_a[i, 0] - points_b[j, 0]
+                dy = points_a[i, 1] - points_b[j, 1]
+                d2 = dx * dx + dy * dy
+                min_d2 = min(min_d2, d2)
+                total += math.sqrt(d2)
+                violations += d2 < r2
+        return math.sqrt(min_d2), total, points_a.shape[0] * points_b.shape[0], violations
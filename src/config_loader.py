@@ -5,33 +5,69 @@ Loads YAML configuration files and converts them to the appropriate
 data structures for the stratified placement system.
 """
 
+import copy
+import os
+import numpy as np
 import yaml
-from typing import Dict, List, Set, Any, Optional
+from functools import lru_cache
+from typing import AbstractSet, Dict, List, Set, Any, Optional, Union
 from pathlib import Path
 
 from .stratified_placement import (
-    GridCell, Entity, GridRegion, EntityType, PlacementEngine
+    AllowedRegion, GridCell, Entity, GridRegion, EntityType, PlacementEngine
 )
 
 
+# libyaml-backed loader when PyYAML was built with it, else the pure-Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Entity type lookup by config name, shared by construction and validation
+_ENTITY_TYPE_MAP = {entity_type.value: entity_type for entity_type in EntityType}
+
+
 class ConfigurationError(Exception):
     """Raised when configuration is invalid"""
     pass
 
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
-    """Load configuration from YAML file"""
+    """
+    Load configuration from YAML file
+    
+    Parsed files are memoized per (path, modification time, size), so
+    repeated loads of an unchanged file skip the YAML parse. Each call
+    returns its own copy, so callers may modify the result freely.
+    """
+    return copy.deepcopy(_load_config_shared(config_path))
+
+
+def _load_config_shared(config_path: str) -> Dict[str, Any]:
+    """
+    Load configuration without copying it
+    
+    Returns the memoized dict itself, which is shared between callers and
+    must be treated as read-only. Use load_config when the result may be
+    modified.
+    """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
-        return config
+        stat = os.stat(config_path)
+        return _load_config_cached(
+            os.path.abspath(config_path), stat.st_mtime_ns, stat.st_size
+        )
     except FileNotFoundError:
         raise ConfigurationError(f"Configuration file not found: {config_path}")
     except yaml.YAMLError as e:
         raise ConfigurationError(f"Invalid YAML in configuration file: {e}")
 
 
-def parse_allowed_region(region_config: Dict[str, Any], grid_region: GridRegion) -> Set[GridCell]:
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a YAML file; mtime_ns and size only key the cache"""
+    # One read of the whole file; the loader decodes bytes itself
+    return yaml.load(Path(config_path).read_bytes(), Loader=_YAML_LOADER)
+
+
+def parse_allowed_region(region_config: Dict[str, Any], grid_region: GridRegion) -> AbstractSet[GridCell]:
     """
     Parse allowed region configuration into a set of grid cells
     
@@ -40,29 +76,32 @@ def parse_allowed_region(region_config: Dict[str, Any], grid_region: GridRegion)
         grid_region: The full grid region
     
     Returns:
-        Set of allowed grid cells
+        Set of allowed grid cells; an AllowedRegion mask for every form
+        except an explicit cell list, which may name cells off the grid
     """
-    all_cells = grid_region.all_cells()
+    # Keep-masks over grid columns and rows (1-based coordinates)
+    xs = np.arange(1, grid_region.width + 1)
+    ys = np.arange(1, grid_region.height + 1)
     
     if "exclude_y_range" in region_config:
         # Exclude specific Y range
         y_min, y_max = region_config["exclude_y_range"]
-        return {cell for cell in all_cells if not (y_min <= cell.y <= y_max)}
+        return _region_from_masks(np.ones(xs.size, bool), ~((ys >= y_min) & (ys <= y_max)))
     
     elif "exclude_y_list" in region_config:
         # Exclude specific Y coordinates (list)
-        excluded_y = set(region_config["exclude_y_list"])
-        return {cell for cell in all_cells if cell.y not in excluded_y}
+        excluded_y = list(region_config["exclude_y_list"])
+        return _region_from_masks(np.ones(xs.size, bool), ~np.isin(ys, excluded_y))
     
     elif "exclude_x_range" in region_config:
         # Exclude specific X range
         x_min, x_max = region_config["exclude_x_range"]
-        return {cell for cell in all_cells if not (x_min <= cell.x <= x_max)}
+        return _region_from_masks(~((xs >= x_min) & (xs <= x_max)), np.ones(ys.size, bool))
     
     elif "exclude_x_list" in region_config:
         # Exclude specific X coordinates (list)
-        excluded_x = set(region_config["exclude_x_list"])
-        return {cell for cell in all_cells if cell.x not in excluded_x}
+        excluded_x = list(region_config["exclude_x_list"])
+        return _region_from_masks(~np.isin(xs, excluded_x), np.ones(ys.size, bool))
     
     elif all(key in region_config for key in ["x_min", "x_max", "y_min", "y_max"]):
         # Include specific rectangular region
@@ -71,13 +110,21 @@ def parse_allowed_region(region_config: Dict[str, Any], grid_region: GridRegion)
         y_min = region_config["y_min"]
         y_max = region_config["y_max"]
         
-        return {cell for cell in all_cells 
-                if x_min <= cell.x <= x_max and y_min <= cell.y <= y_max}
+        return _region_from_masks((xs >= x_min) & (xs <= x_max), (ys >= y_min) & (ys <= y_max))
     
     elif "cells" in region_config:
-        # Explicitly specified cells
+        # Explicitly specified cells; classify the whole list once so uniform
+        # lists (the usual case) skip the per-entry type checks
+        cell_configs = region_config["cells"]
+        entry_types = set(map(type, cell_configs))
+        if entry_types == {dict}:
+            return {GridCell(c["x"], c["y"]) for c in cell_configs}
+        if entry_types and entry_types <= {list, tuple} and set(map(len, cell_configs)) == {2}:
+            return {GridCell(x, y) for x, y in cell_configs}
+        
+        # Mixed or irregular entries: unrecognized ones are skipped
         cells = set()
-        for cell_config in region_config["cells"]:
+        for cell_config in cell_configs:
             if isinstance(cell_config, dict):
                 cells.add(GridCell(cell_config["x"], cell_config["y"]))
             elif isinstance(cell_config, (list, tuple)) and len(cell_config) == 2:
@@ -86,7 +133,12 @@ def parse_allowed_region(region_config: Dict[str, Any], grid_region: GridRegion)
     
     else:
         # Default to all cells if no constraints specified
-        return all_cells
+        return AllowedRegion(np.ones((grid_region.height, grid_region.width), dtype=bool))
+
+
+def _region_from_masks(x_keep: np.ndarray, y_keep: np.ndarray) -> AllowedRegion:
+    """Build the region of cells whose column and row are both kept"""
+    return AllowedRegion(y_keep[:, None] & x_keep[None, :])
 
 
 def create_entities_from_config(config: Dict[str, Any], grid_region: GridRegion) -> List[Entity]:
@@ -95,9 +147,8 @@ def create_entities_from_config(config: Dict[str, Any], grid_region: GridRegion)
     entity_config = config.get("entities", {})
     
     for entity_name, entity_data in entity_config.items():
-        try:
-            entity_type = EntityType(entity_name)
-        except ValueError:
+        entity_type = _ENTITY_TYPE_MAP.get(entity_name)
+        if entity_type is None:
             raise ConfigurationError(f"Unknown entity type: {entity_name}")
         
         count = entity_data.get("count", 1)
@@ -136,8 +187,19 @@ def create_placement_engine_from_config(config_path: str = "config.yaml") -> Pla
     Returns:
         Configured PlacementEngine instance
     """
-    config = load_config(config_path)
+    return create_placement_engine_from_dict(_load_config_shared(config_path))
+
+
+def create_placement_engine_from_dict(config: Dict[str, Any]) -> PlacementEngine:
+    """
+    Create a configured PlacementEngine from an already-loaded configuration
+    
+    Args:
+        config: Configuration dictionary (same layout as config.yaml)
     
+    Returns:
+        Configured PlacementEngine instance
+    """
     # Create grid region
     grid_config = config.get("grid", {})
     width = grid_config.get("width", 10)
@@ -179,16 +241,23 @@ def create_placement_engine_from_config(config_path: str = "config.yaml") -> Pla
     return engine
 
 
-def get_visualization_config(config_path: str = "config.yaml") -> Dict[str, Any]:
-    """Get visualization configuration"""
-    config = load_config(config_path)
-    return config.get("visualization", {})
+def _resolve_config(config_or_path: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return an already-loaded config dict as is, or load it (read-only) from a path"""
+    if isinstance(config_or_path, dict):
+        return config_or_path
+    return _load_config_shared(str(config_or_path))
+
 
+def get_visualization_config(config_or_path: Union[str, Path, Dict[str, Any]] = "config.yaml") -> Dict[str, Any]:
+    """Get visualization configuration from a config dict or file path"""
+    config = _resolve_config(config_or_path)
+    return copy.deepcopy(config.get("visualization", {}))
 
-def get_optimization_config(config_path: str = "config.yaml") -> Dict[str, Any]:
-    """Get optimization configuration"""
-    config = load_config(config_path)
-    return config.get("optimization", {})
+
+def get_optimization_config(config_or_path: Union[str, Path, Dict[str, Any]] = "config.yaml") -> Dict[str, Any]:
+    """Get optimization configuration from a config dict or file path"""
+    config = _resolve_config(config_or_path)
+    return copy.deepcopy(config.get("optimization", {}))
 
 
 def validate_config(config: Dict[str, Any]) -> List[str]:
@@ -224,9 +293,7 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
         
         for entity_name, entity_data in entity_config.items():
             # Check entity type validity
-            try:
-                EntityType(entity_name)
-            except ValueError:
+            if entity_name not in _ENTITY_TYPE_MAP:
                 issues.append(f"Unknown entity type: {entity_name}")
             
             # Check count
@@ -242,10 +309,10 @@ def validate_config(config: Dict[str, Any]) -> List[str]:
     return issues
 
 
-def print_config_summary(config_path: str = "config.yaml"):
-    """Print a summary of the configuration"""
+def print_config_summary(config_or_path: Union[str, Path, Dict[str, Any]] = "config.yaml"):
+    """Print a summary of the configuration from a config dict or file path"""
     try:
-        config = load_config(config_path)
+        config = _resolve_config(config_or_path)
         
         print("=" * 50)
         print("CONFIGURATION SUMMARY")
@@ -290,14 +357,15 @@ def print_config_summary(config_path: str = "config.yaml"):
 
 if __name__ == "__main__":
     # Example usage
-    print_config_summary()
-    
     try:
-        engine = create_placement_engine_from_config()
+        config = load_config()
+        print_config_summary(config)
+        
+        engine = create_placement_engine_from_dict(config)
         result = engine.place_all_entities()
         
         print(f"\nPlacement completed!")
-        print(f"Total placements: {sum(len(p) for p in result.placements.values())}")
+        print(f"Total placements: {result.total_entity_count()}")
         print(f"Feasibility notes: {len(result.feasibility_notes)}")
         
     except ConfigurationError as e:
@@ -7,9 +7,10 @@ and automated processing. Supports JSON, CSV, XML, and custom formats.
 
 import json
 import csv
+from itertools import repeat
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import IO, Dict, Iterable, Iterator, List, Any, NamedTuple, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 import time
 from datetime import datetime
@@ -18,9 +19,8 @@ from .stratified_placement import PlacementResult, EntityType, GridCell, GridReg
 from .placement_metrics import PlacementMetrics
 
 
-@dataclass 
-class SimulationEntity:
-    """Entity definition for simulation pipeline"""
+class SimulationEntity(NamedTuple):
+    """Entity definition for simulation pipeline (field order matches CSV columns)"""
     name: str  # e.g., acinlet_x5_y3
     type: str  # vinlet, voutlet, acinlet, acoutlet
     x: int
@@ -37,10 +37,27 @@ class PlacementConfiguration:
 class PlacementExporter:
     """Exports placement results to CSV format for simulation"""
     
+    # Output directories already created in this process, shared by all
+    # exporters so sweeps writing into one directory mkdir it only once
+    _ensured_dirs: Set[Path] = set()
+    
     def __init__(self):
         """Initialize exporter"""
         pass
     
+    def _open_output(self, output_file: Path, mode: str, **kwargs) -> IO:
+        """Open an output file, creating its directory the first time it is seen"""
+        parent = output_file.parent
+        if parent not in self._ensured_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(parent)
+        try:
+            return open(output_file, mode, **kwargs)
+        except FileNotFoundError:
+            # Directory was removed after it was cached
+            parent.mkdir(parents=True, exist_ok=True)
+            return open(output_file, mode, **kwargs)
+    
     def create_simulation_config(self, 
                                 result: PlacementResult,
                                 grid_region: GridRegion) -> PlacementConfiguration:
@@ -59,26 +76,11 @@ class PlacementExporter:
             'timestamp': datetime.now().isoformat(),
             'generator': 'stratified_placement_system',
             'grid_size': f'{grid_region.width}x{grid_region.height}',
-            'total_entities': sum(len(p) for p in result.placements.values())
+            'total_entities': result.total_entity_count()
         }
         
         # Convert placements to simulation entities with name convention
-        sim_entities = []
-        
-        for entity_type, placements in result.placements.items():
-            type_name = entity_type.value
-            
-            for placement in placements:
-                # Create name with format: type_xN_yN
-                entity_name = f'{type_name}_x{placement.x}_y{placement.y}'
-                
-                entity = SimulationEntity(
-                    name=entity_name,
-                    type=type_name,
-                    x=placement.x,
-                    y=placement.y
-                )
-                sim_entities.append(entity)
+        sim_entities = list(map(SimulationEntity._make, _entity_rows(result)))
         
         return PlacementConfiguration(
             entities=sim_entities,
@@ -90,24 +92,71 @@ class PlacementExporter:
                   output_path: str) -> str:
         """Export entity list to CSV format"""
         output_file = Path(output_path)
-        output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
-            # Header
-            writer.writerow(['name', 'type', 'x', 'y'])
-            
-            # Entity data
-            for entity in config.entities:
-                writer.writerow([
-                    entity.name,
-                    entity.type, 
-                    entity.x,
-                    entity.y
-                ])
+        # Entity fields are already in column order
+        with self._open_output(output_file, 'w', newline='', buffering=1 << 20) as f:
+            _write_csv_rows(f, config.entities)
+        
+        return str(output_file)
+    
+    def export_metadata(self,
+                        config: PlacementConfiguration,
+                        output_path: str) -> str:
+        """Export configuration metadata to a JSON sidecar file (e.g. <name>.meta.json)"""
+        output_file = Path(output_path)
+        
+        # orjson is optional and only imported when metadata is written
+        try:
+            import orjson
+        except ImportError:
+            data = json.dumps(config.metadata, indent=2, ensure_ascii=False).encode('utf-8')
+        else:
+            data = orjson.dumps(config.metadata, option=orjson.OPT_INDENT_2)
+        with self._open_output(output_file, 'wb') as f:
+            f.write(data)
         
         return str(output_file)
+    
+    def export_result_to_csv(self,
+                             result: PlacementResult,
+                             output_path: str) -> str:
+        """
+        Export placement result straight to CSV
+        
+        Streams rows from the result without building a PlacementConfiguration;
+        the file matches create_simulation_config followed by export_csv.
+        """
+        output_file = Path(output_path)
+        
+        with self._open_output(output_file, 'w', newline='', buffering=1 << 20) as f:
+            _write_csv_rows(f, _entity_rows(result))
+        
+        return str(output_file)
+
+
+def _entity_rows(result: PlacementResult) -> Iterator[Tuple[str, str, int, int]]:
+    """Yield (name, type, x, y) per placement with names of the form type_xN_yN"""
+    for entity_type, placements in result.placements.items():
+        type_name = entity_type.value
+        
+        # Column-wise per entity type: read coordinates once, then format
+        # names from a fixed prefix
+        xs = [cell.x for cell in placements]
+        ys = [cell.y for cell in placements]
+        prefix = f'{type_name}_x'
+        names = [f'{prefix}{x}_y{y}' for x, y in zip(xs, ys)]
+        
+        yield from zip(names, repeat(type_name), xs, ys)
+
+
+def _write_csv_rows(f: IO, rows: Iterable[Tuple[str, str, int, int]]) -> None:
+    """Write the CSV header and entity rows"""
+    writer = csv.writer(f)
+    
+    # Header
+    writer.writerow(['name', 'type', 'x', 'y'])
+    
+    writer.writerows(rows)
 
 
 def create_placement_file(result: PlacementResult,
@@ -125,13 +174,12 @@ def create_placement_file(result: PlacementResult,
         Path to generated CSV file
     """
     if output_name is None:
-        timestamp = int(time.time())
+        timestamp = time.time_ns() // 1_000_000_000
         output_name = f"placement_{timestamp}"
     
     exporter = PlacementExporter()
-    config = exporter.create_simulation_config(result, grid_region)
     
-    return exporter.export_csv(config, f"output/{output_name}.csv")
+    return exporter.export_result_to_csv(result, f"output/{output_name}.csv")
 
 
 if __name__ == "__main__":
@@ -6,13 +6,13 @@ the acceptance criteria defined in placement_plan.md
 """
 
 import math
-from typing import Dict, List, Tuple, Set, Any
-from collections import defaultdict, Counter
-import statistics
+import importlib.util
+from typing import Dict, List, Tuple, Set, Any, Optional
+import numpy as np
 
 from .stratified_placement import (
     GridCell, Entity, GridRegion, Stratification, PlacementResult,
-    EntityType, euclidean_distance
+    EntityType
 )
 
 
@@ -23,12 +23,47 @@ class PlacementMetrics:
                  grid_region: GridRegion,
                  stratification: Stratification,
                  entities: List[Entity],
-                 cross_entity_radius: float = 1.0):
+                 cross_entity_radius: float = 1.0,
+                 include_distances: bool = False):
+        """
+        Args:
+            grid_region: Grid the placements live on
+            stratification: Band stratification used for quotas and coverage
+            entities: Entity definitions
+            cross_entity_radius: Minimum distance between different entities
+            include_distances: Also store every pairwise distance under
+                'distances' in separation metrics (debugging only; O(N^2) memory)
+        """
         self.grid_region = grid_region
         self.stratification = stratification
         self.entities = entities
         self.cross_entity_radius = cross_entity_radius
+        self.include_distances = include_distances
         self.entity_map = {e.entity_type: e for e in entities}
+        
+        # Row -> band index lookup (-1 for rows outside every band); filled in
+        # reverse so the first matching band wins, as with contains_cell scans
+        max_row = max([grid_region.height] + [band.y_max for band in stratification.bands])
+        self._row_to_band = np.full(max_row + 1, -1, dtype=np.int32)
+        for band in reversed(stratification.bands):
+            self._row_to_band[max(band.y_min, 0):band.y_max + 1] = band.index
+        
+        # Allowed rows per entity (coverage) and their sorted array form
+        # (histogram bins), plus every grid row for the union histogram
+        self._allowed_rows = {
+            e.entity_type: frozenset(cell.y for cell in e.allowed_region)
+            for e in entities
+        }
+        self._allowed_rows_sorted = {
+            entity_type: np.array(sorted(rows), dtype=np.intp)
+            for entity_type, rows in self._allowed_rows.items()
+        }
+        self._grid_rows = np.arange(1, grid_region.height + 1, dtype=np.intp)
+    
+    def _band_indices(self, ys: np.ndarray) -> np.ndarray:
+        """Band index for each row (-1 if the row is in no band)"""
+        in_table = (ys >= 0) & (ys < len(self._row_to_band))
+        return np.where(in_table, self._row_to_band[np.where(in_table, ys, 0)], -1)
     
     def analyze_placement(self, result: PlacementResult) -> Dict[str, Any]:
         """
@@ -37,11 +72,15 @@ class PlacementMetrics:
         Returns:
             Dictionary containing all metrics and analysis results
         """
+        # Coordinates are pulled out of the GridCell lists once and shared
+        xy = _placement_arrays(result)
+        all_ys = _union_rows(xy)
+        
         metrics = {
-            'quota_satisfaction': self._analyze_quota_satisfaction(result),
-            'coverage_metrics': self._analyze_coverage_metrics(result),
-            'separation_metrics': self._analyze_separation_metrics(result),
-            'distribution_histograms': self._generate_distribution_histograms(result),
+            'quota_satisfaction': self._analyze_quota_satisfaction(result, xy),
+            'coverage_metrics': self._analyze_coverage_metrics(result, xy, all_ys),
+            'separation_metrics': self._analyze_separation_metrics(result, xy),
+            'distribution_histograms': self._generate_distribution_histograms(result, xy, all_ys),
             'feasibility_summary': self._generate_feasibility_summary(result),
             'overall_quality_score': 0.0  # Will be calculated at the end
         }
@@ -51,25 +90,33 @@ class PlacementMetrics:
         
         return metrics
     
-    def _analyze_quota_satisfaction(self, result: PlacementResult) -> Dict[str, Any]:
+    def _occupied_bands(self, ys: np.ndarray) -> List[int]:
+        """Sorted indices of bands containing at least one of the rows"""
+        band_idx = self._band_indices(ys)
+        return np.unique(band_idx[band_idx >= 0]).tolist()
+    
+    def _analyze_quota_satisfaction(self, result: PlacementResult,
+                                    xy: Optional[Dict[EntityType, np.ndarray]] = None) -> Dict[str, Any]:
         """Analyze how well band quotas were satisfied"""
         quota_analysis = {}
+        if xy is None:
+            xy = _placement_arrays(result)
         
         for entity in self.entities:
             entity_type = entity.entity_type
             if entity_type not in result.placements:
                 continue
             
-            placements = result.placements[entity_type]
             quotas = self.stratification.calculate_quotas(entity)
             
-            # Count actual placements per band
-            actual_per_band = defaultdict(int)
-            for placement in placements:
-                for band in self.stratification.bands:
-                    if band.contains_cell(placement):
-                        actual_per_band[band.index] += 1
-                        break
+            # Count actual placements per band (bands in order of first placement)
+            placement_bands = self._band_indices(xy[entity_type][:, 1])
+            placement_bands = placement_bands[placement_bands >= 0]
+            band_counts = np.bincount(placement_bands, minlength=len(self.stratification.bands))
+            actual_per_band = {
+                index: int(band_counts[index])
+                for index in dict.fromkeys(placement_bands.tolist())
+            }
             
             # Calculate satisfaction metrics
             quota_diffs = {}
@@ -77,7 +124,7 @@ class PlacementMetrics:
             max_deviation = 0
             
             for band_idx, expected in quotas.items():
-                actual = actual_per_band[band_idx]
+                actual = actual_per_band.setdefault(band_idx, 0)
                 diff = actual - expected
                 quota_diffs[band_idx] = diff
                 total_deviation += abs(diff)
@@ -85,7 +132,7 @@ class PlacementMetrics:
             
             quota_analysis[entity_type.value] = {
                 'expected_quotas': quotas,
-                'actual_per_band': dict(actual_per_band),
+                'actual_per_band': actual_per_band,
                 'quota_differences': quota_diffs,
                 'total_deviation': total_deviation,
                 'max_deviation': max_deviation,
@@ -94,9 +141,13 @@ class PlacementMetrics:
         
         return quota_analysis
     
-    def _analyze_coverage_metrics(self, result: PlacementResult) -> Dict[str, Any]:
+    def _analyze_coverage_metrics(self, result: PlacementResult,
+                                  xy: Optional[Dict[EntityType, np.ndarray]] = None,
+                                  all_ys: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Analyze row/band coverage and distribution uniformity"""
         coverage = {}
+        if xy is None:
+            xy = _placement_arrays(result)
         
         # Per-entity coverage
         for entity in self.entities:
@@ -104,57 +155,48 @@ class PlacementMetrics:
             if entity_type not in result.placements:
                 continue
             
-            placements = result.placements[entity_type]
+            ys = xy[entity_type][:, 1]
             
             # Band coverage
-            bands_occupied = set()
-            for placement in placements:
-                for band in self.stratification.bands:
-                    if band.contains_cell(placement):
-                        bands_occupied.add(band.index)
-                        break
+            bands_occupied = self._occupied_bands(ys)
             
             band_coverage_rate = len(bands_occupied) / len(self.stratification.bands)
             
             # Row coverage within allowed region
-            allowed_rows = {cell.y for cell in entity.allowed_region}
-            occupied_rows = {placement.y for placement in placements}
+            allowed_rows = self._allowed_rows[entity_type]
+            occupied_rows = np.unique(ys).tolist()
             row_coverage_rate = len(occupied_rows) / len(allowed_rows) if allowed_rows else 0
             
             coverage[entity_type.value] = {
                 'band_coverage_rate': band_coverage_rate,
-                'bands_occupied': sorted(bands_occupied),
+                'bands_occupied': bands_occupied,
                 'row_coverage_rate': row_coverage_rate,
-                'rows_occupied': sorted(occupied_rows),
+                'rows_occupied': occupied_rows,
                 'total_allowed_rows': len(allowed_rows)
             }
         
         # Union coverage
-        all_placements = []
-        for placements in result.placements.values():
-            all_placements.extend(placements)
-        
-        union_bands = set()
-        union_rows = set()
-        for placement in all_placements:
-            union_rows.add(placement.y)
-            for band in self.stratification.bands:
-                if band.contains_cell(placement):
-                    union_bands.add(band.index)
-                    break
+        if all_ys is None:
+            all_ys = _union_rows(xy)
+        union_rows = np.unique(all_ys).tolist()
+        union_bands = self._occupied_bands(all_ys)
         
         coverage['union'] = {
             'band_coverage_rate': len(union_bands) / len(self.stratification.bands),
-            'bands_occupied': sorted(union_bands),
+            'bands_occupied': union_bands,
             'row_coverage_rate': len(union_rows) / self.grid_region.height,
-            'rows_occupied': sorted(union_rows)
+            'rows_occupied': union_rows
         }
         
         return coverage
     
-    def _analyze_separation_metrics(self, result: PlacementResult) -> Dict[str, Any]:
+    def _analyze_separation_metrics(self, result: PlacementResult,
+                                    xy: Optional[Dict[EntityType, np.ndarray]] = None) -> Dict[str, Any]:
         """Analyze minimum separation distances"""
         separation = {}
+        if xy is None:
+            xy = _placement_arrays(result)
+        coords = {entity_type: points.astype(np.float64) for entity_type, points in xy.items()}
         
         # Intra-entity separation
         for entity in self.entities:
@@ -162,65 +204,43 @@ class PlacementMetrics:
             if entity_type not in result.placements:
                 continue
             
-            placements = result.placements[entity_type]
-            if len(placements) < 2:
+            points = coords[entity_type]
+            if len(points) < 2:
                 separation[f'{entity_type.value}_intra'] = {
                     'min_distance': float('inf'),
                     'mean_distance': float('inf'),
-                    'distances': [],
-                    'violations': 0
+                    'total_pairs': 0,
+                    'violations': 0,
+                    'required_radius': entity.intra_radius
                 }
+                if self.include_distances:
+                    separation[f'{entity_type.value}_intra']['distances'] = []
                 continue
             
-            distances = []
-            violations = 0
-            
-            for i, p1 in enumerate(placements):
-                for p2 in placements[i+1:]:
-                    dist = euclidean_distance(p1, p2)
-                    distances.append(dist)
-                    if dist < entity.intra_radius:
-                        violations += 1
-            
-            separation[f'{entity_type.value}_intra'] = {
-                'min_distance': min(distances) if distances else float('inf'),
-                'mean_distance': statistics.mean(distances) if distances else float('inf'),
-                'distances': distances,
-                'violations': violations,
-                'required_radius': entity.intra_radius
-            }
+            separation[f'{entity_type.value}_intra'] = _summarize_pair_distances(
+                points, points, entity.intra_radius, same_set=True,
+                include_distances=self.include_distances
+            )
         
         # Cross-entity separation
         entity_types = list(result.placements.keys())
         for i, type1 in enumerate(entity_types):
             for type2 in entity_types[i+1:]:
-                placements1 = result.placements[type1]
-                placements2 = result.placements[type2]
-                
-                distances = []
-                violations = 0
-                
-                for p1 in placements1:
-                    for p2 in placements2:
-                        dist = euclidean_distance(p1, p2)
-                        distances.append(dist)
-                        if dist < self.cross_entity_radius:
-                            violations += 1
-                
                 key = f'{type1.value}_{type2.value}_cross'
-                separation[key] = {
-                    'min_distance': min(distances) if distances else float('inf'),
-                    'mean_distance': statistics.mean(distances) if distances else float('inf'),
-                    'distances': distances,
-                    'violations': violations,
-                    'required_radius': self.cross_entity_radius
-                }
+                separation[key] = _summarize_pair_distances(
+                    coords[type1], coords[type2], self.cross_entity_radius,
+                    include_distances=self.include_distances
+                )
         
         return separation
     
-    def _generate_distribution_histograms(self, result: PlacementResult) -> Dict[str, Any]:
+    def _generate_distribution_histograms(self, result: PlacementResult,
+                                          xy: Optional[Dict[EntityType, np.ndarray]] = None,
+                                          all_ys: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Generate 1D histograms for distribution analysis"""
         histograms = {}
+        if xy is None:
+            xy = _placement_arrays(result)
         
         # Y-axis (row) histograms for each entity
         for entity in self.entities:
@@ -228,54 +248,36 @@ class PlacementMetrics:
             if entity_type not in result.placements:
                 continue
             
-            placements = result.placements[entity_type]
-            y_coords = [p.y for p in placements]
-            
-            # Create histogram bins
-            y_counts = Counter(y_coords)
-            all_y_in_region = sorted({cell.y for cell in entity.allowed_region})
-            
-            histogram = {y: y_counts.get(y, 0) for y in all_y_in_region}
-            
-            # Calculate uniformity metrics
-            counts = list(histogram.values())
-            if counts:
-                uniformity_score = 1.0 - (statistics.stdev(counts) / statistics.mean(counts)) if statistics.mean(counts) > 0 else 0
-            else:
-                uniformity_score = 0
-            
-            histograms[f'{entity_type.value}_y'] = {
-                'histogram': histogram,
-                'uniformity_score': max(0, uniformity_score),  # Clamp to [0, 1]
-                'mean_count': statistics.mean(counts) if counts else 0,
-                'std_dev': statistics.stdev(counts) if len(counts) > 1 else 0
-            }
+            histograms[f'{entity_type.value}_y'] = self._row_histogram(
+                xy[entity_type][:, 1], self._allowed_rows_sorted[entity_type]
+            )
         
         # Union histogram
-        all_placements = []
-        for placements in result.placements.values():
-            all_placements.extend(placements)
+        if all_ys is None:
+            all_ys = _union_rows(xy)
+        histograms['union_y'] = self._row_histogram(all_ys, self._grid_rows)
         
-        y_coords = [p.y for p in all_placements]
-        y_counts = Counter(y_coords)
-        all_y = list(range(1, self.grid_region.height + 1))
-        
-        union_histogram = {y: y_counts.get(y, 0) for y in all_y}
-        counts = list(union_histogram.values())
+        return histograms
+    
+    def _row_histogram(self, ys: np.ndarray, rows: np.ndarray) -> Dict[str, Any]:
+        """Count placements per row over the given rows and score how evenly they spread"""
+        # Match each y to its slot in the sorted rows; rows may lie off the
+        # grid (explicit cell lists) and ys outside rows are not counted
+        slots = np.searchsorted(rows, ys)
+        matched = slots < len(rows)
+        matched[matched] = rows[slots[matched]] == ys[matched]
+        counts = np.bincount(slots[matched], minlength=len(rows))
         
-        if counts and sum(counts) > 0:
-            uniformity_score = 1.0 - (statistics.stdev(counts) / statistics.mean(counts))
-        else:
-            uniformity_score = 0
+        mean_count = float(counts.mean()) if len(counts) else 0
+        std_dev = float(counts.std(ddof=1)) if len(counts) > 1 else 0
+        uniformity_score = 1.0 - (std_dev / mean_count) if mean_count > 0 else 0
         
-        histograms['union_y'] = {
-            'histogram': union_histogram,
-            'uniformity_score': max(0, uniformity_score),
-            'mean_count': statistics.mean(counts) if counts else 0,
-            'std_dev': statistics.stdev(counts) if len(counts) > 1 else 0
+        return {
+            'histogram': dict(zip(rows.tolist(), counts.tolist())),
+            'uniformity_score': max(0, uniformity_score),  # Clamp to [0, 1]
+            'mean_count': mean_count,
+            'std_dev': std_dev
         }
-        
-        return histograms
     
     def _generate_feasibility_summary(self, result: PlacementResult) -> Dict[str, Any]:
         """Generate summary of feasibility constraints and relaxations"""
@@ -296,7 +298,7 @@ class PlacementMetrics:
             quota_scores.append(entity_metrics['quota_satisfaction_rate'])
         
         if quota_scores:
-            score_components.append(statistics.mean(quota_scores))
+            score_components.append(_mean(quota_scores))
         
         # Coverage score (0-1)
         coverage_scores = []
@@ -305,14 +307,14 @@ class PlacementMetrics:
                 coverage_scores.append((coverage['band_coverage_rate'] + coverage['row_coverage_rate']) / 2)
         
         if coverage_scores:
-            score_components.append(statistics.mean(coverage_scores))
+            score_components.append(_mean(coverage_scores))
         
         # Separation score (penalty for violations)
         violation_penalty = 0
         total_pairs = 0
         for sep_name, sep_metrics in metrics['separation_metrics'].items():
             violations = sep_metrics['violations']
-            total_distances = len(sep_metrics['distances'])
+            total_distances = sep_metrics['total_pairs']
             if total_distances > 0:
                 violation_penalty += violations / total_distances
                 total_pairs += 1
@@ -327,10 +329,129 @@ class PlacementMetrics:
             uniformity_scores.append(hist_data['uniformity_score'])
         
         if uniformity_scores:
-            score_components.append(statistics.mean(uniformity_scores))
+            score_components.append(_mean(uniformity_scores))
         
         # Overall score is the mean of all components
-        return statistics.mean(score_components) if score_components else 0.0
+        return _mean(score_components) if score_components else 0.0
+
+
+def _mean(values: List[float]) -> float:
+    """Arithmetic mean in one pass (values must be non-empty)"""
+    return math.fsum(values) / len(values)
+
+
+def _placement_arrays(result: PlacementResult) -> Dict[EntityType, np.ndarray]:
+    """Stack each entity's placements into an (N, 2) int32 array of (x, y) coordinates"""
+    return {
+        entity_type: np.fromiter(
+            (v for cell in placements for v in (cell.x, cell.y)),
+            dtype=np.int32, count=2 * len(placements)
+        ).reshape(-1, 2)
+        for entity_type, placements in result.placements.items()
+    }
+
+
+def _union_rows(xy: Dict[EntityType, np.ndarray]) -> np.ndarray:
+    """Row coordinates of all placements, in entity order"""
+    if not xy:
+        return np.empty(0, dtype=np.int32)
+    return np.concatenate([points[:, 1] for points in xy.values()])
+
+
+# numba itself is only imported (by _sep_kernels) when separation is first analyzed
+_NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Upper bound on pair distances held in memory at once by _summarize_pair_distances
+_PAIR_BLOCK_SIZE = 1 << 20
+
+
+def _summarize_pair_distances(points_a: np.ndarray,
+                              points_b: np.ndarray,
+                              required_radius: float,
+                              same_set: bool = False,
+                              include_distances: bool = False) -> Dict[str, Any]:
+    """
+    Reduce pairwise distances to summary statistics and violation count
+    
+    Distances are evaluated in blocks of rows of points_a and folded into
+    running min/sum/count totals, so memory stays bounded regardless of the
+    number of pairs. With same_set=True each unordered pair (i < j) of
+    points_a is counted once and points_b is ignored. include_distances
+    additionally returns every distance as a list (unbounded memory).
+    """
+    if _NUMBA_AVAILABLE and not include_distances:
+        from . import _sep_kernels
+        if _sep_kernels.NUMBA_AVAILABLE:
+            return _summarize_pair_distances_compiled(points_a, points_b, required_radius, same_set)
+    
+    if same_set:
+        points_b = points_a
+    
+    rows_per_block = max(1, _PAIR_BLOCK_SIZE // max(1, len(points_b)))
+    # Violations are counted on squared distances against the squared radius
+    required_r2 = required_radius * required_radius
+    min_distance = float('inf')
+    total = 0.0
+    total_pairs = 0
+    violations = 0
+    distances = []
+    
+    for start in range(0, len(points_a), rows_per_block):
+        stop = min(start + rows_per_block, len(points_a))
+        if same_set:
+            # Only columns j > i for each row i of this block
+            others = points_b[start + 1:]
+            diff = points_a[start:stop, None, :] - others[None, :, :]
+            d2 = (diff * diff).sum(axis=-1)
+            upper = np.arange(start + 1, len(points_b))[None, :] > np.arange(start, stop)[:, None]
+            d2 = d2[upper]
+        else:
+            diff = points_a[start:stop, None, :] - points_b[None, :, :]
+            d2 = (diff * diff).sum(axis=-1).ravel()
+        
+        if len(d2) == 0:
+            continue
+        
+        violations += int((d2 < required_r2).sum())
+        min_distance = min(min_distance, math.sqrt(d2.min()))
+        block_distances = np.sqrt(d2)
+        total += float(block_distances.sum())
+        total_pairs += len(d2)
+        if include_distances:
+            distances.extend(block_distances.tolist())
+    
+    summary = {
+        'min_distance': min_distance,
+        'mean_distance': total / total_pairs if total_pairs else float('inf'),
+        'total_pairs': total_pairs,
+        'violations': violations,
+        'required_radius': required_radius
+    }
+    if include_distances:
+        summary['distances'] = distances
+    return summary
+
+
+def _summarize_pair_distances_compiled(points_a: np.ndarray,
+                                       points_b: np.ndarray,
+                                       required_radius: float,
+                                       same_set: bool) -> Dict[str, Any]:
+    """Single-pass numba version of _summarize_pair_distances (no distance list)"""
+    from ._sep_kernels import pairwise_intra, pairwise_cross
+    
+    required_r2 = required_radius * required_radius
+    if same_set:
+        min_distance, total, total_pairs, violations = pairwise_intra(points_a, required_r2)
+    else:
+        min_distance, total, total_pairs, violations = pairwise_cross(points_a, points_b, required_r2)
+    
+    return {
+        'min_distance': float(min_distance),
+        'mean_distance': total / total_pairs if total_pairs else float('inf'),
+        'total_pairs': int(total_pairs),
+        'violations': int(violations),
+        'required_radius': required_radius
+    }
 
 
 def print_placement_report(metrics: Dict[str, Any], detailed: bool = True) -> str:
@@ -0,0 +1,93 @@
+"""
+Placement Result Cache
+
+On-disk memoization of (result, metrics) pairs keyed by the configuration
+file contents and random seed, so repeated runs of an unchanged
+configuration skip the placement engine entirely.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+# Bump when PlacementResult, the metrics layout or the placements produced
+# for a given seed change so stale pickles are never returned
+CACHE_VERSION = 4
+
+DEFAULT_CACHE_DIR = Path("output/.cache")
+DEFAULT_MAX_ENTRIES = 100
+
+
+def cache_key(config_bytes: bytes, seed: Any) -> str:
+    """
+    Compute cache key for a configuration and seed
+
+    Args:
+        config_bytes: Raw configuration file contents
+        seed: Random seed used by the placement engine
+
+    Returns:
+        Hex digest identifying the cache entry
+    """
+    digest = hashlib.sha256()
+    digest.update(f"v{CACHE_VERSION}\0".encode())
+    digest.update(config_bytes)
+    digest.update(f"\0{seed}".encode())
+    return digest.hexdigest()
+
+
+def load_or_compute(config_bytes: bytes,
+                    seed: Any,
+                    compute_fn: Callable[[], Tuple[Any, Any]],
+                    cache_dir: Optional[Path] = None,
+                    max_entries: int = DEFAULT_MAX_ENTRIES) -> Tuple[Any, Any]:
+    """
+    Return cached (result, metrics) for a configuration, computing on a miss
+
+    Unreadable cache entries are treated as misses. Entries are evicted
+    least-recently-used first once more than max_entries are stored.
+
+    Args:
+        config_bytes: Raw configuration file contents
+        seed: Random seed used by the placement engine
+        compute_fn: Callable producing (result, metrics) on a cache miss
+        cache_dir: Cache directory (default: output/.cache)
+        max_entries: Maximum number of cached entries to keep
+
+    Returns:
+        Tuple of (result, metrics)
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    cache_file = cache_dir / f"{cache_key(config_bytes, seed)}.pkl"
+
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+            cache_file.touch()  # Mark as recently used
+            return cached
+        except Exception:
+            pass  # Corrupt or incompatible entry; recompute below
+
+    value = compute_fn()
+
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+        _evict_old_entries(cache_dir, max_entries)
+    except OSError:
+        pass  # Caching is best-effort
+
+    return value
+
+
+def _evict_old_entries(cache_dir: Path, max_entries: int) -> None:
+    """Delete least recently used entries beyond max_entries"""
+    entries = sorted(cache_dir.glob("*.pkl"), key=lambda p: p.stat().st_mtime, reverse=True)
+    for stale in entries[max_entries:]:
+        stale.unlink(missing_ok=True)
@@ -5,12 +5,16 @@ Implements the full methodology from placement_plan.md for optimal placement
 of multiple entity types on rectangular grids with stratification guarantees.
 """
 
+import importlib.util
 import math
 import random
-from typing import List, Tuple, Dict, Set, Optional, Any
+from collections.abc import Set as AbstractSet
+from typing import AbstractSet as AbstractSetType, List, Tuple, Dict, Set, Optional, Any
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
 
 class EntityType(Enum):
     """Entity types for HVAC components"""
@@ -23,9 +27,18 @@ class EntityType(Enum):
 @dataclass
 class GridCell:
     """Represents a discrete grid cell with integer coordinates"""
+    # No per-instance __dict__: cells are created and hashed in bulk
+    __slots__ = ('x', 'y')
+    
     x: int
     y: int
     
+    def __eq__(self, other) -> bool:
+        # Field-wise comparison without building tuples (set/dict hits call this)
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.x == other.x and self.y == other.y
+    
     def __hash__(self) -> int:
         return hash((self.x, self.y))
     
@@ -38,6 +51,8 @@ class GridCell:
 @dataclass
 class NormalizedPoint:
     """Normalized coordinates in [0,1] x [0,1] space"""
+    __slots__ = ('x', 'y')
+    
     x: float
     y: float
     
@@ -46,6 +61,61 @@ class NormalizedPoint:
         dx = self.x - other.x
         dy = (self.y - other.y) * anisotropy_y
         return math.sqrt(dx*dx + dy*dy)
+    
+    def distance_sq_to(self, other: 'NormalizedPoint', anisotropy_y: float = 1.0) -> float:
+        """Squared anisotropic distance, for comparisons that do not need the root"""
+        dx = self.x - other.x
+        dy = (self.y - other.y) * anisotropy_y
+        return dx*dx + dy*dy
+
+
+class AllowedRegion(AbstractSet):
+    """
+    Read-only set of grid cells backed by a boolean row/column mask
+    
+    Behaves like a Set[GridCell] (membership, len, iteration, comparison
+    with ordinary sets) but stores one byte per grid cell; GridCell
+    objects are only created when the region is iterated.
+    """
+    
+    def __init__(self, mask: np.ndarray):
+        """
+        Args:
+            mask: Boolean array of shape (height, width); mask[y-1, x-1] marks cell (x, y)
+        """
+        self.mask = np.array(mask, dtype=bool)
+        self.mask.setflags(write=False)
+        self._height, self._width = self.mask.shape
+        self._flat = self.mask.tobytes()  # Fast scalar membership lookups
+        self._count = int(np.count_nonzero(self.mask))
+    
+    @classmethod
+    def _from_iterable(cls, iterable) -> Set[GridCell]:
+        """Set operators (&, |, -) return ordinary sets"""
+        return set(iterable)
+    
+    def __contains__(self, cell) -> bool:
+        if not isinstance(cell, GridCell):
+            return False
+        x = cell.x - 1
+        y = cell.y - 1
+        return 0 <= x < self._width and 0 <= y < self._height and self._flat[y * self._width + x] != 0
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __iter__(self):
+        ys, xs = np.nonzero(self.mask)
+        return map(GridCell, (xs + 1).tolist(), (ys + 1).tolist())
+    
+    def __repr__(self) -> str:
+        return f"AllowedRegion({self._count} of {self._width}x{self._height} cells)"
+    
+    def cells_in_rows(self, y_min: int, y_max: int) -> Set[GridCell]:
+        """Get allowed cells with y_min <= y <= y_max, scanning only those rows"""
+        lo = max(y_min, 1) - 1
+        ys, xs = np.nonzero(self.mask[lo:max(y_max, lo)])
+        return set(map(GridCell, (xs + 1).tolist(), (ys + lo + 1).tolist()))
 
 
 @dataclass
@@ -53,7 +123,7 @@ class Entity:
     """Entity definition with placement constraints"""
     entity_type: EntityType
     count: int
-    allowed_region: Set[GridCell]
+    allowed_region: AbstractSetType[GridCell]  # Set[GridCell] or AllowedRegion
     intra_radius: float = 1.0  # Minimum distance between same entities
     color: str = "blue"  # For visualization
     
@@ -75,6 +145,11 @@ class GridRegion:
             y=(cell.y - 0.5) / self.height
         )
     
+    def normalize_cells(self, cells: List[GridCell]) -> np.ndarray:
+        """Convert grid cells to an (N, 2) array of normalized coordinates"""
+        coords = np.array([(cell.x, cell.y) for cell in cells], dtype=np.float64).reshape(-1, 2)
+        return (coords - 0.5) / (self.width, self.height)
+    
     def denormalize_point(self, point: NormalizedPoint) -> GridCell:
         """Convert normalized point back to grid cell"""
         return GridCell(
@@ -99,8 +174,10 @@ class Band:
         """Check if cell falls within this band"""
         return self.y_min <= cell.y <= self.y_max
     
-    def get_cells_in_region(self, region: Set[GridCell]) -> Set[GridCell]:
+    def get_cells_in_region(self, region: AbstractSetType[GridCell]) -> Set[GridCell]:
         """Get all cells from region that fall within this band"""
+        if isinstance(region, AllowedRegion):
+            return region.cells_in_rows(self.y_min, self.y_max)
         return {cell for cell in region if self.contains_cell(cell)}
 
 
@@ -128,15 +205,22 @@ class Stratification:
     
     def calculate_quotas(self, entity: Entity) -> Dict[int, int]:
         """Calculate per-band quotas for an entity based on available cells per band"""
-        # Find which bands have cells in the entity's allowed region
-        band_cell_counts = {}
-        total_available = 0
+        # Count the entity's allowed cells per row (index y - 1), then per
+        # band as a difference of prefix sums over the band's rows
+        region = entity.allowed_region
+        if isinstance(region, AllowedRegion):
+            row_counts = region.mask.sum(axis=1)
+        else:
+            ys = np.fromiter((cell.y for cell in region), dtype=np.int64, count=len(region))
+            row_counts = np.bincount(ys[ys >= 1] - 1)
+        cumulative = np.concatenate(([0], np.cumsum(row_counts)))
         
+        band_cell_counts = {}
         for band in self.bands:
-            band_cells = band.get_cells_in_region(entity.allowed_region)
-            count = len(band_cells)
-            band_cell_counts[band.index] = count
-            total_available += count
+            lo = min(max(band.y_min, 1) - 1, len(row_counts))
+            hi = min(max(band.y_max, lo), len(row_counts))
+            band_cell_counts[band.index] = int(cumulative[hi] - cumulative[lo])
+        total_available = sum(band_cell_counts.values())
         
         if total_available == 0:
             return {band.index: 0 for band in self.bands}
@@ -184,6 +268,10 @@ class PlacementResult:
     def add_feasibility_note(self, note: str):
         """Add a feasibility constraint note"""
         self.feasibility_notes.append(note)
+    
+    def total_entity_count(self) -> int:
+        """Get total number of placements across all entity types"""
+        return sum(map(len, self.placements.values()))
 
 
 class PlacementEngine:
@@ -333,46 +421,77 @@ class PlacementEngine:
         if count >= len(free_cells):
             return free_cells[:]
         
+        coords = self.grid_region.normalize_cells(free_cells)
+        
         # Start with a random cell if no existing placements, otherwise start far from existing
         if not existing_placements:
-            start_cell = random.choice(free_cells)
+            start = free_cells.index(random.choice(free_cells))
         else:
             # Find cell farthest from all existing placements
-            def min_distance_to_existing(cell):
-                return min(self._cell_distance(cell, existing) for existing in existing_placements)
-            start_cell = max(free_cells, key=min_distance_to_existing)
-        
-        chosen = [start_cell]
-        remaining = [cell for cell in free_cells if cell != start_cell]
-        
-        if not remaining:
-            return chosen
-        
-        # Build distance map
-        nearest_dist = {}
-        for cell in remaining:
-            nearest_dist[cell] = self._cell_distance(cell, start_cell)
-        
-        # Iteratively add farthest points
-        while len(chosen) < count and remaining:
-            # Find cell with maximum distance to nearest chosen point
-            next_cell = max(remaining, key=lambda cell: nearest_dist[cell])
-            chosen.append(next_cell)
-            remaining.remove(next_cell)
-            
-            # Update distances for remaining cells
-            for cell in remaining:
-                dist_to_new = self._cell_distance(cell, next_cell)
-                if dist_to_new < nearest_dist[cell]:
-                    nearest_dist[cell] = dist_to_new
-        
-        return chosen
+            existing = self.grid_region.normalize_cells(existing_placements)
+            dx = coords[:, None, 0] - existing[None, :, 0]
+            dy = (coords[:, None, 1] - existing[None, :, 1]) * self.anisotropy_y
+            start = int((dx * dx + dy * dy).min(axis=1).argmax())
+        
+        # Iteratively add the cell farthest from its nearest chosen point
+        chosen = _farthest_point_indices(coords, start, count, self.anisotropy_y)
+        return [free_cells[i] for i in chosen]
+
+
+# numba itself is only imported (by _sampling_kernels) for samplings large
+# enough to repay its import and load time
+_NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+_COMPILED_FPS_MIN_WORK = 1 << 24
+
+
+def _farthest_point_indices(coords: np.ndarray, start: int, count: int,
+                            anisotropy_y: float) -> np.ndarray:
+    """
+    Greedily pick count points, each farthest from those already picked
+    
+    Distances are squared and anisotropic, as NormalizedPoint.distance_sq_to.
+    Ties resolve to the lowest index. Uses the compiled kernel for large
+    inputs when numba is installed.
+    
+    Args:
+        coords: (N, 2) normalized coordinates
+        start: Index of the first pick
+        count: Number of points to pick (1 <= count <= N)
+        anisotropy_y: Y-axis weighting factor
+    
+    Returns:
+        Indices into coords in pick order
+    """
+    if _NUMBA_AVAILABLE and len(coords) * count >= _COMPILED_FPS_MIN_WORK:
+        from . import _sampling_kernels
+        if _sampling_kernels.NUMBA_AVAILABLE:
+            return _sampling_kernels.farthest_point_indices(
+                np.ascontiguousarray(coords), int(start), int(count), float(anisotropy_y)
+            )
+    
+    chosen = np.empty(count, dtype=np.int64)
+    chosen[0] = start
+    dx = coords[:, 0] - coords[start, 0]
+    dy = (coords[:, 1] - coords[start, 1]) * anisotropy_y
+    nearest = dx * dx + dy * dy
+    nearest[start] = -np.inf  # Never picked again; stays -inf under minimum
     
-    def _cell_distance(self, cell1: GridCell, cell2: GridCell) -> float:
-        """Calculate anisotropic distance between two cells"""
-        p1 = self.grid_region.normalize_cell(cell1)
-        p2 = self.grid_region.normalize_cell(cell2)
-        return p1.distance_to(p2, self.anisotropy_y)
+    # Column views and scratch buffers reused by every update
+    xs = np.ascontiguousarray(coords[:, 0])
+    ys = np.ascontiguousarray(coords[:, 1])
+    d2 = np.empty_like(nearest)
+    for k in range(1, count):
+        best = int(nearest.argmax())
+        chosen[k] = best
+        np.subtract(xs, xs[best], out=dx)
+        np.subtract(ys, ys[best], out=dy)
+        np.multiply(dy, anisotropy_y, out=dy)
+        np.multiply(dx, dx, out=d2)
+        np.multiply(dy, dy, out=dy)
+        np.add(d2, dy, out=d2)
+        np.minimum(nearest, d2, out=nearest)
+        nearest[best] = -np.inf
+    return chosen
 
 
 def euclidean_distance(cell1: GridCell, cell2: GridCell) -> float:
@@ -380,6 +499,56 @@ def euclidean_distance(cell1: GridCell, cell2: GridCell) -> float:
     return math.sqrt((cell1.x - cell2.x)**2 + (cell1.y - cell2.y)**2)
 
 
+# Other points compared against all surviving move candidates at once
+_IMPROVEMENT_BLOCK_SIZE = 32
+
+# Above this many pairs, violating pairs are found through a bucket grid
+# instead of a full distance matrix
+_DENSE_PAIR_LIMIT = 1 << 16
+
+
+def _bucket_neighbour_pairs(coords1: np.ndarray, coords2: np.ndarray,
+                            radius: float, anisotropy_y: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Candidate (row, col) pairs lying in the same or adjacent buckets of a hash grid
+    
+    Buckets are radius wide in x and radius / anisotropy_y tall in y (padded
+    slightly against rounding), so every pair with anisotropic distance
+    below radius is included.
+    """
+    y_side = radius / abs(anisotropy_y) if anisotropy_y else np.inf
+    side = np.array([radius, y_side]) * (1 + 1e-9)
+    buckets1 = np.floor(coords1 / side).astype(np.int64)
+    buckets2 = np.floor(coords2 / side).astype(np.int64)
+    
+    # Shift so every neighbour bucket is non-negative, then key by (bx, by)
+    origin = np.minimum(buckets1.min(axis=0), buckets2.min(axis=0)) - 1
+    buckets1 -= origin
+    buckets2 -= origin
+    stride = int(max(buckets1[:, 1].max(), buckets2[:, 1].max())) + 2
+    keys2 = buckets2[:, 0] * stride + buckets2[:, 1]
+    order = np.argsort(keys2, kind='stable')
+    sorted_keys = keys2[order]
+    
+    rows, cols = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            keys1 = (buckets1[:, 0] + dx) * stride + (buckets1[:, 1] + dy)
+            start = np.searchsorted(sorted_keys, keys1, side='left')
+            counts = np.searchsorted(sorted_keys, keys1, side='right') - start
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            # Expand each row's [start, start + count) slice of sorted columns
+            offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            rows.append(np.repeat(np.arange(len(keys1)), counts))
+            cols.append(order[np.repeat(start, counts) + offsets])
+    
+    if not rows:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(rows), np.concatenate(cols)
+
+
 class BlueNoiseOptimizer:
     """Phase C optimizer implementing blue-noise refinement with separation constraints"""
     
@@ -395,6 +564,23 @@ class BlueNoiseOptimizer:
         self.cross_entity_radius = cross_entity_radius
         self.anisotropy_y = anisotropy_y
         self.entity_map = {e.entity_type: e for e in entities}
+        # Separation thresholds squared once, compared against squared distances
+        self._intra_r2 = {e.entity_type: e.intra_radius ** 2 for e in entities}
+        self._cross_r2 = cross_entity_radius ** 2
+        # Normalized (N, 2) coordinates per entity type, row i matching
+        # result.placements[entity_type][i] during optimize_placements
+        self._coords: Dict[EntityType, np.ndarray] = {}
+        # First band containing each row (bands may overlap or leave gaps)
+        self._band_of_row: Dict[int, Band] = {}
+        for band in stratification.bands:
+            for y in range(band.y_min, band.y_max + 1):
+                self._band_of_row.setdefault(y, band)
+        # Move count per entity type, and the last violating pair found per
+        # (type, type) keyed by the move counts it was computed at
+        self._generations: Dict[EntityType, int] = {}
+        self._pair_cache: Dict[Tuple[EntityType, EntityType], Tuple[Tuple[int, int], Optional[Tuple[int, int, float]]]] = {}
+        # Move candidates per (entity type, band index), built on first use
+        self._candidates: Dict[Tuple[EntityType, int], Tuple[List[GridCell], np.ndarray, Dict[GridCell, int]]] = {}
     
     def optimize_placements(self, result: PlacementResult, max_iterations: int = 100):
         """
@@ -403,6 +589,13 @@ class BlueNoiseOptimizer:
         Uses local swaps and nudges within bands to improve separation distances
         while maintaining quota satisfaction and regional constraints.
         """
+        self._coords = {
+            entity_type: self._normalized_coords(placements)
+            for entity_type, placements in result.placements.items()
+        }
+        self._generations = dict.fromkeys(result.placements, 0)
+        self._pair_cache = {}
+        
         for iteration in range(max_iterations):
             improvement_made = False
             
@@ -430,24 +623,14 @@ class BlueNoiseOptimizer:
         if len(placements) < 2:
             return False
         
-        entity = self.entity_map[entity_type]
+        # Find the pair with minimum separation, if it violates the radius
+        min_pair = self._violating_pair(entity_type, entity_type)
         
-        # Find the pair with minimum separation
-        min_distance = float('inf')
-        min_pair = None
-        
-        for i, p1 in enumerate(placements):
-            for j, p2 in enumerate(placements[i+1:], i+1):
-                dist = self._cell_distance(p1, p2)
-                if dist < min_distance:
-                    min_distance = dist
-                    min_pair = (i, j)
-        
-        if min_pair is None or min_distance >= entity.intra_radius:
+        if min_pair is None:
             return False
         
         # Try to move one of the points in the minimum pair
-        i, j = min_pair
+        i, j, _ = min_pair
         improved = False
         
         # Try moving the first point
@@ -465,23 +648,18 @@ class BlueNoiseOptimizer:
         if len(entity_types) < 2:
             return False
         
-        # Find the minimum cross-entity distance
-        min_distance = float('inf')
+        # Find the minimum (squared) cross-entity distance among violating pairs
+        min_distance_sq = float('inf')
         min_info = None
         
         for i, type1 in enumerate(entity_types):
             for type2 in entity_types[i+1:]:
-                placements1 = result.placements[type1]
-                placements2 = result.placements[type2]
-                
-                for idx1, p1 in enumerate(placements1):
-                    for idx2, p2 in enumerate(placements2):
-                        dist = self._cell_distance(p1, p2)
-                        if dist < min_distance:
-                            min_distance = dist
-                            min_info = (type1, idx1, type2, idx2)
-        
-        if min_info is None or min_distance >= self.cross_entity_radius:
+                min_pair = self._violating_pair(type1, type2)
+                if min_pair is not None and min_pair[2] < min_distance_sq:
+                    idx1, idx2, min_distance_sq = min_pair
+                    min_info = (type1, idx1, type2, idx2)
+        
+        if min_info is None:
             return False
         
         type1, idx1, type2, idx2 = min_info
@@ -494,6 +672,69 @@ class BlueNoiseOptimizer:
         
         return False
     
+    def _violating_pair(self, type1: EntityType, type2: EntityType) -> Optional[Tuple[int, int, float]]:
+        """
+        Closest pair below the separation radius within one entity type or between two
+        
+        Rescanned only after a point of either type has moved; otherwise the
+        pair found by the previous scan is returned.
+        """
+        generations = (self._generations[type1], self._generations[type2])
+        cached = self._pair_cache.get((type1, type2))
+        if cached is not None and cached[0] == generations:
+            return cached[1]
+        
+        if type1 == type2:
+            coords = self._coords[type1]
+            min_pair = self._closest_pair_within(coords, coords, self._intra_r2[type1], same_set=True)
+        else:
+            min_pair = self._closest_pair_within(self._coords[type1], self._coords[type2], self._cross_r2)
+        self._pair_cache[(type1, type2)] = (generations, min_pair)
+        return min_pair
+    
+    def _closest_pair_within(self, coords1: np.ndarray, coords2: np.ndarray, radius_sq: float,
+                             same_set: bool = False) -> Optional[Tuple[int, int, float]]:
+        """
+        Closest pair between two coordinate arrays, if closer than the radius
+        
+        Small inputs are scanned as a full distance matrix; larger ones only
+        compare pairs from neighbouring buckets of a radius-sized hash grid,
+        which finds every pair below the radius. With same_set=True only
+        pairs i < j of coords1 are considered.
+        
+        Returns:
+            Tuple of (i, j, squared distance) with ties resolved to the first
+            pair in (i, j) order, or None if no pair is below the radius
+        """
+        if radius_sq <= 0 or len(coords1) == 0 or len(coords2) == 0:
+            return None
+        
+        if len(coords1) * len(coords2) <= _DENSE_PAIR_LIMIT:
+            distances_sq = self._pairwise_distances_sq(coords1, coords2)
+            if same_set:
+                distances_sq[np.tril_indices(len(coords1))] = np.inf
+            k = int(distances_sq.argmin())
+            if distances_sq.flat[k] >= radius_sq:
+                return None
+            i, j = divmod(k, distances_sq.shape[1])
+            return i, j, distances_sq.flat[k]
+        
+        rows, cols = _bucket_neighbour_pairs(coords1, coords2, math.sqrt(radius_sq), self.anisotropy_y)
+        if same_set:
+            keep = rows < cols
+            rows, cols = rows[keep], cols[keep]
+        dx = coords1[rows, 0] - coords2[cols, 0]
+        dy = (coords1[rows, 1] - coords2[cols, 1]) * self.anisotropy_y
+        distances_sq = dx * dx + dy * dy
+        
+        close = distances_sq < radius_sq
+        if not close.any():
+            return None
+        rows, cols, distances_sq = rows[close], cols[close], distances_sq[close]
+        flat = np.where(distances_sq == distances_sq.min(), rows * len(coords2) + cols, np.iinfo(np.int64).max)
+        k = int(flat.argmin())
+        return int(rows[k]), int(cols[k]), distances_sq[k]
+    
     def _try_move_point_for_better_separation(self, result: PlacementResult, 
                                             entity_type: EntityType, point_index: int) -> bool:
         """
@@ -506,92 +747,103 @@ class BlueNoiseOptimizer:
             return False
         
         current_cell = placements[point_index]
-        entity = self.entity_map[entity_type]
         
         # Find which band this point is in
-        current_band = None
-        for band in self.stratification.bands:
-            if band.contains_cell(current_cell):
-                current_band = band
-                break
-        
+        current_band = self._band_of_row.get(current_cell.y)
         if current_band is None:
             return False
         
-        # Get available cells in the same band within the allowed region
-        band_cells = current_band.get_cells_in_region(entity.allowed_region)
-        available_cells = [cell for cell in band_cells 
-                          if cell != current_cell and cell not in placements]
-        
-        if not available_cells:
+        # Get available cells in the same band within the allowed region,
+        # excluding every cell this entity already occupies (current included)
+        band_cells, band_coords, row_of = self._band_candidates(entity_type, current_band)
+        available = np.ones(len(band_cells), dtype=bool)
+        for cell in placements:
+            row = row_of.get(cell)
+            if row is not None:
+                available[row] = False
+        available_rows = np.flatnonzero(available)
+        
+        if len(available_rows) == 0:
             return False
         
-        best_cell = None
-        best_improvement = 0
+        candidate_coords = band_coords[available_rows]
+        improvements = self._separation_improvements(result, entity_type, point_index, candidate_coords)
         
-        for candidate_cell in available_cells:
-            improvement = self._calculate_separation_improvement(
-                result, entity_type, point_index, current_cell, candidate_cell
-            )
-            
-            if improvement > best_improvement:
-                best_improvement = improvement
-                best_cell = candidate_cell
+        if improvements.size == 0:
+            return False
         
-        if best_cell is not None:
+        # First candidate with the largest positive improvement
+        best = int(improvements.argmax())
+        if improvements[best] > 0:
             # Make the move
-            placements[point_index] = best_cell
+            placements[point_index] = band_cells[available_rows[best]]
+            self._coords[entity_type][point_index] = candidate_coords[best]
+            self._generations[entity_type] += 1
             return True
         
         return False
     
-    def _calculate_separation_improvement(self, result: PlacementResult,
-                                        entity_type: EntityType, point_index: int,
-                                        old_cell: GridCell, new_cell: GridCell) -> float:
+    def _band_candidates(self, entity_type: EntityType,
+                         band: Band) -> Tuple[List[GridCell], np.ndarray, Dict[GridCell, int]]:
         """
-        Calculate the improvement in separation distances from moving a point
+        Cells of an entity's allowed region within a band, cached per band
         
-        Returns positive value if the move improves separations
+        Returns:
+            Tuple of (cells, their normalized (N, 2) coordinates, row of each cell)
         """
-        placements = result.placements[entity_type]
-        entity = self.entity_map[entity_type]
-        
-        old_min_distances = []
-        new_min_distances = []
-        
-        # Calculate distances to other points of the same entity
-        for i, other_cell in enumerate(placements):
-            if i == point_index:
-                continue
-            
-            old_dist = self._cell_distance(old_cell, other_cell)
-            new_dist = self._cell_distance(new_cell, other_cell)
-            
-            old_min_distances.append(old_dist)
-            new_min_distances.append(new_dist)
+        key = (entity_type, band.index)
+        candidates = self._candidates.get(key)
+        if candidates is None:
+            cells = list(band.get_cells_in_region(self.entity_map[entity_type].allowed_region))
+            row_of = {cell: row for row, cell in enumerate(cells)}
+            candidates = self._candidates[key] = (cells, self._normalized_coords(cells), row_of)
+        return candidates
+    
+    def _separation_improvements(self, result: PlacementResult,
+                                 entity_type: EntityType, point_index: int,
+                                 candidate_coords: np.ndarray) -> np.ndarray:
+        """
+        Calculate the improvement in minimum separation from moving a point to each candidate
+        
+        Distances are measured to every other placed point of any entity and
+        compared squared. Other points are scanned in blocks, nearest the
+        candidates' rows first, and a candidate is dropped as soon as it comes
+        within the current minimum of some point. Returns one value per
+        candidate, positive where the move improves separation and -inf for
+        dropped candidates, or an empty array if there are no other points.
+        """
+        coords = self._coords[entity_type]
+        others = [np.delete(coords, point_index, axis=0)]
+        others.extend(other_coords for other_type, other_coords in self._coords.items()
+                      if other_type != entity_type)
+        others = np.concatenate(others)
+        
+        if len(others) == 0:
+            return np.empty(0)
+        
+        old_min_sq = self._pairwise_distances_sq(coords[point_index:point_index + 1], others).min()
+        
+        others = others[np.argsort(np.abs(others[:, 1] - candidate_coords[:, 1].mean()), kind='stable')]
+        improvements = np.full(len(candidate_coords), -np.inf)
+        alive = np.arange(len(candidate_coords))
+        new_min_sq = np.full(len(candidate_coords), np.inf)
+        for start in range(0, len(others), _IMPROVEMENT_BLOCK_SIZE):
+            block = others[start:start + _IMPROVEMENT_BLOCK_SIZE]
+            new_min_sq = np.minimum(new_min_sq, self._pairwise_distances_sq(candidate_coords[alive], block).min(axis=1))
+            keep = new_min_sq > old_min_sq
+            alive, new_min_sq = alive[keep], new_min_sq[keep]
+            if len(alive) == 0:
+                break
         
-        # Calculate distances to points of other entities
-        for other_type, other_placements in result.placements.items():
-            if other_type == entity_type:
-                continue
-            
-            for other_cell in other_placements:
-                old_dist = self._cell_distance(old_cell, other_cell)
-                new_dist = self._cell_distance(new_cell, other_cell)
-                
-                old_min_distances.append(old_dist)
-                new_min_distances.append(new_dist)
-        
-        # Calculate improvement based on minimum distances
-        if old_min_distances and new_min_distances:
-            old_min = min(old_min_distances)
-            new_min = min(new_min_distances)
-            return new_min - old_min
-        
-        return 0
-    
-    def _cell_distance(self, cell1: GridCell, cell2: GridCell) -> float:
-        """Calculate anisotropic distance between cells"""
-        p1 = self.grid_region.normalize_cell(cell1)
-        p2 = self.grid_region.normalize_cell(cell2)
-        return p1.distance_to(p2, self.anisotropy_y)
\ No newline at end of file
+        improvements[alive] = new_min_sq - old_min_sq
+        return improvements
+    
+    def _normalized_coords(self, cells: List[GridCell]) -> np.ndarray:
+        """Normalized (N, 2) coordinates of cells"""
+        return self.grid_region.normalize_cells(cells)
+    
+    def _pairwise_distances_sq(self, coords1: np.ndarray, coords2: np.ndarray) -> np.ndarray:
+        """Squared anisotropic (N, M) distance matrix between two normalized coordinate arrays"""
+        dx = coords1[:, None, 0] - coords2[None, :, 0]
+        dy = (coords1[:, None, 1] - coords2[None, :, 1]) * self.anisotropy_y
+        return dx * dx + dy * dy
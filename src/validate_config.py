@@ -14,7 +14,9 @@ from typing import Dict, List, Any, Tuple
 # Add current directory to path for imports
 sys.path.append(str(Path(__file__).parent))
 
-from .config_loader import load_config, validate_config, ConfigurationError
+from .config_loader import (
+    load_config, validate_config, parse_allowed_region, ConfigurationError, _ENTITY_TYPE_MAP
+)
 from .stratified_placement import EntityType, GridRegion, GridCell
 
 
@@ -139,9 +141,7 @@ class ConfigValidator:
         
         for entity_name, entity_data in entities_config.items():
             # Validate entity type
-            try:
-                EntityType(entity_name)
-            except ValueError:
+            if entity_name not in _ENTITY_TYPE_MAP:
                 self.errors.append(f"Unknown entity type: {entity_name}")
                 continue
             
@@ -278,20 +278,19 @@ class ConfigValidator:
             
             # Check entity feasibility
             for entity_name, entity_data in entities_config.items():
+                if entity_name not in _ENTITY_TYPE_MAP:
+                    continue  # Already reported by _validate_entities
+                
                 try:
-                    entity_type = EntityType(entity_name)
                     count = entity_data.get('count', 0)
                     
-                    # Simulate allowed region
+                    # Size the allowed region; mask-backed regions know their
+                    # size without creating any cells
                     region_config = entity_data.get('allowed_region', {})
-                    if region_config:
-                        from config_loader import parse_allowed_region
-                        allowed_region = parse_allowed_region(region_config, grid_region)
-                    else:
-                        allowed_region = grid_region.all_cells()
+                    region_size = len(parse_allowed_region(region_config, grid_region))
                     
-                    if count > len(allowed_region):
-                        self.errors.append(f"{entity_name}: count ({count}) exceeds allowed region size ({len(allowed_region)})")
+                    if count > region_size:
+                        self.errors.append(f"{entity_name}: count ({count}) exceeds allowed region size ({region_size})")
                 
                 except Exception as e:
                     self.warnings.append(f"{entity_name}: could not validate feasibility - {e}")
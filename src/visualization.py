@@ -7,15 +7,27 @@ band overlays, separation radius visualization, and metrics displays.
 
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.colors import ListedColormap, to_rgba
+from matplotlib.lines import Line2D
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter
+from functools import lru_cache
 
 from .stratified_placement import (
-    GridCell, Entity, GridRegion, Stratification, PlacementResult,
+    AllowedRegion, GridCell, Entity, GridRegion, Stratification, PlacementResult,
     EntityType, euclidean_distance
 )
-from .placement_metrics import PlacementMetrics
+from .placement_metrics import PlacementMetrics, _placement_arrays
+
+# Fraction of grid cells occupied above which placements are drawn as a
+# single cell mesh instead of one scatter marker per placement
+DENSE_PLACEMENT_FRACTION = 0.2
+
+# Total placements above which separation circles are drawn per occupied
+# spatial bin rather than per placement
+MAX_RADIUS_CIRCLES = 500
 
 
 class PlacementVisualizer:
@@ -28,12 +40,54 @@ class PlacementVisualizer:
         self.grid_region = grid_region
         self.stratification = stratification
         self.entities = entities
+        self._entity_by_type = {e.entity_type: e for e in entities}
         self.entity_colors = {
             EntityType.VINLET: "orange",
             EntityType.VOUTLET: "cyan", 
             EntityType.ACINLET: "red",
             EntityType.ACOUTLET: "blue"
         }
+        # Color names resolved to RGBA once, keyed by name so later edits to
+        # entity_colors still take effect
+        self._rgba_cache = {color: to_rgba(color) for color in self.entity_colors.values()}
+        # (result, coordinate arrays) shared by the panels of one comprehensive figure
+        self._arrays_cache = None
+    
+    def _entity_rgba(self, entity_type: EntityType) -> Tuple[float, float, float, float]:
+        """Get the RGBA color for an entity type (gray if it has none)"""
+        color = self.entity_colors.get(entity_type, "gray")
+        rgba = self._rgba_cache.get(color)
+        if rgba is None:
+            rgba = self._rgba_cache[color] = to_rgba(color)
+        return rgba
+    
+    def _result_arrays(self, result: PlacementResult) -> Dict[EntityType, np.ndarray]:
+        """Get (N, 2) placement coordinate arrays per entity type"""
+        cached = self._arrays_cache
+        if cached is not None and cached[0] is result:
+            return cached[1]
+        return _placement_arrays(result)
+    
+    def _region_mask(self, region) -> np.ndarray:
+        """Boolean (height, width) mask of the region's cells that lie on the grid"""
+        if isinstance(region, AllowedRegion) and region.mask.shape == (self.grid_region.height, self.grid_region.width):
+            return region.mask
+        
+        mask = np.zeros((self.grid_region.height, self.grid_region.width), dtype=bool)
+        cells = [(cell.y - 1, cell.x - 1) for cell in region
+                 if 1 <= cell.x <= self.grid_region.width and 1 <= cell.y <= self.grid_region.height]
+        if cells:
+            mask[tuple(np.array(cells).T)] = True
+        return mask
+    
+    def _band_boundary_segments(self) -> List[List[Tuple[float, float]]]:
+        """Full-width line segments at the top and bottom edge of every band"""
+        x_min, x_max = 0.5, self.grid_region.width + 0.5
+        return [
+            [(x_min, y), (x_max, y)]
+            for band in self.stratification.bands
+            for y in (band.y_min - 0.5, band.y_max + 0.5)
+        ]
     
     def plot_comprehensive_analysis(self, 
                                   result: PlacementResult,
@@ -49,22 +103,29 @@ class PlacementVisualizer:
             figsize: Figure size (width, height)
             save_path: Optional path to save the figure
         """
-        fig = plt.figure(figsize=figsize)
+        # Constrained layout solves the gridspec, legend and colorbar spacing
+        # as the figure is drawn, replacing a separate tight_layout pass
+        fig = plt.figure(figsize=figsize, constrained_layout=True)
         
         # Create subplot layout: 2x3 grid
         gs = fig.add_gridspec(3, 3, height_ratios=[2, 1, 1], width_ratios=[2, 1, 1])
         
-        # Main placement plot (large, top-left)
-        ax_main = fig.add_subplot(gs[0, :2])
-        self.plot_placement_with_bands(result, ax_main)
-        
-        # Band coverage histogram (top-right)
-        ax_coverage = fig.add_subplot(gs[0, 2])
-        self.plot_coverage_histogram(metrics, ax_coverage)
-        
-        # Separation distance heatmap (middle-left)
-        ax_heatmap = fig.add_subplot(gs[1, :2])
-        self.plot_density_heatmap(result, ax_heatmap)
+        # Extract coordinates once for both placement panels
+        self._arrays_cache = (result, _placement_arrays(result))
+        try:
+            # Main placement plot (large, top-left)
+            ax_main = fig.add_subplot(gs[0, :2])
+            self.plot_placement_with_bands(result, ax_main)
+            
+            # Band coverage histogram (top-right)
+            ax_coverage = fig.add_subplot(gs[0, 2])
+            self.plot_coverage_histogram(metrics, ax_coverage)
+            
+            # Separation distance heatmap (middle-left)
+            ax_heatmap = fig.add_subplot(gs[1, :2])
+            self.plot_density_heatmap(result, ax_heatmap)
+        finally:
+            self._arrays_cache = None
         
         # Separation violations chart (middle-right)
         ax_violations = fig.add_subplot(gs[1, 2])
@@ -74,10 +135,8 @@ class PlacementVisualizer:
         ax_dist = fig.add_subplot(gs[2, :])
         self.plot_y_distribution_histograms(metrics, ax_dist)
         
-        plt.tight_layout()
-        
         if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+            fig.savefig(save_path, dpi=300)
         
         plt.show()
     
@@ -86,63 +145,106 @@ class PlacementVisualizer:
         if ax is None:
             fig, ax = plt.subplots(figsize=(10, 8))
         
+        self._draw_static(ax)
+        self._draw_placements(result, ax)
+        ax.set_title("Stratified Placement with Band Boundaries")
+    
+    def _draw_static(self, ax: plt.Axes):
+        """Draw the result-independent layers: grid, bands, allowed regions and axes limits"""
         # Draw grid
-        for x in range(1, self.grid_region.width + 2):
-            ax.axvline(x - 0.5, color="lightgray", linewidth=0.5, alpha=0.5)
-        for y in range(1, self.grid_region.height + 2):
-            ax.axhline(y - 0.5, color="lightgray", linewidth=0.5, alpha=0.5)
+        width, height = self.grid_region.width, self.grid_region.height
+        grid_segments = (
+            [[(x - 0.5, 0.5), (x - 0.5, height + 0.5)] for x in range(1, width + 2)] +
+            [[(0.5, y - 0.5), (width + 0.5, y - 0.5)] for y in range(1, height + 2)]
+        )
+        ax.add_collection(LineCollection(grid_segments, colors="lightgray", linewidths=0.5, alpha=0.5),
+                          autolim=False)
         
         # Draw band boundaries
+        ax.add_collection(LineCollection(self._band_boundary_segments(), colors="purple", linewidths=2,
+                                         alpha=0.7, linestyles='--'),
+                          autolim=False)
         for band in self.stratification.bands:
-            # Horizontal lines for band boundaries
-            ax.axhline(band.y_min - 0.5, color="purple", linewidth=2, alpha=0.7, linestyle='--')
-            ax.axhline(band.y_max + 0.5, color="purple", linewidth=2, alpha=0.7, linestyle='--')
-            
             # Band label
             mid_y = (band.y_min + band.y_max) / 2
             ax.text(0.2, mid_y, f'Band {band.index}', 
                    bbox=dict(boxstyle="round,pad=0.3", facecolor="yellow", alpha=0.7),
                    fontsize=8, ha='left', va='center')
         
-        # Draw entity allowed regions (background shading)
+        # Draw entity allowed regions (background shading), one image per entity
         for entity in self.entities:
-            region_cells = list(entity.allowed_region)
-            if region_cells:
-                xs = [cell.x for cell in region_cells]
-                ys = [cell.y for cell in region_cells]
-                
+            mask = self._region_mask(entity.allowed_region)
+            if mask.any():
                 # Create a light background for the allowed region
-                color = self.entity_colors.get(entity.entity_type, "gray")
-                ax.scatter(xs, ys, c=color, alpha=0.1, s=300, marker='s')
+                color = self._entity_rgba(entity.entity_type)
+                ax.imshow(np.ma.masked_where(~mask, mask), cmap=ListedColormap([color]),
+                          alpha=0.1, extent=[0.5, width + 0.5, height + 0.5, 0.5],
+                          interpolation='nearest', zorder=0)
         
-        # Plot entity placements
-        for entity_type, placements in result.placements.items():
-            if not placements:
-                continue
-            
-            color = self.entity_colors.get(entity_type, "gray")
-            xs, ys = zip(*[(p.x, p.y) for p in placements])
-            
-            # Plot with larger markers and edge colors
-            ax.scatter(xs, ys, c=color, s=150, marker="s", 
-                      label=f"{entity_type.value} ({len(placements)})", 
-                      edgecolors="black", linewidth=1.5, alpha=0.9)
-            
-            # Add separation radius circles for visualization
-            entity = next(e for e in self.entities if e.entity_type == entity_type)
-            for x, y in zip(xs, ys):
-                circle = plt.Circle((x, y), entity.intra_radius, 
-                                  fill=False, color=color, alpha=0.3, linewidth=1)
-                ax.add_patch(circle)
-        
-        ax.set_xlim(0.5, self.grid_region.width + 0.5)
-        ax.set_ylim(0.5, self.grid_region.height + 0.5)
+        ax.set_xlim(0.5, width + 0.5)
+        ax.set_ylim(0.5, height + 0.5)
         ax.set_aspect("equal")
         ax.invert_yaxis()
-        ax.set_title("Stratified Placement with Band Boundaries")
-        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         ax.grid(True, alpha=0.3)
     
+    def _draw_placements(self, result: PlacementResult, ax: plt.Axes):
+        """Draw one result's placements, separation radii and legend onto prepared axes"""
+        width, height = self.grid_region.width, self.grid_region.height
+        
+        # Plot entity placements as one scatter with per-point colors
+        xy = self._result_arrays(result)
+        placed_types = [entity_type for entity_type, placements in result.placements.items() if placements]
+        # One RGBA row and placement count per placed entity type
+        rgba_table = np.array([self._entity_rgba(entity_type) for entity_type in placed_types]).reshape(-1, 4)
+        type_counts = [len(xy[entity_type]) for entity_type in placed_types]
+        if sum(type_counts) > DENSE_PLACEMENT_FRACTION * width * height:
+            # Densely filled grid: paint occupied cells as one mesh, labelled
+            # by the index of their entity type in placed_types, beneath the
+            # grid lines and radius circles
+            labels = np.full((height, width), -1)
+            for label, entity_type in enumerate(placed_types):
+                xs, ys = xy[entity_type].T
+                labels[ys - 1, xs - 1] = label
+            ax.pcolormesh(np.arange(1, width + 1), np.arange(1, height + 1),
+                          np.ma.masked_less(labels, 0), shading='nearest',
+                          cmap=ListedColormap(rgba_table),
+                          vmin=-0.5, vmax=len(placed_types) - 0.5,
+                          alpha=0.9, zorder=0.5)
+        elif placed_types:
+            points = np.concatenate([xy[entity_type] for entity_type in placed_types])
+            point_colors = np.repeat(rgba_table, type_counts, axis=0)
+            
+            # Plot with larger markers and edge colors, above the radius circles
+            ax.scatter(points[:, 0], points[:, 1], c=point_colors, s=150, marker="s",
+                      edgecolors="black", linewidth=1.5, alpha=0.9, zorder=2)
+        
+        legend_handles = []
+        for entity_type in placed_types:
+            color = self._entity_rgba(entity_type)
+            xs, ys = xy[entity_type].T
+            legend_handles.append(Line2D(
+                [], [], linestyle='none', marker='s', markersize=np.sqrt(150),
+                markerfacecolor=color, markeredgecolor='black', markeredgewidth=1.5, alpha=0.9,
+                label=f"{entity_type.value} ({len(xs)})"
+            ))
+            
+            # Add separation radius circles for visualization, as one
+            # collection per entity type rather than one patch per placement
+            entity = self._entity_by_type[entity_type]
+            centers = xy[entity_type]
+            if sum(type_counts) > MAX_RADIUS_CIRCLES:
+                centers = _binned_centers(centers, max(entity.intra_radius / 3, 1.0))
+            diameters = np.full(len(centers), 2 * entity.intra_radius)
+            circles = EllipseCollection(
+                diameters, diameters, np.zeros(len(centers)), units='xy',
+                offsets=centers, offset_transform=ax.transData,
+                facecolors='none', edgecolors=color, alpha=0.3, linewidths=1
+            )
+            ax.add_collection(circles, autolim=False)
+        
+        if legend_handles:
+            ax.legend(handles=legend_handles, bbox_to_anchor=(1.05, 1), loc='upper left')
+    
     def plot_coverage_histogram(self, metrics: Dict[str, Any], ax: plt.Axes = None):
         """Plot band coverage rates for each entity"""
         if ax is None:
@@ -155,8 +257,10 @@ class PlacementVisualizer:
             ax.text(0.5, 0.5, "No coverage data", ha='center', va='center', transform=ax.transAxes)
             return
         
-        band_rates = [coverage_data[entity]['band_coverage_rate'] for entity in entities]
-        row_rates = [coverage_data[entity]['row_coverage_rate'] for entity in entities]
+        band_rates = np.fromiter((coverage_data[entity]['band_coverage_rate'] for entity in entities),
+                                 dtype=float, count=len(entities))
+        row_rates = np.fromiter((coverage_data[entity]['row_coverage_rate'] for entity in entities),
+                                dtype=float, count=len(entities))
         
         x = np.arange(len(entities))
         width = 0.35
@@ -173,10 +277,7 @@ class PlacementVisualizer:
         
         # Add value labels on bars
         for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.02,
-                       f'{height:.2f}', ha='center', va='bottom', fontsize=8)
+            ax.bar_label(bars, fmt='%.2f', padding=2, fontsize=8)
     
     def plot_density_heatmap(self, result: PlacementResult, ax: plt.Axes = None):
         """Plot density heatmap of all placements"""
@@ -184,19 +285,22 @@ class PlacementVisualizer:
             fig, ax = plt.subplots(figsize=(12, 6))
         
         # Create a density grid
-        density_grid = np.zeros((self.grid_region.height, self.grid_region.width))
-        
-        # Count placements in each cell
-        for placements in result.placements.values():
-            for cell in placements:
-                # Convert to 0-based indexing for numpy array
-                y_idx = cell.y - 1
-                x_idx = cell.x - 1
-                if 0 <= y_idx < self.grid_region.height and 0 <= x_idx < self.grid_region.width:
-                    density_grid[y_idx, x_idx] += 1
+        height, width = self.grid_region.height, self.grid_region.width
+        
+        # Count placements in each cell (0-based indexing for numpy array),
+        # ignoring any cell outside the grid, as a histogram of flat indices
+        xy = self._result_arrays(result)
+        points = np.concatenate(list(xy.values())) if xy else np.empty((0, 2), dtype=np.int32)
+        xs = points[:, 0].astype(np.intp) - 1
+        ys = points[:, 1].astype(np.intp) - 1
+        inside = (ys >= 0) & (ys < height) & (xs >= 0) & (xs < width)
+        flat = ys[inside] * width + xs[inside]
+        density_grid = np.bincount(flat, minlength=height * width).reshape(height, width).astype(float)
         
         # Create heatmap
-        im = ax.imshow(density_grid, cmap='YlOrRd', aspect='equal', 
+        # One texel per cell, kept as a raster even in vector outputs
+        im = ax.imshow(density_grid, cmap='YlOrRd', aspect='equal',
+                      interpolation='nearest', rasterized=True,
                       extent=[0.5, self.grid_region.width + 0.5, 
                              self.grid_region.height + 0.5, 0.5])
         
@@ -204,10 +308,10 @@ class PlacementVisualizer:
         cbar = plt.colorbar(im, ax=ax)
         cbar.set_label('Entity Count per Cell')
         
-        # Add band boundaries
-        for band in self.stratification.bands:
-            ax.axhline(band.y_min - 0.5, color="white", linewidth=2, alpha=0.8, linestyle='--')
-            ax.axhline(band.y_max + 0.5, color="white", linewidth=2, alpha=0.8, linestyle='--')
+        # Add band boundaries (rasterized with the heatmap beneath them)
+        ax.add_collection(LineCollection(self._band_boundary_segments(), colors="white", linewidths=2,
+                                         alpha=0.8, linestyles='--', rasterized=True),
+                          autolim=False)
         
         ax.set_title('Placement Density Heatmap')
         ax.set_xlabel('X Coordinate')
@@ -224,22 +328,13 @@ class PlacementVisualizer:
             ax.text(0.5, 0.5, "No separation data", ha='center', va='center', transform=ax.transAxes)
             return
         
-        violation_counts = []
-        labels = []
-        colors = []
+        labels = [sep_name.replace('_', '\n') for sep_name in separation_data]
+        violation_counts = np.fromiter((sep_metrics['violations'] for sep_metrics in separation_data.values()),
+                                       dtype=np.int64, count=len(separation_data))
         
-        for sep_name, sep_metrics in separation_data.items():
-            violations = sep_metrics['violations']
-            violation_counts.append(violations)
-            labels.append(sep_name.replace('_', '\n'))
-            
-            # Color code by violation severity
-            if violations == 0:
-                colors.append('green')
-            elif violations <= 2:
-                colors.append('yellow')
-            else:
-                colors.append('red')
+        # Color code by violation severity
+        colors = np.where(violation_counts == 0, 'green',
+                          np.where(violation_counts <= 2, 'yellow', 'red'))
         
         bars = ax.bar(range(len(labels)), violation_counts, color=colors, alpha=0.7)
         
@@ -248,11 +343,9 @@ class PlacementVisualizer:
         ax.set_xticks(range(len(labels)))
         ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=8)
         
-        # Add value labels on bars
-        for bar, count in zip(bars, violation_counts):
-            if count > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., bar.get_height() + 0.1,
-                       str(count), ha='center', va='bottom', fontweight='bold')
+        # Add value labels on bars with violations
+        ax.bar_label(bars, labels=[str(count) if count > 0 else '' for count in violation_counts],
+                     padding=2, fontweight='bold')
     
     def plot_y_distribution_histograms(self, metrics: Dict[str, Any], ax: plt.Axes = None):
         """Plot Y-coordinate distribution histograms for all entities"""
@@ -274,27 +367,32 @@ class PlacementVisualizer:
             return
         
         # Get all Y coordinates
-        all_ys = set()
-        for hist_info in entity_hists.values():
-            all_ys.update(hist_info['histogram'].keys())
-        y_coords = sorted(all_ys)
+        y_coords = sorted(set().union(*(hist_info['histogram'] for hist_info in entity_hists.values())))
+        
+        # Count matrix (entity, row) scattered from each sparse histogram
+        y_index = {y: i for i, y in enumerate(y_coords)}
+        counts = np.zeros((len(entity_hists), len(y_coords)), dtype=np.int64)
+        for i, hist_info in enumerate(entity_hists.values()):
+            histogram = hist_info['histogram']
+            if histogram:
+                columns = np.fromiter(map(y_index.__getitem__, histogram.keys()), dtype=np.intp, count=len(histogram))
+                counts[i, columns] = np.fromiter(histogram.values(), dtype=np.int64, count=len(histogram))
         
         # Plot each entity's distribution
         width = 0.8 / len(entity_hists)
         x = np.arange(len(y_coords))
         
-        for i, (entity_name, hist_info) in enumerate(entity_hists.items()):
-            counts = [hist_info['histogram'].get(y, 0) for y in y_coords]
+        for i, entity_name in enumerate(entity_hists):
             entity_type_name = entity_name.replace('_y', '')
             
             # Get color from entity type
             try:
                 entity_type = EntityType(entity_type_name)
-                color = self.entity_colors.get(entity_type, 'gray')
+                color = self._entity_rgba(entity_type)
             except ValueError:
                 color = 'gray'
             
-            ax.bar(x + i * width, counts, width, label=entity_type_name, 
+            ax.bar(x + i * width, counts[i], width, label=entity_type_name, 
                   color=color, alpha=0.7)
         
         ax.set_xlabel('Y Coordinate (Row)')
@@ -312,6 +410,21 @@ class PlacementVisualizer:
                     ax.axvline(idx, color='purple', linestyle='--', alpha=0.7)
 
 
+def _binned_centers(points: np.ndarray, bin_size: float) -> np.ndarray:
+    """Mean position of the points in each occupied square bin of side bin_size"""
+    _, inverse = np.unique(np.floor_divide(points, bin_size), axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    counts = np.bincount(inverse)
+    sums = np.column_stack([np.bincount(inverse, weights=points[:, axis]) for axis in (0, 1)])
+    return sums / counts[:, None]
+
+
+@lru_cache(maxsize=8)
+def _default_stratification(width: int, height: int, num_bands: int = 4) -> Stratification:
+    """Shared band layout for the quick-look plots, built once per grid size"""
+    return Stratification.create_horizontal_bands(GridRegion(width, height), num_bands)
+
+
 def plot_simple_placement(result: PlacementResult, 
                          grid_region: GridRegion,
                          entities: List[Entity],
@@ -319,7 +432,7 @@ def plot_simple_placement(result: PlacementResult,
     """Simple plotting function similar to the original"""
     visualizer = PlacementVisualizer(
         grid_region, 
-        Stratification.create_horizontal_bands(grid_region, 4),  # Default 4 bands
+        _default_stratification(grid_region.width, grid_region.height),  # Default 4 bands
         entities
     )
     
@@ -344,13 +457,15 @@ def compare_placements(results: List[PlacementResult],
     
     visualizer = PlacementVisualizer(
         grid_region,
-        Stratification.create_horizontal_bands(grid_region, 4),
+        _default_stratification(grid_region.width, grid_region.height),
         entities
     )
     
-    for i, (result, label) in enumerate(zip(results, labels)):
-        visualizer.plot_placement_with_bands(result, axes[i])
-        axes[i].set_title(label)
+    # Panels share one visualizer; only the placement layer differs per result
+    for ax, result, label in zip(axes, results, labels):
+        visualizer._draw_static(ax)
+        visualizer._draw_placements(result, ax)
+        ax.set_title(label)
     
     plt.tight_layout()
     plt.show()
\ No newline at end of file
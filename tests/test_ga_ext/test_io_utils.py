@@ -17,6 +17,7 @@ from ga_ext.io_utils import (
     load_parent_manifest,
     load_parents_from_directory,
     save_lineage_log,
+    LineageLogWriter,
     create_generation_folder,
     generate_child_path,
     validate_csv_format,
@@ -58,6 +59,20 @@ class TestDataModels(unittest.TestCase):
         self.assertEqual(len(ind1.placements['vinlet']), 2)
         self.assertEqual(len(ind2.placements['vinlet']), 3)
 
+    def test_individual_with_placements(self):
+        """Test Individual copy with replacement placements."""
+        ind1 = Individual(id="test_001", path=Path("test.csv"),
+                          placements={'vinlet': [(5, 4)]}, metadata={'note': 'a'})
+        new_placements = {'vinlet': [(6, 4)]}
+        ind2 = ind1.with_placements(new_placements)
+
+        self.assertIs(ind2.placements, new_placements)
+        self.assertEqual(ind1.placements['vinlet'], [(5, 4)])
+
+        # Metadata is copied, not shared
+        ind2.metadata['note'] = 'b'
+        self.assertEqual(ind1.metadata['note'], 'a')
+
     def test_parent_manifest_creation(self):
         """Test ParentManifest creation and validation."""
         ind1 = Individual(id="p1", path=Path("p1.csv"), placements={'vinlet': [(1, 1)]})
@@ -290,6 +305,25 @@ class TestIOUtils(unittest.TestCase):
             self.assertIn('child_path', lines[0])
             self.assertIn('child_000.csv', lines[1])
 
+    def test_lineage_log_writer_streams_records(self):
+        """Test that LineageLogWriter writes records as they arrive."""
+        log_path = self.temp_path / "lineage_log.csv"
+
+        with LineageLogWriter(log_path) as log_writer:
+            log_writer.write(create_immigrant_record(Path("immigrant_000.csv"), 7))
+            log_writer.write(create_immigrant_record(Path("immigrant_001.csv"), 8))
+            self.assertEqual(log_writer.records_written, 2)
+
+        with open(log_path, 'r') as f:
+            lines = f.readlines()
+            self.assertEqual(len(lines), 3)  # Header + 2 records
+            self.assertIn('immigrant_001.csv', lines[2])
+
+        # Existing log is protected unless overwrite is requested
+        with self.assertRaises(FileExistsError):
+            with LineageLogWriter(log_path):
+                pass
+
     def test_create_generation_folder(self):
         """Test generation folder creation."""
         gen_folder = create_generation_folder(self.temp_path, 5)
@@ -12,6 +12,8 @@ from ga_ext.band_utils import (
     get_band_for_position,
     count_entities_per_band,
     get_band_boundaries,
+    build_band_array,
+    lookup_band,
 )
 from ga_ext.crossover import (
     bandwise_crossover,
@@ -24,6 +26,7 @@ from ga_ext.mutation import (
     band_local_jitter,
     micro_reseed,
     mutate,
+    prepare_mutation_settings,
 )
 
 
@@ -60,6 +63,44 @@ class TestBandUtils(unittest.TestCase):
         band = get_band_for_position((5, 8), self.grid_config, self.band_config)
         self.assertIn(band, [0, 1])
 
+    def test_build_band_array_matches_get_band_for_position(self):
+        """Test precomputed band array agrees with per-position lookup."""
+        band_of_cell = build_band_array(self.grid_config, self.band_config)
+
+        for y in range(1, self.grid_config['height'] + 1):
+            for x in range(1, self.grid_config['width'] + 1):
+                expected = get_band_for_position((x, y), self.grid_config, self.band_config)
+                self.assertEqual(lookup_band(band_of_cell, (x, y)), expected)
+
+        # Bands depend on the row only, so off-grid x keeps its row's band
+        for x in (-3, 0, self.grid_config['width'] + 1):
+            expected = get_band_for_position((x, 3), self.grid_config, self.band_config)
+            self.assertEqual(lookup_band(band_of_cell, (x, 3)), expected)
+
+        # Outside the grid rows there is no band
+        self.assertEqual(lookup_band(band_of_cell, (5, 0)), -1)
+        self.assertEqual(lookup_band(band_of_cell, (5, 99)), -1)
+
+    def test_partition_by_band_with_band_array(self):
+        """Test partition fast path matches the stratification-based one."""
+        placements = {
+            'vinlet': [(5, 2), (10, 8), (15, 9), (1, 5)],
+            'acinlet': [(3, 3), (20, 10)],
+            # Off-grid x is still banded by its row
+            'voutlet': [(0, 4), (self.grid_config['width'] + 1, 7), (-2, 1)]
+        }
+        band_of_cell = build_band_array(self.grid_config, self.band_config)
+
+        expected = partition_by_band(placements, self.grid_config, self.band_config)
+        fast = partition_by_band(placements, self.grid_config, self.band_config,
+                                 band_of_cell=band_of_cell)
+        self.assertEqual(fast, expected)
+
+        expected_counts = count_entities_per_band(placements, self.grid_config, self.band_config)
+        fast_counts = count_entities_per_band(placements, self.grid_config, self.band_config,
+                                              band_of_cell=band_of_cell)
+        self.assertEqual(fast_counts, expected_counts)
+
     def test_count_entities_per_band(self):
         """Test counting entities per band."""
         placements = {
@@ -332,6 +373,24 @@ class TestMutation(unittest.TestCase):
                     f"Entity count mismatch for {entity_type}"
                 )
 
+    def test_mutate_with_prepared_settings(self):
+        """Test that precomputed mutation settings give identical results."""
+        prepared = dict(self.config)
+        prepared['mutation'] = dict(self.config['mutation'])
+        prepared['mutation'].update(prepare_mutation_settings(self.config))
+
+        mutated_raw, log_raw = mutate(
+            self.individual, self.config, self.grid_config, self.band_config,
+            np.random.default_rng(7)
+        )
+        mutated_prep, log_prep = mutate(
+            self.individual, prepared, self.grid_config, self.band_config,
+            np.random.default_rng(7)
+        )
+
+        self.assertEqual(mutated_raw.placements, mutated_prep.placements)
+        self.assertEqual(log_raw, log_prep)
+
     def test_mutation_with_zero_rate(self):
         """Test that mutation_rate=0 skips mutation."""
         config = self.config.copy()
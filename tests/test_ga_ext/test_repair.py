@@ -17,7 +17,11 @@ from ga_ext.repair import (
     repair_conflicts,
     repair_quotas,
     refine_separation,
-    repair_and_refine
+    repair_and_refine,
+    repair_and_refine_batch,
+    to_soa,
+    from_soa,
+    _find_closest_pair
 )
 
 
@@ -108,6 +112,18 @@ class TestEngineInterface(unittest.TestCase):
         self.assertGreaterEqual(band_id, 0)
         self.assertLess(band_id, self.engine.get_band_config()['num_bands'])
 
+    def test_get_band_id_for_position_fast(self):
+        """Test row-table band lookup agrees with band ranges."""
+        for band in self.engine.stratification.bands:
+            for y in range(band.y_min, band.y_max + 1):
+                self.assertEqual(self.engine.get_band_id_for_position_fast((5, y)), band.index)
+
+        # Rows outside the grid have no band
+        self.assertEqual(self.engine.get_band_id_for_position_fast((5, 0)), -1)
+        self.assertEqual(self.engine.get_band_id_for_position_fast((5, 999)), -1)
+        with self.assertRaises(ValueError):
+            self.engine.get_band_id_for_position((5, 999))
+
 
 class TestConflictRepair(unittest.TestCase):
     """Test conflict resolution."""
@@ -316,6 +332,45 @@ class TestSeparationRefinement(unittest.TestCase):
         # Should complete quickly (no improvements needed)
         self.assertGreater(len(notes), 0)
 
+    def test_find_closest_pair_matches_pairwise_scan(self):
+        """Test vectorized closest pair agrees with the pairwise distance."""
+        positions = [(2, 3), (10, 6), (3, 3), (15, 8), (11, 6)]
+
+        expected_dist = float('inf')
+        expected_pair = None
+        for i in range(len(positions)):
+            for j in range(i + 1, len(positions)):
+                dist = self.engine._anisotropic_distance(
+                    positions[i], positions[j], self.engine.anisotropy_y
+                )
+                if dist < expected_dist:
+                    expected_dist = dist
+                    expected_pair = (i, j)
+
+        min_dist, pair = _find_closest_pair(positions, self.engine)
+        self.assertEqual(pair, expected_pair)
+        self.assertAlmostEqual(min_dist, expected_dist)
+
+        # Fewer than two positions has no pair
+        self.assertEqual(_find_closest_pair([(2, 3)], self.engine), (float('inf'), None))
+
+    def test_soa_round_trip(self):
+        """Test struct-of-arrays conversion preserves placements."""
+        placements = {
+            'vinlet': [(2, 3), (10, 6), (3, 3)],
+            'acinlet': [(5, 4)],
+            'voutlet': []
+        }
+
+        soa = to_soa(placements)
+        xs, ys = soa['vinlet']
+        self.assertEqual(xs.dtype, np.int32)
+        self.assertTrue(xs.flags['C_CONTIGUOUS'])
+        self.assertEqual(ys.tolist(), [3, 6, 3])
+        self.assertEqual(len(soa['voutlet'][0]), 0)
+
+        self.assertEqual(from_soa(soa), placements)
+
     def test_refinement_improves_distance(self):
         """Test that refinement can improve minimum distance."""
         # Create individual with entities close together
@@ -409,6 +464,34 @@ class TestRepairPipeline(unittest.TestCase):
         """Set up test fixtures."""
         self.rng = np.random.default_rng(42)
 
+    def test_repair_batch_matches_serial(self):
+        """Test parallel batch repair matches serial repair with same seeds."""
+        individuals = [
+            Individual(
+                id=f"batch_{i}",
+                path=Path(f"batch_{i}.csv"),
+                placements={
+                    'vinlet': [(3, 4), (5, 4), (5, 4 + i)],
+                    'acinlet': [(5, 4), (9, 5)]
+                }
+            )
+            for i in range(3)
+        ]
+        seeds = [11, 12, 13]
+
+        batch = repair_and_refine_batch(individuals, "config.yaml", {}, seeds, max_workers=2)
+        serial = [
+            repair_and_refine(ind, "config.yaml", {}, np.random.default_rng(seed))
+            for ind, seed in zip(individuals, seeds)
+        ]
+
+        self.assertEqual([ind.id for ind in batch], [ind.id for ind in individuals])
+        for got, expected in zip(batch, serial):
+            self.assertEqual(got.placements, expected.placements)
+
+        with self.assertRaises(ValueError):
+            repair_and_refine_batch(individuals, "config.yaml", {}, seeds[:1])
+
     def test_repair_clean_individual(self):
         """Test pipeline with clean individual (no issues)."""
         individual = Individual(
@@ -4,6 +4,7 @@ Tests for the placement engine and optimization
 
 import unittest
 import sys
+from unittest import mock
 from pathlib import Path
 
 # Add parent directory to path
@@ -11,7 +12,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from src.stratified_placement import (
     GridCell, GridRegion, Entity, EntityType, PlacementEngine,
-    PlacementResult, euclidean_distance
+    PlacementResult, BlueNoiseOptimizer, euclidean_distance, _farthest_point_indices
 )
 
 
@@ -109,6 +110,18 @@ class TestPlacementEngine(unittest.TestCase):
         # Should have some reasonable minimum separation
         self.assertGreater(min_distance, 0)
     
+    def test_compiled_and_numpy_sampling_agree(self):
+        """Test the numba and NumPy farthest point selections pick the same cells"""
+        from src import _sampling_kernels
+        if not _sampling_kernels.NUMBA_AVAILABLE:
+            self.skipTest("numba not installed")
+        
+        coords = self.grid_region.normalize_cells(sorted(self.grid_region.all_cells(), key=tuple))
+        for start, anisotropy_y in ((0, 1.0), (17, 2.5)):
+            expected = _farthest_point_indices(coords, start, 12, anisotropy_y)
+            compiled = _sampling_kernels.farthest_point_indices(coords, start, 12, anisotropy_y)
+            self.assertEqual(compiled.tolist(), expected.tolist())
+    
     def test_reproducible_results(self):
         """Test that same seed produces same results"""
         result1 = self.engine.place_all_entities()
@@ -151,6 +164,15 @@ class TestPlacementResult(unittest.TestCase):
         self.assertEqual(len(result.feasibility_notes), 2)
         self.assertIn("Test note 1", result.feasibility_notes)
         self.assertIn("Test note 2", result.feasibility_notes)
+    
+    def test_total_entity_count(self):
+        """Test total placement count across entity types"""
+        result = PlacementResult()
+        self.assertEqual(result.total_entity_count(), 0)
+        
+        result.placements[EntityType.VINLET] = [GridCell(1, 1), GridCell(2, 2)]
+        result.placements[EntityType.VOUTLET] = [GridCell(3, 3)]
+        self.assertEqual(result.total_entity_count(), 3)
 
 
 class TestDistanceFunctions(unittest.TestCase):
@@ -173,5 +195,197 @@ class TestDistanceFunctions(unittest.TestCase):
         self.assertEqual(distance, 0.0)
 
 
+class TestBlueNoiseOptimizer(unittest.TestCase):
+    """Test Phase C optimizer bookkeeping"""
+    
+    def setUp(self):
+        """Set up test fixtures"""
+        self.grid_region = GridRegion(10, 8)
+        all_cells = self.grid_region.all_cells()
+        self.entities = [
+            Entity(EntityType.VINLET, 4, all_cells, intra_radius=0.3),
+            Entity(EntityType.VOUTLET, 3, all_cells, intra_radius=0.3)
+        ]
+        self.engine = PlacementEngine(self.grid_region, self.entities, cross_entity_radius=0.2,
+                                      anisotropy_y=1.5, num_bands=4, random_seed=3)
+        self.optimizer = BlueNoiseOptimizer(
+            self.grid_region, self.engine.stratification, self.entities, 0.2, 1.5
+        )
+    
+    def test_pairwise_distances_match_cell_distance(self):
+        """Test vectorized squared distances equal the per-pair anisotropic distance"""
+        cells = [GridCell(1, 1), GridCell(4, 7), GridCell(10, 2)]
+        coords = self.optimizer._normalized_coords(cells)
+        distances_sq = self.optimizer._pairwise_distances_sq(coords, coords)
+        
+        for i, c1 in enumerate(cells):
+            for j, c2 in enumerate(cells):
+                p1 = self.grid_region.normalize_cell(c1)
+                p2 = self.grid_region.normalize_cell(c2)
+                self.assertEqual(distances_sq[i, j], p1.distance_sq_to(p2, 1.5))
+    
+    def test_bucketed_closest_pair_matches_dense(self):
+        """Test the hash-grid pair search agrees with the full distance matrix"""
+        cells = sorted(self.grid_region.all_cells(), key=tuple)
+        coords1 = self.optimizer._normalized_coords(cells[::3])
+        coords2 = self.optimizer._normalized_coords(cells[1::3])
+        
+        for radius_sq in (0.01, 0.05, 0.5):
+            for args in ((coords1, coords2, radius_sq), (coords1, coords1, radius_sq, True)):
+                with mock.patch('src.stratified_placement._DENSE_PAIR_LIMIT', 1 << 30):
+                    dense = self.optimizer._closest_pair_within(*args)
+                with mock.patch('src.stratified_placement._DENSE_PAIR_LIMIT', 0):
+                    bucketed = self.optimizer._closest_pair_within(*args)
+                self.assertEqual(bucketed, dense)
+    
+    def test_violating_pair_rescanned_only_after_move(self):
+        """Test the closest-pair scan is reused until a point of either type moves"""
+        result = PlacementResult()
+        result.placements = {
+            EntityType.VINLET: [GridCell(1, 1), GridCell(2, 1), GridCell(3, 1), GridCell(4, 1)],
+            EntityType.VOUTLET: [GridCell(9, 8)]
+        }
+        self.optimizer.optimize_placements(result, max_iterations=1)
+        
+        with mock.patch.object(self.optimizer, '_closest_pair_within',
+                               wraps=self.optimizer._closest_pair_within) as scan:
+            first = self.optimizer._violating_pair(EntityType.VINLET, EntityType.VINLET)
+            self.assertEqual(self.optimizer._violating_pair(EntityType.VINLET, EntityType.VINLET), first)
+            self.assertEqual(scan.call_count, 1)
+            
+            self.assertTrue(self.optimizer._try_move_point_for_better_separation(result, EntityType.VINLET, 0))
+            self.optimizer._violating_pair(EntityType.VINLET, EntityType.VINLET)
+            self.assertEqual(scan.call_count, 2)
+    
+    def test_coordinates_track_moves(self):
+        """Test cached coordinates follow placements through optimization"""
+        result = PlacementResult()
+        result.placements = {
+            EntityType.VINLET: [GridCell(1, 1), GridCell(2, 1), GridCell(1, 5), GridCell(2, 6)],
+            EntityType.VOUTLET: [GridCell(3, 1), GridCell(3, 5), GridCell(3, 8)]
+        }
+        self.optimizer.optimize_placements(result, max_iterations=20)
+        
+        for entity_type, placements in result.placements.items():
+            self.assertEqual(self.optimizer._coords[entity_type].tolist(),
+                             self.optimizer._normalized_coords(placements).tolist())
+
+
+class TestConfigLoader(unittest.TestCase):
+    """Test engine construction from configuration"""
+    
+    def test_engine_from_dict_matches_config_file(self):
+        """Test in-memory config builds the same engine as the YAML file"""
+        from src.config_loader import (
+            load_config, create_placement_engine_from_config, create_placement_engine_from_dict
+        )
+        
+        config_path = Path(__file__).parent.parent / "config.yaml"
+        
+        # Engines seed the global RNG on construction, so place right after each
+        from_file = create_placement_engine_from_config(str(config_path))
+        file_placements = from_file.place_all_entities().placements
+        from_dict = create_placement_engine_from_dict(load_config(str(config_path)))
+        dict_placements = from_dict.place_all_entities().placements
+        
+        self.assertEqual(from_dict.random_seed, from_file.random_seed)
+        self.assertEqual(dict_placements, file_placements)
+
+    
+    def test_load_config_returns_independent_copies(self):
+        """Test cached config loads are isolated and track file edits"""
+        import os
+        import tempfile
+        from src.config_loader import load_config
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "config.yaml")
+            with open(path, 'w') as f:
+                f.write("grid:\n  width: 10\n")
+            
+            first = load_config(path)
+            first['grid']['width'] = 99
+            self.assertEqual(load_config(path)['grid']['width'], 10)
+            
+            with open(path, 'w') as f:
+                f.write("grid:\n  width: 12\n")
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+            self.assertEqual(load_config(path)['grid']['width'], 12)
+    
+    def test_helpers_accept_loaded_config(self):
+        """Test summary and section helpers take a dict as well as a path"""
+        import contextlib
+        import io
+        from src.config_loader import load_config, print_config_summary, get_visualization_config
+        
+        config_path = str(Path(__file__).parent.parent / "config.yaml")
+        config = load_config(config_path)
+        
+        self.assertEqual(get_visualization_config(config), get_visualization_config(config_path))
+        get_visualization_config(config)['modified'] = True
+        self.assertNotIn('modified', config.get('visualization', {}))
+        
+        outputs = []
+        for source in (config, config_path):
+            buffer = io.StringIO()
+            with contextlib.redirect_stdout(buffer):
+                print_config_summary(source)
+            outputs.append(buffer.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+    
+    def test_validator_flags_count_exceeding_region(self):
+        """Test the feasibility check sizes allowed regions without failing"""
+        from src.validate_config import ConfigValidator
+        
+        validator = ConfigValidator()
+        validator._validate_feasibility({
+            "grid": {"width": 4, "height": 3},
+            "entities": {
+                "vinlet": {"count": 5, "allowed_region": {"exclude_y_range": [1, 2]}},
+                "voutlet": {"count": 12}
+            }
+        })
+        
+        self.assertEqual(validator.errors,
+                         ["vinlet: count (5) exceeds allowed region size (4)"])
+        self.assertEqual(validator.warnings, [])
+    
+    def test_parse_allowed_region_filters(self):
+        """Test region exclusions and rectangles against a direct cell filter"""
+        from src.config_loader import parse_allowed_region
+        
+        grid = GridRegion(6, 5)
+        all_cells = grid.all_cells()
+        cases = [
+            ({"exclude_y_range": [2, 3]}, lambda c: not (2 <= c.y <= 3)),
+            ({"exclude_y_list": [1, 5]}, lambda c: c.y not in (1, 5)),
+            ({"exclude_x_range": [4, 9]}, lambda c: not (4 <= c.x <= 9)),
+            ({"exclude_x_list": [2]}, lambda c: c.x != 2),
+            ({"x_min": 2, "x_max": 3, "y_min": 4, "y_max": 5},
+             lambda c: 2 <= c.x <= 3 and 4 <= c.y <= 5),
+            ({}, lambda c: True),
+        ]
+        for region_config, keep in cases:
+            with self.subTest(region_config=region_config):
+                self.assertEqual(parse_allowed_region(region_config, grid),
+                                 {cell for cell in all_cells if keep(cell)})
+    
+    def test_parse_allowed_region_cell_lists(self):
+        """Test explicit cell lists as dicts, pairs or a mix"""
+        from src.config_loader import parse_allowed_region
+        
+        grid = GridRegion(6, 5)
+        expected = {GridCell(1, 2), GridCell(3, 4)}
+        cases = [
+            [{"x": 1, "y": 2}, {"x": 3, "y": 4}],
+            [[1, 2], (3, 4)],
+            [{"x": 1, "y": 2}, [3, 4], [5, 5, 5], "ignored"],
+        ]
+        for cells in cases:
+            with self.subTest(cells=cells):
+                self.assertEqual(parse_allowed_region({"cells": cells}, grid), expected)
+        self.assertEqual(parse_allowed_region({"cells": []}, grid), set())
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
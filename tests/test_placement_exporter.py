@@ -0,0 +1,88 @@
+"""
+Tests for placement CSV export
+"""
+
+import unittest
+import csv
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.stratified_placement import GridCell, GridRegion, EntityType, PlacementResult
+from src.placement_exporter import PlacementExporter
+
+
+class TestPlacementExporter(unittest.TestCase):
+    """Test simulation config construction and CSV output"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.grid_region = GridRegion(10, 8)
+        self.result = PlacementResult()
+        self.result.placements = {
+            EntityType.VINLET: [GridCell(1, 2), GridCell(5, 7)],
+            EntityType.ACOUTLET: [GridCell(10, 8)]
+        }
+        self.exporter = PlacementExporter()
+
+    def test_simulation_config_names(self):
+        """Test entity naming and metadata"""
+        config = self.exporter.create_simulation_config(self.result, self.grid_region)
+
+        self.assertEqual([e.name for e in config.entities],
+                         ['vinlet_x1_y2', 'vinlet_x5_y7', 'acoutlet_x10_y8'])
+        self.assertEqual(config.metadata['grid_size'], '10x8')
+        self.assertEqual(config.metadata['total_entities'], 3)
+
+    def test_export_csv_rows(self):
+        """Test CSV header and one row per entity"""
+        config = self.exporter.create_simulation_config(self.result, self.grid_region)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.exporter.export_csv(config, str(Path(tmp) / "out" / "placement.csv"))
+            with open(path, newline='') as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(rows[0], ['name', 'type', 'x', 'y'])
+        self.assertEqual(rows[1:], [
+            ['vinlet_x1_y2', 'vinlet', '1', '2'],
+            ['vinlet_x5_y7', 'vinlet', '5', '7'],
+            ['acoutlet_x10_y8', 'acoutlet', '10', '8']
+        ])
+
+    def test_export_result_matches_config_export(self):
+        """Test streaming export writes the same file as the config path"""
+        config = self.exporter.create_simulation_config(self.result, self.grid_region)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            via_config = self.exporter.export_csv(config, str(Path(tmp) / "config.csv"))
+            direct = self.exporter.export_result_to_csv(self.result, str(Path(tmp) / "direct.csv"))
+            self.assertEqual(Path(direct).read_bytes(), Path(via_config).read_bytes())
+
+    def test_export_metadata_round_trip(self):
+        """Test metadata sidecar holds the configuration metadata"""
+        import json
+        config = self.exporter.create_simulation_config(self.result, self.grid_region)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = self.exporter.export_metadata(config, str(Path(tmp) / "placement.meta.json"))
+            self.assertEqual(json.loads(Path(path).read_text()), config.metadata)
+
+    def test_export_recreates_removed_directory(self):
+        """Test exports still succeed after a cached output directory is removed"""
+        import shutil
+
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp) / "sweep"
+            self.exporter.export_result_to_csv(self.result, str(out_dir / "a.csv"))
+            shutil.rmtree(out_dir)
+
+            path = self.exporter.export_result_to_csv(self.result, str(out_dir / "b.csv"))
+            self.assertTrue(Path(path).exists())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Tests for placement quality metrics
+"""
+
+import unittest
+import statistics
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.stratified_placement import (
+    GridCell, GridRegion, Entity, EntityType, Stratification,
+    PlacementResult, euclidean_distance
+)
+from src.placement_metrics import PlacementMetrics, _placement_arrays, _summarize_pair_distances
+
+
+class TestSeparationMetrics(unittest.TestCase):
+    """Test separation analysis"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.grid_region = GridRegion(10, 8)
+        self.stratification = Stratification.create_horizontal_bands(self.grid_region, 4)
+        all_cells = self.grid_region.all_cells()
+
+        self.entities = [
+            Entity(EntityType.VINLET, 3, all_cells, intra_radius=2.0),
+            Entity(EntityType.VOUTLET, 2, all_cells, intra_radius=2.0)
+        ]
+        self.metrics = PlacementMetrics(
+            self.grid_region, self.stratification, self.entities, cross_entity_radius=1.5
+        )
+
+        self.result = PlacementResult()
+        self.result.placements = {
+            EntityType.VINLET: [GridCell(1, 1), GridCell(2, 2), GridCell(6, 5)],
+            EntityType.VOUTLET: [GridCell(2, 1), GridCell(9, 8)]
+        }
+
+    def test_intra_separation_matches_pairwise(self):
+        """Test intra-entity summary against a direct pairwise scan"""
+        cells = self.result.placements[EntityType.VINLET]
+        distances = [
+            euclidean_distance(p1, p2)
+            for i, p1 in enumerate(cells) for p2 in cells[i+1:]
+        ]
+
+        separation = self.metrics._analyze_separation_metrics(self.result)
+        intra = separation['vinlet_intra']
+
+        self.assertAlmostEqual(intra['min_distance'], min(distances))
+        self.assertAlmostEqual(intra['mean_distance'], sum(distances) / len(distances))
+        self.assertEqual(intra['total_pairs'], 3)
+        self.assertEqual(intra['violations'], sum(d < 2.0 for d in distances))
+
+    def test_cross_separation_matches_pairwise(self):
+        """Test cross-entity summary against a direct pairwise scan"""
+        distances = [
+            euclidean_distance(p1, p2)
+            for p1 in self.result.placements[EntityType.VINLET]
+            for p2 in self.result.placements[EntityType.VOUTLET]
+        ]
+
+        separation = self.metrics._analyze_separation_metrics(self.result)
+        cross = separation['vinlet_voutlet_cross']
+
+        self.assertAlmostEqual(cross['min_distance'], 1.0)
+        self.assertEqual(cross['total_pairs'], 6)
+        self.assertEqual(cross['violations'], sum(d < 1.5 for d in distances))
+
+    def test_distances_only_kept_on_request(self):
+        """Test per-pair distances are stored only with include_distances"""
+        separation = self.metrics._analyze_separation_metrics(self.result)
+        self.assertNotIn('distances', separation['vinlet_intra'])
+
+        debug_metrics = PlacementMetrics(
+            self.grid_region, self.stratification, self.entities,
+            cross_entity_radius=1.5, include_distances=True
+        )
+        cross = debug_metrics._analyze_separation_metrics(self.result)['vinlet_voutlet_cross']
+        self.assertEqual(len(cross['distances']), cross['total_pairs'])
+        self.assertAlmostEqual(min(cross['distances']), cross['min_distance'])
+
+    def test_compiled_and_numpy_summaries_agree(self):
+        """Test the numba and NumPy separation reductions give the same summary"""
+        xy = _placement_arrays(self.result)
+        points = xy[EntityType.VINLET].astype(np.float64)
+        others = xy[EntityType.VOUTLET].astype(np.float64)
+
+        for args in ((points, points, 2.0, True), (points, others, 1.5, False)):
+            compiled = _summarize_pair_distances(*args)
+            reference = _summarize_pair_distances(*args, include_distances=True)
+            reference.pop('distances')
+            self.assertEqual(compiled.keys(), reference.keys())
+            for key in compiled:
+                self.assertAlmostEqual(compiled[key], reference[key])
+
+    def test_single_placement_has_no_pairs(self):
+        """Test entity with one placement reports no pairs"""
+        self.result.placements[EntityType.VOUTLET] = [GridCell(2, 1)]
+
+        separation = self.metrics._analyze_separation_metrics(self.result)
+        intra = separation['voutlet_intra']
+
+        self.assertEqual(intra['min_distance'], float('inf'))
+        self.assertEqual(intra['total_pairs'], 0)
+        self.assertEqual(intra['violations'], 0)
+
+
+class TestBandMetrics(unittest.TestCase):
+    """Test band-based quota and coverage analysis"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.grid_region = GridRegion(10, 8)
+        self.stratification = Stratification.create_horizontal_bands(self.grid_region, 4)
+        self.entities = [
+            Entity(EntityType.VINLET, 4, self.grid_region.all_cells(), intra_radius=1.0)
+        ]
+        self.metrics = PlacementMetrics(self.grid_region, self.stratification, self.entities)
+
+        self.result = PlacementResult()
+        self.result.placements = {
+            EntityType.VINLET: [GridCell(1, 8), GridCell(3, 1), GridCell(5, 7), GridCell(2, 2)]
+        }
+
+    def test_band_lookup_matches_contains_cell(self):
+        """Test row lookup agrees with Band.contains_cell"""
+        cells = [GridCell(1, y) for y in range(1, self.grid_region.height + 1)]
+        expected = [
+            next(band.index for band in self.stratification.bands if band.contains_cell(cell))
+            for cell in cells
+        ]
+        ys = np.array([cell.y for cell in cells])
+        self.assertEqual(self.metrics._band_indices(ys).tolist(), expected)
+
+    def test_quota_counts_per_band(self):
+        """Test actual per-band counts"""
+        quota = self.metrics._analyze_quota_satisfaction(self.result)['vinlet']
+        self.assertEqual(quota['actual_per_band'], {3: 2, 0: 2, 1: 0, 2: 0})
+        self.assertEqual(quota['total_deviation'], 4)
+
+    def test_band_coverage(self):
+        """Test per-entity and union band coverage"""
+        coverage = self.metrics._analyze_coverage_metrics(self.result)
+        self.assertEqual(coverage['vinlet']['bands_occupied'], [0, 3])
+        self.assertEqual(coverage['union']['band_coverage_rate'], 0.5)
+
+    def test_row_histograms(self):
+        """Test per-row counts and uniformity statistics"""
+        histograms = self.metrics._generate_distribution_histograms(self.result)
+        union = histograms['union_y']
+
+        self.assertEqual(union['histogram'], {1: 1, 2: 1, 3: 0, 4: 0, 5: 0, 6: 0, 7: 1, 8: 1})
+        self.assertAlmostEqual(union['mean_count'], 0.5)
+        self.assertAlmostEqual(union['std_dev'], statistics.stdev(union['histogram'].values()))
+        self.assertEqual(union['uniformity_score'], 0)
+
+    def test_row_histograms_with_off_grid_rows(self):
+        """Test explicit allowed cells outside the grid keep their rows at zero count"""
+        grid_region = GridRegion(6, 4)
+        stratification = Stratification.create_horizontal_bands(grid_region, 2)
+        allowed = {GridCell(1, 1), GridCell(3, 2), GridCell(5, 9)}
+        metrics = PlacementMetrics(grid_region, stratification, [Entity(EntityType.VINLET, 2, allowed)])
+        result = PlacementResult()
+        result.placements = {EntityType.VINLET: [GridCell(1, 1), GridCell(3, 2)]}
+
+        histograms = metrics._generate_distribution_histograms(result)
+        self.assertEqual(histograms['vinlet_y']['histogram'], {1: 1, 2: 1, 9: 0})
+        self.assertEqual(histograms['union_y']['histogram'], {1: 1, 2: 1, 3: 0, 4: 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for the placement result cache
+"""
+
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.result_cache import load_or_compute, cache_key
+
+
+class TestResultCache(unittest.TestCase):
+    """Test on-disk result caching"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.temp_dir.name)
+        self.calls = 0
+
+    def tearDown(self):
+        """Clean up temporary directory"""
+        self.temp_dir.cleanup()
+
+    def _compute(self):
+        self.calls += 1
+        return {'placed': self.calls}, {'overall_quality_score': 0.5}
+
+    def test_hit_skips_compute(self):
+        """Test second lookup for the same config and seed is served from cache"""
+        first = load_or_compute(b"grid: {}", 42, self._compute, cache_dir=self.cache_dir)
+        second = load_or_compute(b"grid: {}", 42, self._compute, cache_dir=self.cache_dir)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(first, second)
+
+    def test_seed_and_config_change_key(self):
+        """Test different seeds or configs do not share entries"""
+        self.assertNotEqual(cache_key(b"a", 1), cache_key(b"a", 2))
+        self.assertNotEqual(cache_key(b"a", 1), cache_key(b"b", 1))
+
+        load_or_compute(b"a", 1, self._compute, cache_dir=self.cache_dir)
+        load_or_compute(b"a", 2, self._compute, cache_dir=self.cache_dir)
+        self.assertEqual(self.calls, 2)
+
+    def test_corrupt_entry_is_recomputed(self):
+        """Test unreadable cache files are treated as misses"""
+        (self.cache_dir / f"{cache_key(b'a', 1)}.pkl").write_bytes(b"not a pickle")
+
+        result, _ = load_or_compute(b"a", 1, self._compute, cache_dir=self.cache_dir)
+        self.assertEqual(result, {'placed': 1})
+
+    def test_eviction_limits_entries(self):
+        """Test cache keeps at most max_entries files"""
+        for seed in range(5):
+            load_or_compute(b"a", seed, self._compute, cache_dir=self.cache_dir, max_entries=3)
+
+        self.assertEqual(len(list(self.cache_dir.glob("*.pkl"))), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
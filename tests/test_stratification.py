@@ -6,12 +6,14 @@ import unittest
 import sys
 from pathlib import Path
 
+import numpy as np
+
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.stratified_placement import (
     GridCell, GridRegion, Entity, EntityType, Stratification,
-    NormalizedPoint, Band
+    NormalizedPoint, Band, AllowedRegion
 )
 
 
@@ -163,6 +165,48 @@ class TestStratification(unittest.TestCase):
         # First 3 bands should get 2, last band should get 1 (or similar distribution)
         quota_values = list(quotas.values())
         self.assertTrue(all(1 <= q <= 2 for q in quota_values))
+    
+    def test_calculate_quotas_follow_band_cell_counts(self):
+        """Test quotas are proportional to the region's cells in each band"""
+        # 10 cells in band 0, 2 in band 1, none in bands 2 and 3
+        allowed_region = {GridCell(x, y) for x in range(1, 6) for y in (1, 2)} | {GridCell(1, 3), GridCell(2, 4)}
+        entity = Entity(EntityType.VINLET, 6, allowed_region)
+        
+        self.assertEqual(self.stratification.calculate_quotas(entity), {0: 5, 1: 1, 2: 0, 3: 0})
+        
+        mask = np.zeros((8, 10), dtype=bool)
+        for cell in allowed_region:
+            mask[cell.y - 1, cell.x - 1] = True
+        mask_entity = Entity(EntityType.VINLET, 6, AllowedRegion(mask))
+        self.assertEqual(self.stratification.calculate_quotas(mask_entity), {0: 5, 1: 1, 2: 0, 3: 0})
+
+
+class TestAllowedRegion(unittest.TestCase):
+    """Test mask-backed allowed regions"""
+    
+    def setUp(self):
+        self.grid_region = GridRegion(5, 4)
+        mask = np.zeros((4, 5), dtype=bool)
+        mask[1:3, 1:4] = True  # x in 2..4, y in 2..3
+        self.region = AllowedRegion(mask)
+        self.expected = {GridCell(x, y) for x in range(2, 5) for y in range(2, 4)}
+    
+    def test_behaves_like_cell_set(self):
+        """Test membership, size, iteration and set comparison"""
+        self.assertEqual(len(self.region), 6)
+        self.assertEqual(set(self.region), self.expected)
+        self.assertEqual(self.region, self.expected)
+        self.assertIn(GridCell(2, 2), self.region)
+        self.assertNotIn(GridCell(1, 2), self.region)
+        self.assertNotIn(GridCell(9, 9), self.region)
+        self.assertNotIn((2, 2), self.region)
+        self.assertEqual(self.region & {GridCell(2, 2), GridCell(1, 1)}, {GridCell(2, 2)})
+    
+    def test_band_cells_match_set_region(self):
+        """Test band filtering of a mask region against a plain set"""
+        for band in Stratification.create_horizontal_bands(self.grid_region, 3).bands:
+            self.assertEqual(band.get_cells_in_region(self.region),
+                             band.get_cells_in_region(self.expected))
 
 
 class TestEntity(unittest.TestCase):